@@ -2,12 +2,17 @@
 에이전트 체인: A2A 방식으로 여러 에이전트를 연결
 """
 
-from typing import Dict, Any, List, Optional
+import os
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
+from agents.base import BaseAgent, run_async
 from agents.search_agent import SearchAgent
 from agents.validation_agent import SearchValidationAgent, ContentValidationAgent
 from agents.fact_check_agent import FactCheckAgent, ContentRevisionAgent
 from agents.content_agent import ContentGenerationAgent
 from agents.posting_agent import PostingAgent
+from src.services.page_fetcher import page_enrichment_enabled, enrich_search_results
 
 
 class AgentChain:
@@ -25,8 +30,47 @@ class AgentChain:
         
         # 실행 로그
         self.execution_log: List[Dict[str, Any]] = []
+        
+        # LLM 사용량 집계 (BaseAgent 호출 기록 중 이 체인의 에이전트 호출만 사용)
+        self._agent_ids = {
+            id(agent) for agent in (
+                self.search_agent, self.search_validation_agent, self.fact_check_agent,
+                self.content_agent, self.content_validation_agent, self.content_revision_agent,
+                self.posting_agent
+            )
+        }
+        self._usage_cursor = 0
+        self._pending_calls: List[Dict[str, Any]] = []
+        self._run_calls: List[Dict[str, Any]] = []
+        self._run_steps: List[Dict[str, Any]] = []
     
     def process(self, keyword: str, notion_page_id: Optional[str] = None, language: str = 'korean', skip_posting: bool = False) -> Dict[str, Any]:
+        """
+        전체 프로세스 실행 (_process 참고)
+        
+        결과에 LLM 호출 사용량(llm_usage: 전체/에이전트별/단계별 토큰·소요 시간)을 추가하고
+        실행별 합계를 DB(llm_run_stats)에 저장합니다.
+        """
+        self._usage_cursor = BaseAgent.get_llm_call_count()
+        self._pending_calls = []
+        self._run_calls = []
+        self._run_steps = []
+        
+        result = self._process(keyword, notion_page_id, language, skip_posting)
+        
+        usage = self._build_usage()
+        result["llm_usage"] = usage
+        self._print_usage(usage)
+        
+        try:
+            from src.core.database import Database
+            Database().save_llm_run_stats(keyword, language, result.get("status", "unknown"), usage)
+        except Exception as e:
+            print(f"  ⚠️  LLM 사용량 저장 실패: {e}")
+        
+        return result
+    
+    def _process(self, keyword: str, notion_page_id: Optional[str] = None, language: str = 'korean', skip_posting: bool = False) -> Dict[str, Any]:
         """
         전체 프로세스 실행:
         1. 검색 에이전트 → 검색 결과
@@ -39,10 +83,17 @@ class AgentChain:
         print("=" * 60)
         
         try:
+            # 전날 미리 가져온 검색/검색 검증 결과가 있으면 그대로 사용
+            prefetched = self._load_prefetch(keyword)
+            
             # 1단계: 검색
             print("\n[1단계] 검색")
-            search_result = self.search_agent.process({"keyword": keyword})
-            self.execution_log.append({"step": "search", "result": search_result})
+            if prefetched:
+                search_result = prefetched["search_result"]
+                print(f"  ⚡ 미리 가져온 검색 결과 사용 ({search_result.get('count', len(search_result.get('results', [])))}개, {prefetched['created_at']} 저장)")
+            else:
+                search_result = self.search_agent.process({"keyword": keyword})
+            self._log_step({"step": "search", "result": search_result, "prefetched": bool(prefetched)})
             
             if search_result["status"] != "success":
                 return {
@@ -52,10 +103,15 @@ class AgentChain:
                     "log": self.execution_log
                 }
             
-            # 2단계: 검색 결과 검증
-            print("\n[2단계] 검색 결과 검증")
-            validation_result = self.search_validation_agent.process(search_result)
-            self.execution_log.append({"step": "search_validation", "result": validation_result})
+            # 2단계 + 2-1단계: 검색 결과 검증과 사실 확인 (같은 검색 결과를 사용하므로 기본은 동시 실행)
+            print(f"\n[2단계] 검색 결과 검증 + [2-1단계] 사실 확인 ({'동시 실행' if self._fact_check_parallel() else '검증 통과 시'})")
+            if prefetched and prefetched["validation_result"] and prefetched["fact_check_result"]:
+                validation_result = prefetched["validation_result"]
+                fact_check_result = prefetched["fact_check_result"]
+                print("  ⚡ 미리 실행한 검증/사실 확인 결과 사용")
+            else:
+                validation_result, fact_check_result = run_async(self._validate_and_fact_check(search_result))
+            self._log_step({"step": "search_validation", "result": validation_result}, agent=self.search_validation_agent)
             
             if not validation_result.get("is_valid", False):
                 return {
@@ -65,10 +121,7 @@ class AgentChain:
                     "log": self.execution_log
                 }
             
-            # 2-1단계: 사실 확인 (검색 결과의 정확성 검증)
-            print("\n[2-1단계] 사실 확인")
-            fact_check_result = self.fact_check_agent.process(search_result)
-            self.execution_log.append({"step": "fact_check", "result": fact_check_result})
+            self._log_step({"step": "fact_check", "result": fact_check_result}, agent=self.fact_check_agent)
             
             # 사실 확인 결과에 따라 필터링된 결과 사용
             validated_results = fact_check_result.get("filtered_results", validation_result["validated_results"])
@@ -82,6 +135,10 @@ class AgentChain:
                     "log": self.execution_log
                 }
             
+            # 상위 결과 원문 발췌 보강 (PAGE_ENRICH_ENABLED=true일 때)
+            if page_enrichment_enabled():
+                validated_results = self._enrich_results(keyword, validated_results)
+            
             # 3단계: 콘텐츠 생성
             print("\n[3단계] 콘텐츠 생성")
             content_input = {
@@ -91,7 +148,7 @@ class AgentChain:
                 "learning_story": True  # 학습 스토리 형식 활성화
             }
             content_result = self.content_agent.process(content_input)
-            self.execution_log.append({"step": "content_generation", "result": content_result})
+            self._log_step({"step": "content_generation", "result": content_result})
             
             if content_result["status"] != "success":
                 return {
@@ -110,7 +167,7 @@ class AgentChain:
                 "language": language  # 언어 설정 전달
             }
             content_validation_result = self.content_validation_agent.process(content_validation_input)
-            self.execution_log.append({"step": "content_validation", "result": content_validation_result})
+            self._log_step({"step": "content_validation", "result": content_validation_result})
             
             # 검증 결과 및 사실 확인 이슈를 수정 에이전트에 전달
             content_to_revise = content_result["content"]
@@ -144,7 +201,7 @@ class AgentChain:
                     "language": language  # 언어 정보 전달
                 }
                 revision_result = self.content_revision_agent.process(revision_input)
-                self.execution_log.append({"step": "content_revision", "attempt": revision_attempt, "result": revision_result})
+                self._log_step({"step": "content_revision", "attempt": revision_attempt, "result": revision_result})
                 
                 if revision_result.get("status") == "revised":
                     content_to_revise = revision_result["revised_content"]
@@ -180,7 +237,7 @@ class AgentChain:
                         "language": language
                     }
                     revalidation_result = self.content_validation_agent.process(revalidation_input)
-                    self.execution_log.append({"step": "content_revalidation", "attempt": revision_attempt, "result": revalidation_result})
+                    self._log_step({"step": "content_revalidation", "attempt": revision_attempt, "result": revalidation_result})
                     
                     # 재검증 결과 확인
                     if revalidation_result.get("is_valid", False):
@@ -245,11 +302,14 @@ class AgentChain:
             else:
                 print("\n[5단계] 포스팅 스킵됨 (auto_poster.py에서 처리)")
             
-            self.execution_log.append({"step": "posting", "result": posting_result})
+            self._log_step({"step": "posting", "result": posting_result})
             
             print("\n" + "=" * 60)
             print("✅ A2A 에이전트 체인 완료!")
             
+            cache_stats = BaseAgent.get_cache_stats()
+            self._print_cache_stats(cache_stats)
+            
             return {
                 "status": "success",
                 "generated_content": content_result,
@@ -261,15 +321,185 @@ class AgentChain:
                 },
                 "revisions": content_result.get("revisions", []),
                 "fact_check_issues": fact_check_issues,
+                "llm_cache_stats": cache_stats,
                 "log": self.execution_log
             }
             
         except Exception as e:
             print(f"\n❌ 에러 발생: {e}")
-            self.execution_log.append({"step": "error", "error": str(e)})
+            self._log_step({"step": "error", "error": str(e)})
             return {
                 "status": "error",
                 "message": str(e),
                 "log": self.execution_log
             }
-
+    
+    def _load_prefetch(self, keyword: str) -> Optional[Dict[str, Any]]:
+        """prefetch_search로 저장해 둔 결과 (SEARCH_PREFETCH_ENABLED=false이면 사용 안 함)"""
+        if os.getenv("SEARCH_PREFETCH_ENABLED", "true").lower() != "true":
+            return None
+        try:
+            from src.core.database import Database
+            return Database().get_search_prefetch(keyword)
+        except Exception as e:
+            print(f"  ⚠️  미리 가져온 검색 결과 조회 실패: {e}")
+            return None
+    
+    def prefetch_search(self, keyword: str, validate: Optional[bool] = None) -> bool:
+        """
+        다음 키워드의 검색(+ 검색 검증/사실 확인)을 미리 실행해 DB에 저장
+        
+        다음 실행의 process()는 1~2단계를 건너뛰고 바로 콘텐츠 생성부터 시작합니다.
+        검증에 실패한 결과는 저장하지 않아 다음 실행에서 새로 검색합니다.
+        
+        환경 변수:
+        - SEARCH_PREFETCH_VALIDATE: 검색 검증/사실 확인까지 미리 실행 (기본값 true)
+        - SEARCH_PREFETCH_TTL_SECONDS: 저장 유효 시간 (기본값 345600초 = 4일, 주말 포함)
+        
+        Returns:
+            저장 여부
+        """
+        if validate is None:
+            validate = os.getenv("SEARCH_PREFETCH_VALIDATE", "true").lower() == "true"
+        ttl_seconds = float(os.getenv("SEARCH_PREFETCH_TTL_SECONDS", "345600"))
+        
+        print(f"\n🔮 다음 키워드 미리 검색: '{keyword}'")
+        search_result = self.search_agent.process({"keyword": keyword})
+        if search_result["status"] != "success":
+            print(f"  ⚠️  미리 검색 실패: {search_result.get('message', '검색 결과 없음')}")
+            return False
+        
+        validation_result = fact_check_result = None
+        if validate:
+            # 미리 검색은 지연 시간이 중요하지 않으므로 검증을 통과한 결과만 사실 확인
+            validation_result, fact_check_result = run_async(self._validate_and_fact_check(search_result, parallel=False))
+            if not validation_result.get("is_valid", False):
+                print(f"  ⚠️  미리 검증 실패: {validation_result.get('reason', '검증 실패')} (저장하지 않음)")
+                return False
+        
+        from src.core.database import Database
+        Database().save_search_prefetch(keyword, search_result, validation_result, fact_check_result, ttl_seconds)
+        print(f"  ✅ 미리 검색 완료: 결과 {search_result.get('count', 0)}개{' (검증/사실 확인 포함)' if validate else ''}")
+        return True
+    
+    def _enrich_results(self, keyword: str, validated_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """상위 검색 결과의 원문을 가져와 키워드 관련 발췌 추가 (실패하면 스니펫만 사용)"""
+        print("\n[2.5단계] 원문 발췌 보강")
+        started_at = time.time()
+        try:
+            enriched = enrich_search_results(keyword, validated_results)
+        except Exception as e:
+            print(f"  ⚠️  원문 발췌 실패, 스니펫만 사용: {e}")
+            return validated_results
+        
+        passages = sum(len(r.get("passages", [])) for r in enriched)
+        pages = sum(1 for r in enriched if r.get("passages"))
+        print(f"  📄 원문 {pages}개에서 발췌 {passages}개 추가 ({time.time() - started_at:.1f}초)")
+        self._log_step({"step": "page_enrichment", "pages": pages, "passages": passages})
+        return enriched
+    
+    @staticmethod
+    def _fact_check_parallel() -> bool:
+        return os.getenv("FACT_CHECK_PARALLEL", "true").lower() == "true"
+    
+    async def _validate_and_fact_check(self, search_result: Dict[str, Any], parallel: Optional[bool] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        검색 결과 검증과 사실 확인
+        
+        FACT_CHECK_PARALLEL=true(기본값): 동시 실행. 지연 시간은 두 LLM 호출 중 긴 쪽만큼이지만,
+        검증에 실패해도 이미 시작한 사실 확인 호출의 토큰/요청 한도는 사용합니다
+        (시작 전이면 취소). false면 검증을 통과한 경우에만 사실 확인 (실패 시 호출 1회 절약, 성공 시 지연 시간 합산).
+        
+        검증에 실패하면 사실 확인 결과는 {"status": "skipped"}입니다.
+        """
+        if parallel is None:
+            parallel = self._fact_check_parallel()
+        skipped = {"status": "skipped", "reason": "검색 결과 검증 실패"}
+        
+        if not parallel:
+            validation_result = await self.search_validation_agent.aprocess(search_result)
+            if not validation_result.get("is_valid", False):
+                return validation_result, skipped
+            return validation_result, await self.fact_check_agent.aprocess(search_result)
+        
+        fact_check_task = asyncio.ensure_future(self.fact_check_agent.aprocess(search_result))
+        try:
+            validation_result = await self.search_validation_agent.aprocess(search_result)
+        except BaseException:
+            fact_check_task.cancel()
+            raise
+        if not validation_result.get("is_valid", False):
+            fact_check_task.cancel()
+            return validation_result, skipped
+        return validation_result, await fact_check_task
+    
+    def _print_cache_stats(self, cache_stats: Dict[str, Dict[str, Any]]):
+        """에이전트별 LLM 캐시 적중 현황 출력"""
+        if not any(stats["hits"] for stats in cache_stats.values()):
+            return
+        
+        print("💾 LLM 캐시 적중 현황:")
+        for agent_name, stats in cache_stats.items():
+            if stats["hits"]:
+                print(f"   - {agent_name}: 적중 {stats['hits']}회 / 미스 {stats['misses']}회, 절약 {stats['saved_seconds']:.1f}초")
+    
+    def _log_step(self, entry: Dict[str, Any], agent: Optional[BaseAgent] = None):
+        """
+        실행 로그 추가 + 해당 단계에서 발생한 LLM 호출 사용량 기록
+        
+        agent를 지정하면 그 에이전트의 호출만 이 단계로 집계합니다 (동시 실행 단계 구분용).
+        """
+        new_calls = BaseAgent.get_llm_call_log(self._usage_cursor)
+        if new_calls:
+            # 보관 한도를 넘어 버려진 기록이 있어도 커서가 어긋나지 않도록 순번 사용
+            self._usage_cursor = new_calls[-1]["seq"] + 1
+        self._pending_calls.extend(r for r in new_calls if r["agent_id"] in self._agent_ids)
+        
+        if agent is not None:
+            step_calls = [r for r in self._pending_calls if r["agent_id"] == id(agent)]
+            self._pending_calls = [r for r in self._pending_calls if r["agent_id"] != id(agent)]
+        else:
+            step_calls = self._pending_calls
+            self._pending_calls = []
+        
+        if step_calls:
+            summary = BaseAgent.summarize_llm_calls(step_calls)
+            entry["llm_usage"] = summary
+            step_name = entry["step"] if "attempt" not in entry else f"{entry['step']}#{entry['attempt']}"
+            self._run_steps.append({"step": step_name, **summary})
+            self._run_calls.extend(step_calls)
+        
+        self.execution_log.append(entry)
+    
+    def _build_usage(self) -> Dict[str, Any]:
+        """이번 실행의 LLM 사용량 (전체/에이전트별/단계별)"""
+        # 로그에 남기기 전에 끝난 호출(예: 에러 직전 호출)도 합계에 포함
+        new_calls = BaseAgent.get_llm_call_log(self._usage_cursor)
+        self._run_calls.extend(
+            r for r in new_calls + self._pending_calls
+            if r["agent_id"] in self._agent_ids
+        )
+        if new_calls:
+            self._usage_cursor = new_calls[-1]["seq"] + 1
+        self._pending_calls = []
+        
+        by_agent: Dict[str, List[Dict[str, Any]]] = {}
+        for record in self._run_calls:
+            by_agent.setdefault(record["agent"], []).append(record)
+        
+        return {
+            "total": BaseAgent.summarize_llm_calls(self._run_calls),
+            "by_agent": {name: BaseAgent.summarize_llm_calls(records) for name, records in by_agent.items()},
+            "by_step": list(self._run_steps),
+        }
+    
+    def _print_usage(self, usage: Dict[str, Any]):
+        """LLM 호출 사용량 출력 (소요 시간이 긴 단계부터)"""
+        total = usage["total"]
+        if not total["calls"]:
+            return
+        
+        print(f"📊 LLM 사용량: {total['calls']}회 호출, 토큰 {total['prompt_tokens']:,} + {total['completion_tokens']:,} = {total['total_tokens']:,}, "
+              f"소요 {total['wall_time']:.1f}초 (대기 {total['wait_seconds']:.1f}초, 재시도 {total['retries']}회)")
+        for step in sorted(usage["by_step"], key=lambda s: s["wall_time"], reverse=True):
+            print(f"   - {step['step']}: {step['calls']}회, 토큰 {step['total_tokens']:,}, {step['wall_time']:.1f}초")
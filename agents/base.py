@@ -4,14 +4,30 @@
 
 import os
 import json
-from typing import Dict, Any, List, Optional
+import time
+import asyncio
+import hashlib
+import functools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Callable
 from abc import ABC, abstractmethod
 
+import requests
+
 
 # 환경 변수 로드 (공통 모듈 사용)
 from src.core.config import load_env_file
 load_env_file()
 
+from src.services.groq_rate_limiter import (
+    GroqKeyScheduler,
+    GroqRateLimitError,
+    backoff_delay,
+    retry_delay_from_headers,
+)
+
 
 class BaseAgent(ABC):
     """기본 AI 에이전트 클래스"""
@@ -21,6 +37,39 @@ class BaseAgent(ABC):
     _current_key_index = 0
     _keys_initialized = False
     
+    # 모든 에이전트가 공유하는 HTTP 세션 (커넥션 풀 + Keep-Alive)
+    _http_session = None
+    _http_session_lock = threading.Lock()
+    
+    # GROQ_API_BASE_URL로 다른 서버(예: tools/groq_stub_server.py)를 사용할 수 있음
+    GROQ_API_BASE_URL = "https://api.groq.com"
+    GROQ_API_PATH = "/openai/v1/chat/completions"
+    
+    # 모든 LLM 호출 기록 (에이전트/단계별 토큰·시간 집계용, 모든 에이전트가 공유)
+    # 오래 실행되는 프로세스에서 계속 늘지 않도록 최근 LLM_CALL_LOG_MAX_RECORDS개(기본값 1000)만 보관하고,
+    # 버린 기록 수(_llm_call_log_dropped)를 더해 전체 호출 순번(커서)은 계속 증가하게 유지
+    _llm_call_log: deque = deque(maxlen=max(1, int(os.getenv("LLM_CALL_LOG_MAX_RECORDS", "1000"))))
+    _llm_call_log_dropped = 0
+    _llm_call_log_lock = threading.Lock()
+    
+    # 비동기 호출용 실행기 (모든 에이전트가 공유, 동시 호출 수 제한)
+    _async_executor = None
+    _async_executor_lock = threading.Lock()
+    
+    # 키별 Rate Limit 스케줄러 (모든 에이전트가 공유)
+    _key_scheduler = None
+    _key_scheduler_lock = threading.Lock()
+    
+    # 키별 서킷 브레이커 (모든 에이전트와 Groq 검색 폴백이 공유, 상태는 DB에 저장)
+    _circuit_breaker = None
+    _circuit_breaker_lock = threading.Lock()
+    
+    # LLM 응답 캐시 (하위 클래스에서 False로 설정하면 해당 에이전트는 캐시 미사용)
+    llm_cache_enabled = True
+    _cache_db = None
+    _cache_stats: Dict[str, Dict[str, Any]] = {}
+    _cache_lock = threading.Lock()
+    
     @classmethod
     def _initialize_api_keys(cls):
         """API 키 목록 초기화 (GROQ_API_KEY, GROQ_API_KEY_1, GROQ_API_KEY_2 지원)"""
@@ -65,6 +114,199 @@ class BaseAgent(ABC):
         cls._current_key_index = (cls._current_key_index + 1) % len(cls._api_keys)
         return key
     
+    @classmethod
+    def _get_http_session(cls):
+        """
+        공유 HTTP 세션 가져오기 (최초 호출 시 생성)
+        
+        BaseAgent에 저장하므로 모든 하위 클래스와 Groq 검색 폴백이 같은 커넥션 풀을 사용합니다.
+        풀 크기/Keep-Alive는 GROQ_HTTP_POOL_CONNECTIONS, GROQ_HTTP_POOL_MAXSIZE,
+        GROQ_HTTP_KEEP_ALIVE, GROQ_HTTP_POOL_BLOCK 환경 변수로 설정합니다.
+        """
+        if BaseAgent._http_session is None:
+            with BaseAgent._http_session_lock:
+                if BaseAgent._http_session is None:
+                    from src.services.http_client import create_session_from_env
+                    BaseAgent._http_session = create_session_from_env("GROQ_HTTP")
+        return BaseAgent._http_session
+    
+    @classmethod
+    def _get_async_executor(cls) -> ThreadPoolExecutor:
+        """
+        비동기 호출용 실행기 가져오기 (최초 호출 시 생성)
+        
+        GROQ_ASYNC_MAX_WORKERS(기본값 8)로 동시에 진행되는 LLM 호출 수를 제한합니다.
+        """
+        if BaseAgent._async_executor is None:
+            with BaseAgent._async_executor_lock:
+                if BaseAgent._async_executor is None:
+                    max_workers = max(1, int(os.getenv("GROQ_ASYNC_MAX_WORKERS", "8")))
+                    BaseAgent._async_executor = ThreadPoolExecutor(
+                        max_workers=max_workers,
+                        thread_name_prefix="agent-llm"
+                    )
+        return BaseAgent._async_executor
+    
+    @classmethod
+    def _get_cache_db(cls):
+        """LLM 응답 캐시용 데이터베이스 가져오기 (최초 호출 시 생성)"""
+        if BaseAgent._cache_db is None:
+            with BaseAgent._cache_lock:
+                if BaseAgent._cache_db is None:
+                    from src.core.database import Database
+                    BaseAgent._cache_db = Database()
+        return BaseAgent._cache_db
+    
+    @staticmethod
+    def _make_cache_key(model: str, messages: List[Dict[str, str]], temperature: float, response_format: Optional[Dict]) -> str:
+        """캐시 키 생성 (모델, 메시지, temperature, response_format의 해시)"""
+        key_source = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "response_format": response_format,
+            },
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def _record_cache_event(cls, agent_name: str, hit: bool, saved_seconds: float = 0.0):
+        """에이전트별 캐시 적중/미스 기록"""
+        with BaseAgent._cache_lock:
+            stats = BaseAgent._cache_stats.setdefault(agent_name, {"hits": 0, "misses": 0, "saved_seconds": 0.0})
+            if hit:
+                stats["hits"] += 1
+                stats["saved_seconds"] += saved_seconds
+            else:
+                stats["misses"] += 1
+    
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Dict[str, Any]]:
+        """에이전트별 LLM 캐시 통계 (적중 수, 미스 수, 절약된 시간)"""
+        with BaseAgent._cache_lock:
+            return {name: dict(stats) for name, stats in BaseAgent._cache_stats.items()}
+    
+    @staticmethod
+    def _key_name(key_index: int) -> str:
+        """키 인덱스에 해당하는 환경 변수 이름"""
+        key_names = ["GROQ_API_KEY", "GROQ_API_KEY_1", "GROQ_API_KEY_2"]
+        return key_names[key_index] if key_index < len(key_names) else f"API_KEY_{key_index + 1}"
+    
+    @classmethod
+    def _get_key_scheduler(cls):
+        """키별 Rate Limit 스케줄러 가져오기 (모든 에이전트가 공유)"""
+        cls._initialize_api_keys()
+        
+        if BaseAgent._key_scheduler is None:
+            with BaseAgent._key_scheduler_lock:
+                if BaseAgent._key_scheduler is None:
+                    BaseAgent._key_scheduler = GroqKeyScheduler(
+                        [cls._key_name(i) for i in range(len(cls._api_keys))]
+                    )
+        return BaseAgent._key_scheduler
+    
+    @classmethod
+    def _get_circuit_breaker(cls):
+        """키별 서킷 브레이커 가져오기 (최초 호출 시 DB에 저장된 키 상태를 불러옴)"""
+        cls._initialize_api_keys()
+        
+        if BaseAgent._circuit_breaker is None:
+            with BaseAgent._circuit_breaker_lock:
+                if BaseAgent._circuit_breaker is None:
+                    from src.services.groq_circuit_breaker import GroqCircuitBreaker
+                    try:
+                        db = cls._get_cache_db()
+                    except Exception as e:
+                        print(f"  ⚠️  API 키 상태 DB 사용 불가 (메모리에서만 추적): {e}")
+                        db = None
+                    BaseAgent._circuit_breaker = GroqCircuitBreaker(
+                        cls._api_keys,
+                        [cls._key_name(i) for i in range(len(cls._api_keys))],
+                        db
+                    )
+        return BaseAgent._circuit_breaker
+    
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict[str, str]]) -> int:
+        """요청 토큰 수 추정 (한글 비중을 고려해 3자당 1토큰 + 응답 여유분)"""
+        prompt_chars = sum(len(m.get("content", "")) for m in messages)
+        return prompt_chars // 3 + 1024
+    
+    @classmethod
+    def _groq_api_url(cls) -> str:
+        """Chat Completions 엔드포인트 URL (GROQ_API_BASE_URL 환경 변수로 변경 가능)"""
+        base_url = os.getenv("GROQ_API_BASE_URL") or cls.GROQ_API_BASE_URL
+        return base_url.rstrip("/") + cls.GROQ_API_PATH
+    
+    def _record_llm_call(self, call_state: Dict[str, Any], wall_time: float, status: str, stream: bool = False) -> Dict[str, Any]:
+        """_call_groq 호출 1건 기록 (토큰 수는 응답의 usage 블록 사용)"""
+        usage = call_state.get("usage") or {}
+        record = {
+            "agent": self.name,
+            "agent_id": id(self),
+            "model": self.model,
+            "status": status,
+            "stream": stream,
+            "key": call_state.get("key"),
+            "retries": max(0, call_state.get("attempts", 0) - 1),
+            "wait_seconds": call_state.get("wait_seconds", 0.0),
+            "wall_time": wall_time,
+            "prompt_tokens": usage.get("prompt_tokens", 0) or 0,
+            "completion_tokens": usage.get("completion_tokens", 0) or 0,
+            "total_tokens": usage.get("total_tokens", 0) or 0,
+        }
+        with BaseAgent._llm_call_log_lock:
+            # 전체 호출 순번 (버려진 기록 포함, 다음 커서는 seq + 1)
+            record["seq"] = BaseAgent._llm_call_log_dropped + len(BaseAgent._llm_call_log)
+            if len(BaseAgent._llm_call_log) == BaseAgent._llm_call_log.maxlen:
+                BaseAgent._llm_call_log_dropped += 1
+            BaseAgent._llm_call_log.append(record)
+        return record
+    
+    @staticmethod
+    def _update_llm_call(record: Dict[str, Any], usage: Optional[Dict[str, Any]], wall_time: float):
+        """스트리밍 호출 완료 후 토큰 수/소요 시간 갱신"""
+        usage = usage or {}
+        with BaseAgent._llm_call_log_lock:
+            record["wall_time"] = wall_time
+            record["prompt_tokens"] = usage.get("prompt_tokens", 0) or 0
+            record["completion_tokens"] = usage.get("completion_tokens", 0) or 0
+            record["total_tokens"] = usage.get("total_tokens", 0) or 0
+    
+    @classmethod
+    def get_llm_call_log(cls, start: int = 0) -> List[Dict[str, Any]]:
+        """
+        start번째 이후의 LLM 호출 기록
+
+        start는 get_llm_call_count()로 받은 전체 호출 순번입니다.
+        그 사이에 보관 한도를 넘어 버려진 기록은 포함되지 않습니다.
+        """
+        with BaseAgent._llm_call_log_lock:
+            offset = max(0, start - BaseAgent._llm_call_log_dropped)
+            return [dict(record) for i, record in enumerate(BaseAgent._llm_call_log) if i >= offset]
+    
+    @classmethod
+    def get_llm_call_count(cls) -> int:
+        """지금까지 기록된 LLM 호출 수 (버려진 기록 포함, get_llm_call_log의 start로 사용)"""
+        with BaseAgent._llm_call_log_lock:
+            return BaseAgent._llm_call_log_dropped + len(BaseAgent._llm_call_log)
+    
+    @staticmethod
+    def summarize_llm_calls(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """LLM 호출 기록 합계"""
+        return {
+            "calls": len(records),
+            "prompt_tokens": sum(r["prompt_tokens"] for r in records),
+            "completion_tokens": sum(r["completion_tokens"] for r in records),
+            "total_tokens": sum(r["total_tokens"] for r in records),
+            "wall_time": sum(r["wall_time"] for r in records),
+            "wait_seconds": sum(r["wait_seconds"] for r in records),
+            "retries": sum(r["retries"] for r in records),
+        }
+    
     @classmethod
     def _reset_key_index(cls):
         """키 인덱스를 처음으로 리셋"""
@@ -73,6 +315,8 @@ class BaseAgent(ABC):
     def __init__(self, name: str, model: str = "llama-3.3-70b-versatile", require_api_key: bool = True):
         self.name = name
         self.model = model
+        self.temperature = 0.7
+        self.rate_limit_wait_seconds = 0.0  # Rate Limit으로 대기한 누적 시간
         
         if require_api_key:
             self._initialize_api_keys()
@@ -81,9 +325,68 @@ class BaseAgent(ABC):
         else:
             self.api_key = None
     
-    def _call_groq(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None) -> str:
-        """Groq API 호출 (여러 키 순환 사용)"""
-        import requests
+    def _call_groq(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None, stream: bool = False):
+        """
+        Groq API 호출 (모든 키가 Rate Limit이면 Retry-After를 존중하며 재시도)
+        
+        stream=True면 본문을 읽지 않은 스트리밍 응답 객체를 반환합니다.
+        
+        환경 변수:
+        - GROQ_RETRY_DEADLINE_SECONDS: Rate Limit 대기에 쓸 수 있는 최대 시간 (기본값 120초, 0이면 대기 없음)
+        - GROQ_RETRY_BASE_SECONDS: 백오프 첫 대기 시간 (기본값 2초)
+        """
+        deadline_seconds = float(os.getenv("GROQ_RETRY_DEADLINE_SECONDS", "120"))
+        base_delay = float(os.getenv("GROQ_RETRY_BASE_SECONDS", "2"))
+        
+        started_at = time.monotonic()
+        call_state = {"attempts": 0, "key": None, "usage": None, "wait_seconds": 0.0}
+        retry_round = 0
+        
+        while True:
+            try:
+                content = self._call_groq_all_keys(messages, response_format, max_retries, stream, call_state)
+            except GroqRateLimitError as e:
+                waited_seconds = call_state["wait_seconds"]
+                remaining = deadline_seconds - (time.monotonic() - started_at)
+                delay = backoff_delay(retry_round, hint=e.retry_after, base=base_delay, cap=max(base_delay, remaining))
+                
+                if remaining <= 0 or delay > remaining:
+                    self._record_llm_call(call_state, time.monotonic() - started_at, status="rate_limited", stream=stream)
+                    if waited_seconds > 0:
+                        raise GroqRateLimitError(f"{e} (Rate Limit 대기 {waited_seconds:.1f}초 후 포기)", e.retry_after)
+                    raise
+                
+                print(f"  ⏳ [{self.name}] 모든 API 키 Rate Limit, {delay:.1f}초 후 재시도 (누적 대기 {waited_seconds:.1f}초, 한도 {deadline_seconds:.0f}초)")
+                time.sleep(delay)
+                call_state["wait_seconds"] += delay
+                self.rate_limit_wait_seconds += delay
+                retry_round += 1
+                continue
+            except Exception:
+                self._record_llm_call(call_state, time.monotonic() - started_at, status="error", stream=stream)
+                raise
+            
+            if call_state["wait_seconds"] > 0:
+                print(f"  ✅ [{self.name}] Rate Limit 대기 후 호출 성공 (총 대기 {call_state['wait_seconds']:.1f}초)")
+            
+            record = self._record_llm_call(call_state, time.monotonic() - started_at, status="success", stream=stream)
+            if stream:
+                # 토큰 사용량/소요 시간은 스트림을 끝까지 읽은 뒤 _stream_llm에서 채움
+                content.llm_call_record = record
+                content.llm_call_started_at = started_at
+            return content
+    
+    def _call_groq_all_keys(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None, stream: bool = False, call_state: Optional[Dict[str, Any]] = None):
+        """
+        Groq API 호출 (스케줄러가 여유가 가장 많은 키를 선택, 모든 키 실패 시 GroqRateLimitError)
+        
+        call_state에 시도 횟수, 사용한 키, 토큰 사용량, 대기 시간을 기록합니다.
+        """
+        if call_state is None:
+            call_state = {"attempts": 0, "key": None, "usage": None, "wait_seconds": 0.0}
+        
+        session = self._get_http_session()
+        timeout = float(os.getenv("GROQ_HTTP_TIMEOUT", "60"))
         
         self._initialize_api_keys()
         
@@ -94,28 +397,32 @@ class BaseAgent(ABC):
         if max_retries is None:
             max_retries = min(len(self._api_keys), 3)  # 최대 3개 키까지 시도
         
-        last_error = None
-        tried_keys = set()
+        scheduler = self._get_key_scheduler()
+        breaker = self._get_circuit_breaker()
+        estimated_tokens = self._estimate_tokens(messages)
         
-        # 키 인덱스 초기화 (매 호출마다 처음부터 시작)
-        self._reset_key_index()
+        last_error = None
+        retry_hints = []
+        tried_indices = set()
         
         # 최대 재시도 횟수만큼 다른 키로 시도
         for attempt in range(max_retries):
-            # 사용 가능한 키 찾기 (순서대로: GROQ_API_KEY → GROQ_API_KEY_1 → GROQ_API_KEY_2)
-            api_key = None
-            
-            # 순서대로 키 시도
-            for idx in range(min(len(self._api_keys), 3)):
-                if self._api_keys[idx] not in tried_keys:
-                    api_key = self._api_keys[idx]
-                    tried_keys.add(api_key)
-                    break
+            # 여유가 가장 많은 키 선택 (회로가 열린 키 제외, 모두 소진되었으면 충전될 때까지 대기)
+            blocked_indices = breaker.blocked_indices()
+            key_index, scheduler_wait = scheduler.acquire(estimated_tokens, exclude=tried_indices | blocked_indices)
+            call_state["wait_seconds"] += scheduler_wait
+            self.rate_limit_wait_seconds += scheduler_wait
             
-            if not api_key:
+            if key_index is None:
                 # 모든 키를 시도했지만 실패
                 break
             
+            tried_indices.add(key_index)
+            api_key = self._api_keys[key_index]
+            call_state["attempts"] += 1
+            call_state["key"] = self._key_name(key_index)
+            breaker.on_attempt(key_index)
+            
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
@@ -124,95 +431,275 @@ class BaseAgent(ABC):
             payload = {
                 "model": self.model,
                 "messages": messages,
-                "temperature": 0.7,
+                "temperature": self.temperature,
             }
             
             if response_format:
                 payload["response_format"] = response_format
             
+            if stream:
+                payload["stream"] = True
+            
             try:
-                response = requests.post(
-                    "https://api.groq.com/openai/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=60
-                )
+                try:
+                    response = session.post(
+                        self._groq_api_url(),
+                        headers=headers,
+                        json=payload,
+                        timeout=timeout,
+                        stream=stream
+                    )
+                except requests.exceptions.RequestException:
+                    breaker.record_failure(key_index)
+                    raise
+                
+                # 응답 헤더로 키 예산 갱신
+                scheduler.update_from_headers(key_index, response.headers)
                 
                 if response.ok:
+                    breaker.record_success(key_index)
+                    if stream:
+                        return response
                     data = response.json()
+                    call_state["usage"] = data.get("usage")
                     return data["choices"][0]["message"]["content"]
                 
                 # Rate Limit 체크
                 error_text = response.text
                 if "rate_limit" in error_text.lower() or "Rate limit" in error_text or response.status_code == 429:
-                    # Rate Limit이면 다음 키로 시도
+                    # Rate Limit이면 해당 키를 잠시 제외하고 다음 키로 시도
                     error_data = response.json() if response.text else {}
                     error_msg = error_data.get("error", {}).get("message", error_text)
                     
-                    # 다음 키가 있는지 확인
-                    has_next_key = False
-                    if len(self._api_keys) > attempt + 1:
-                        has_next_key = True
-                    
-                    # 키 이름 출력
-                    key_names = ["GROQ_API_KEY", "GROQ_API_KEY_1", "GROQ_API_KEY_2"]
-                    current_key_name = key_names[attempt] if attempt < len(key_names) else f"API_KEY_{attempt + 1}"
-                    next_key_name = key_names[attempt + 1] if attempt + 1 < len(key_names) else None
+                    retry_hint = retry_delay_from_headers(response.headers)
+                    if retry_hint is not None:
+                        retry_hints.append(retry_hint)
                     
-                    print(f"  ⚠️  {current_key_name} Rate Limit 감지")
-                    if has_next_key and next_key_name:
-                        print(f"  🔄 {next_key_name}로 전환 시도 중... (시도 {attempt + 1}/{max_retries})")
-                    else:
-                        print(f"  ⚠️  모든 API 키 Rate Limit 감지 (시도 {attempt + 1}/{max_retries})")
+                    scheduler.report_rate_limited(key_index, retry_hint)
+                    breaker.record_rate_limited(key_index, retry_hint, error_msg)
+                    self._print_rate_limit_switch(key_index, tried_indices, attempt, max_retries)
                     
-                    last_error = Exception(f"Groq API Rate Limit: {error_msg}")
+                    last_error = GroqRateLimitError(f"Groq API Rate Limit: {error_msg}")
                     continue
                 else:
                     # 다른 종류의 에러는 즉시 실패
+                    breaker.record_failure(key_index, response.status_code, error_text)
                     raise Exception(f"Groq API 오류: {error_text}")
             
             except Exception as e:
                 # 네트워크 에러 등은 다음 키로 시도
                 if "Rate limit" in str(e) or "rate_limit" in str(e).lower():
-                    # 다음 키가 있는지 확인
-                    has_next_key = False
-                    if len(self._api_keys) > attempt + 1:
-                        has_next_key = True
-                    
-                    # 키 이름 출력
-                    key_names = ["GROQ_API_KEY", "GROQ_API_KEY_1", "GROQ_API_KEY_2"]
-                    current_key_name = key_names[attempt] if attempt < len(key_names) else f"API_KEY_{attempt + 1}"
-                    next_key_name = key_names[attempt + 1] if attempt + 1 < len(key_names) else None
-                    
-                    print(f"  ⚠️  {current_key_name} Rate Limit 감지")
-                    if has_next_key and next_key_name:
-                        print(f"  🔄 {next_key_name}로 전환 시도 중... (시도 {attempt + 1}/{max_retries})")
-                    else:
-                        print(f"  ⚠️  모든 API 키 Rate Limit 감지 (시도 {attempt + 1}/{max_retries})")
-                    
-                    last_error = e
+                    self._print_rate_limit_switch(key_index, tried_indices, attempt, max_retries)
+                    last_error = GroqRateLimitError(str(e))
                     continue
                 else:
                     raise
+            finally:
+                # 결과를 기록하지 못하고 끝나도 (응답 파싱 오류 등) 시험 호출 표시는 해제
+                breaker.end_attempt(key_index)
+        
+        # 회로가 열린 키도 가장 먼저 닫히는 시각을 대기 힌트로 사용
+        breaker_wait = breaker.retry_after()
+        if breaker_wait is not None:
+            retry_hints.append(breaker_wait)
         
-        # 모든 키가 실패한 경우
+        # 모든 키가 실패한 경우 (가장 먼저 풀리는 키의 대기 시간을 함께 전달)
         if last_error:
+            last_error.retry_after = min(retry_hints) if retry_hints else None
             raise last_error
+        elif breaker_wait is not None:
+            # 호출 없이 바로 포기 (모든 키의 회로가 열림 - 예: 일일 한도 소진)
+            raise GroqRateLimitError(
+                f"모든 Groq API 키 회로 열림 ({breaker_wait / 60:.0f}분 후 재시도 가능)",
+                breaker_wait
+            )
         else:
             raise Exception("모든 Groq API 키가 사용 불가능합니다.")
     
-    def _call_llm(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None) -> str:
+    def _print_rate_limit_switch(self, key_index: int, tried_indices: set, attempt: int, max_retries: int):
+        """Rate Limit 감지 및 키 전환 로그 출력"""
+        has_next_key = len(tried_indices) < min(len(self._api_keys), max_retries)
+        
+        print(f"  ⚠️  {self._key_name(key_index)} Rate Limit 감지")
+        if has_next_key:
+            print(f"  🔄 다른 API 키로 전환 시도 중... (시도 {attempt + 1}/{max_retries})")
+        else:
+            print(f"  ⚠️  모든 API 키 Rate Limit 감지 (시도 {attempt + 1}/{max_retries})")
+    
+    def _call_llm(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None, use_cache: Optional[bool] = None, stream: bool = False):
         """
-        LLM 호출 (GROQ만 사용)
+        LLM 호출 (GROQ만 사용, 응답 캐시 적용)
+        
+        Args:
+            use_cache: 캐시 사용 여부 (None이면 에이전트의 llm_cache_enabled 설정 사용)
+            stream: True면 응답 문자열 대신 토큰 조각을 순서대로 내보내는 제너레이터 반환
+        
+        환경 변수:
+        - LLM_CACHE_ENABLED: 캐시 사용 여부 (기본값 true)
+        - LLM_CACHE_TTL_SECONDS: 캐시 유효 시간 (기본값 86400초)
+        - LLM_CACHE_MAX_ENTRIES: 최대 캐시 항목 수 (기본값 500, 초과 시 LRU 삭제)
         """
-        return self._call_groq(messages, response_format, max_retries)
+        if use_cache is None:
+            use_cache = self.llm_cache_enabled
+        if os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true":
+            use_cache = False
+        
+        if stream:
+            return self._stream_llm(messages, response_format, max_retries, use_cache)
+        
+        if not use_cache:
+            return self._call_groq(messages, response_format, max_retries)
+        
+        cache_key = self._make_cache_key(self.model, messages, self.temperature, response_format)
+        
+        try:
+            cached = self._get_cache_db().get_llm_cache(cache_key)
+        except Exception as e:
+            print(f"  ⚠️  [{self.name}] LLM 캐시 조회 실패: {e}")
+            cached = None
+        
+        if cached:
+            saved_seconds = cached["latency_seconds"]
+            self._record_cache_event(self.name, hit=True, saved_seconds=saved_seconds)
+            print(f"  💾 [{self.name}] LLM 캐시 적중 (절약: {saved_seconds:.1f}초)")
+            return cached["response"]
+        
+        self._record_cache_event(self.name, hit=False)
+        
+        started_at = time.time()
+        response = self._call_groq(messages, response_format, max_retries)
+        latency_seconds = time.time() - started_at
+        
+        try:
+            self._get_cache_db().set_llm_cache(
+                cache_key,
+                agent_name=self.name,
+                model=self.model,
+                response=response,
+                latency_seconds=latency_seconds,
+                ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400")),
+                max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+            )
+        except Exception as e:
+            print(f"  ⚠️  [{self.name}] LLM 캐시 저장 실패: {e}")
+        
+        return response
+    
+    def _stream_llm(self, messages: List[Dict[str, str]], response_format: Optional[Dict], max_retries: Optional[int], use_cache: bool):
+        """
+        스트리밍 LLM 호출 (Server-Sent Events의 delta.content를 순서대로 yield)
+        
+        캐시 적중 시 전체 응답을 한 번에 내보내고, 끝까지 받은 응답은 캐시에 저장합니다.
+        """
+        cache_key = self._make_cache_key(self.model, messages, self.temperature, response_format) if use_cache else None
+        
+        if cache_key:
+            try:
+                cached = self._get_cache_db().get_llm_cache(cache_key)
+            except Exception as e:
+                print(f"  ⚠️  [{self.name}] LLM 캐시 조회 실패: {e}")
+                cached = None
+            
+            if cached:
+                self._record_cache_event(self.name, hit=True, saved_seconds=cached["latency_seconds"])
+                print(f"  💾 [{self.name}] LLM 캐시 적중 (절약: {cached['latency_seconds']:.1f}초)")
+                yield cached["response"]
+                return
+            
+            self._record_cache_event(self.name, hit=False)
+        
+        started_at = time.time()
+        response = self._call_groq(messages, response_format, max_retries, stream=True)
+        parts = []
+        usage = None
+        
+        try:
+            # text/event-stream에 charset이 없으면 requests가 ISO-8859-1로 디코딩해
+            # 한글이 깨지거나 줄이 잘못 나뉘므로 바이트 단위로 받아 UTF-8로 디코딩
+            for raw_line in response.iter_lines():
+                line = raw_line.decode("utf-8") if isinstance(raw_line, bytes) else raw_line
+                if not line or not line.startswith("data:"):
+                    continue
+                
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                
+                chunk = json.loads(data)
+                if chunk.get("x_groq", {}).get("usage"):
+                    usage = chunk["x_groq"]["usage"]
+                elif chunk.get("usage"):
+                    usage = chunk["usage"]
+                choices = chunk.get("choices") or [{}]
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        finally:
+            response.close()
+            record = getattr(response, "llm_call_record", None)
+            if record is not None:
+                self._update_llm_call(
+                    record,
+                    usage,
+                    time.monotonic() - getattr(response, "llm_call_started_at", time.monotonic())
+                )
+        
+        if cache_key and parts:
+            try:
+                self._get_cache_db().set_llm_cache(
+                    cache_key,
+                    agent_name=self.name,
+                    model=self.model,
+                    response="".join(parts),
+                    latency_seconds=time.time() - started_at,
+                    ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", "86400")),
+                    max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "500"))
+                )
+            except Exception as e:
+                print(f"  ⚠️  [{self.name}] LLM 캐시 저장 실패: {e}")
+    
+    async def _arun(self, func: Callable, *args, **kwargs) -> Any:
+        """동기 함수를 공유 실행기에서 실행 (이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_async_executor(),
+            functools.partial(func, *args, **kwargs)
+        )
+    
+    async def _acall_llm(self, messages: List[Dict[str, str]], response_format: Optional[Dict] = None, max_retries: int = None, use_cache: Optional[bool] = None) -> str:
+        """
+        LLM 비동기 호출
+        
+        공유 커넥션 풀/스케줄러/캐시를 그대로 사용하므로 여러 호출을
+        asyncio.gather로 동시에 실행해도 키 예산이 함께 관리됩니다.
+        """
+        return await self._arun(self._call_llm, messages, response_format, max_retries, use_cache)
     
     @abstractmethod
     def process(self, input_data: Any) -> Dict[str, Any]:
         """에이전트 처리 로직 (하위 클래스에서 구현)"""
         pass
     
+    async def aprocess(self, input_data: Any) -> Dict[str, Any]:
+        """에이전트 처리 로직 비동기 버전 (다른 에이전트와 동시 실행용)"""
+        return await self._arun(self.process, input_data)
+    
     def validate_output(self, output: Dict[str, Any]) -> bool:
         """출력 검증 (선택적)"""
         return True
 
+
+def run_async(coroutine) -> Any:
+    """
+    동기 코드에서 코루틴 실행
+    
+    이미 이벤트 루프가 실행 중이면(예: 비동기 코드에서 동기 API 호출) 별도 스레드의 새 루프에서 실행합니다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
@@ -2,7 +2,7 @@
 콘텐츠 생성 에이전트: 검증된 검색 결과 기반 콘텐츠 생성
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from agents.base import BaseAgent
 import json
 import sys
@@ -16,6 +16,9 @@ from src.core.database import Database
 class ContentGenerationAgent(BaseAgent):
     """콘텐츠 생성 에이전트"""
     
+    # 재실행 시 새 초안을 받도록 생성 호출은 캐시하지 않음 (이전 포스팅 분석만 캐시)
+    llm_cache_enabled = False
+    
     def __init__(self):
         super().__init__("콘텐츠 생성 에이전트")
         self.db = Database()
@@ -131,7 +134,7 @@ Please respond in the following JSON format:
         ]
         
         try:
-            response = self._call_llm(messages, response_format={"type": "json_object"})
+            response = self._call_llm(messages, response_format={"type": "json_object"}, use_cache=True)
             analysis_result = json.loads(response)
             
             # 분석 결과를 요약된 지침으로 변환 (언어별)
@@ -250,7 +253,7 @@ Please respond in the following JSON format:
         ]
         
         try:
-            response = self._call_llm(messages, response_format={"type": "json_object"})
+            response = self._call_llm(messages, response_format={"type": "json_object"}, use_cache=True)
             analysis_result = json.loads(response)
             
             # 분석 결과를 요약된 지침으로 변환
@@ -277,6 +280,96 @@ Please respond in the following JSON format:
             print(f"  ⚠️  [{self.name}] 캐시된 포스팅 분석 실패: {e}")
             return "캐시된 포스팅 분석 실패. 기본 가이드라인을 따르세요."
     
+    @staticmethod
+    def _title_language_problem(title: str, language: str) -> Optional[str]:
+        """제목 언어가 요청과 다르면 문제 설명 (문제가 없으면 None)"""
+        import re
+        if language == 'english' and re.search(r'[가-힣]', title):
+            return "영문 제목에 한글 포함"
+        if language == 'korean' and not re.search(r'[가-힣]', title):
+            return "한글 제목에 한글 없음"
+        return None
+    
+    def _generate_streaming(self, messages: List[Dict[str, str]], language: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        스트리밍으로 콘텐츠 생성 (LLM_STREAMING=true일 때 사용)
+        
+        제목이 완성되는 즉시 언어를 검사하고, 요청한 언어가 아니면 본문을 끝까지 받지 않고
+        스트림을 닫은 뒤 언어를 지정하는 지시를 붙여 다시 생성합니다
+        (본문 생성 토큰/시간 절약, LLM_STREAMING_TITLE_RETRIES회까지, 기본값 1).
+        첫 토큰/제목/전체 완료까지 걸린 시간과 다시 생성한 횟수를 측정합니다.
+        
+        Returns:
+            (전체 응답 문자열, 측정값) - 스트리밍 실패 시 일반 호출 결과와 None
+        """
+        import time
+        from src.utils.json_stream import JsonFieldStreamExtractor
+        
+        max_restarts = int(os.getenv("LLM_STREAMING_TITLE_RETRIES", "1"))
+        started_at = time.time()
+        metrics = {
+            "time_to_first_token": None,
+            "time_to_title": None,
+            "total_time": None,
+            "chunks": 0,
+            "restarts": 0,
+        }
+        attempt_messages = messages
+        
+        while True:
+            extractor = JsonFieldStreamExtractor(fields=("title",))
+            parts = []
+            title_problem = None
+            stream = self._call_llm(attempt_messages, response_format={"type": "json_object"}, stream=True)
+            
+            try:
+                for delta in stream:
+                    elapsed = time.time() - started_at
+                    if metrics["time_to_first_token"] is None:
+                        metrics["time_to_first_token"] = elapsed
+                    metrics["chunks"] += 1
+                    parts.append(delta)
+                    
+                    if extractor.completed:
+                        continue
+                    for event in extractor.feed(delta):
+                        if event["field"] != "title" or not event["done"]:
+                            continue
+                        metrics["time_to_title"] = elapsed
+                        title = extractor.values["title"]
+                        print(f"  ⚡ [{self.name}] 제목 수신 ({elapsed:.1f}초): {title[:50]}")
+                        problem = self._title_language_problem(title, language)
+                        if problem:
+                            print(f"  ⚠️  [{self.name}] {problem} (생성 중 조기 감지)")
+                            if metrics["restarts"] < max_restarts:
+                                title_problem = problem
+                    if title_problem:
+                        break
+            except Exception as e:
+                print(f"  ⚠️  [{self.name}] 스트리밍 생성 실패, 일반 호출로 재시도: {e}")
+                return self._call_llm(messages, response_format={"type": "json_object"}), None
+            finally:
+                # 중간에 멈춘 경우 연결을 닫아 남은 본문 생성을 기다리지 않음 (부분 응답은 캐시되지 않음)
+                stream.close()
+            
+            if title_problem is None:
+                break
+            
+            metrics["restarts"] += 1
+            print(f"  🔁 [{self.name}] 본문 생성 중단, 언어를 지정해 다시 생성 ({metrics['restarts']}/{max_restarts})")
+            if language == 'english':
+                correction = "The title was not in English. Write the title and the whole content in English only, with no Korean characters, and respond again in the same JSON format."
+            else:
+                correction = "제목이 한국어가 아니었습니다. 제목과 본문 전체를 한국어(한글)로 작성해 같은 JSON 형식으로 다시 응답하세요."
+            attempt_messages = messages + [{"role": "user", "content": correction}]
+        
+        metrics["total_time"] = time.time() - started_at
+        ttft = metrics["time_to_first_token"] or 0.0
+        print(f"  ⚡ [{self.name}] 스트리밍 완료: 첫 토큰 {ttft:.1f}초, 전체 {metrics['total_time']:.1f}초"
+              + (f", 제목 언어 문제로 {metrics['restarts']}회 다시 생성" if metrics["restarts"] else ""))
+        
+        return "".join(parts), metrics
+    
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """콘텐츠 생성"""
         keyword = input_data["keyword"]
@@ -289,9 +382,10 @@ Please respond in the following JSON format:
         # 이전 포스팅 분석하여 개선점 도출
         previous_posts_analysis = self._analyze_previous_posts(language, keyword)
         
-        # 검색 결과 요약
+        # 검색 결과 요약 (원문 발췌가 있으면 스니펫 아래에 추가, src/services/page_fetcher.py)
         search_summary = "\n".join([
             f"{i+1}. {r['title']}\n   {r['snippet']}\n   출처: {r['link']}"
+            + "".join(f"\n   > {passage}" for passage in r.get("passages", []))
             for i, r in enumerate(validated_results)
         ])
         
@@ -1512,10 +1606,14 @@ MBTI는 ISFJ로, 조용하고 배려심이 많으며, 실용적이고 세심한
         ]
         
         try:
-            response = self._call_llm(
-                messages,
-                response_format={"type": "json_object"}
-            )
+            stream_metrics = None
+            if os.getenv("LLM_STREAMING", "false").lower() == "true":
+                response, stream_metrics = self._generate_streaming(messages, language)
+            else:
+                response = self._call_llm(
+                    messages,
+                    response_format={"type": "json_object"}
+                )
             
             generated_content = json.loads(response)
             
@@ -1777,7 +1875,8 @@ MBTI는 ISFJ로, 조용하고 배려심이 많으며, 실용적이고 세심한
                 "content": content_text,
                 "summary": summary,
                 "keywords": keywords,
-                "category": category
+                "category": category,
+                "stream_metrics": stream_metrics
             }
             
         except Exception as e:
@@ -143,6 +143,9 @@ class FactCheckAgent(BaseAgent):
 class ContentRevisionAgent(BaseAgent):
     """콘텐츠 수정 에이전트 - 잘못된 정보를 수정"""
     
+    # 수정 결과는 매번 새로 받아야 하므로 캐시하지 않음
+    llm_cache_enabled = False
+    
     def __init__(self):
         super().__init__("콘텐츠 수정 에이전트")
     
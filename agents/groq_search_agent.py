@@ -0,0 +1,64 @@
+"""
+Groq 검색 에이전트: LLM으로 웹 검색 결과 생성 (Google 할당량 소진 시 폴백)
+"""
+
+import json
+from typing import Dict, Any, List
+from agents.base import BaseAgent
+
+
+class GroqSearchAgent(BaseAgent):
+    """Groq 검색 에이전트"""
+    
+    def __init__(self):
+        super().__init__("Groq Search Agent")
+    
+    def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        검색 결과 생성
+        
+        Args:
+            input_data: {"query": 검색어, "num_results": 결과 수 (기본값 10)}
+        
+        Returns:
+            {"query": 검색어, "results": [{"title", "link", "snippet"}, ...]}
+        """
+        query = input_data["query"]
+        num_results = input_data.get("num_results", 10)
+        
+        # 실제로는 Groq는 검색 API를 제공하지 않으므로,
+        # 웹 검색 결과를 생성하는 프롬프트를 사용합니다.
+        system_prompt = """You are a web search assistant. Generate realistic web search results based on the query."""
+        
+        user_prompt = f"""Generate web search results for the query: "{query}"
+
+Please provide {num_results} search results in the following JSON format:
+{{
+  "results": [
+    {{
+      "title": "Result title",
+      "link": "https://example.com/article",
+      "snippet": "Article snippet or summary"
+    }}
+  ]
+}}
+
+Make the results relevant and realistic based on the query."""
+        
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        response = self._call_groq(
+            messages,
+            response_format={"type": "json_object"}
+        )
+        
+        data = json.loads(response)
+        results: List[Dict[str, str]] = data.get("results", [])[:num_results]
+        
+        return {
+            "query": query,
+            "results": results
+        }
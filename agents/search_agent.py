@@ -2,9 +2,14 @@
 검색 에이전트: 키워드 검색 및 결과 수집
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from typing import Dict, Any, List
 from agents.base import BaseAgent
 from src.services.search import search_keywords
+from src.utils.url_canonical import dedupe_search_results
+from src.utils.result_quality import score_search_results, result_relevance, keyword_tokens
 
 
 class SearchAgent(BaseAgent):
@@ -34,16 +39,17 @@ class SearchAgent(BaseAgent):
             normalized_keyword.split()[0] if len(normalized_keyword.split()) > 1 else normalized_keyword,
         ]
         
-        search_results = []
+        # 같은 쿼리 중복 제거 (정규화 결과가 원본과 같은 경우 등)
+        queries = list(dict.fromkeys(q for q in queries if q))
         
-        for query in queries:
-            print(f"  🔍 [{self.name}] 키워드 검색 중: {query}")
-            results = search_keywords(query, num_results=10)
-            
-            if results:
-                search_results = results
-                print(f"  ✅ [{self.name}] 검색 결과 {len(search_results)}개 발견")
-                break
+        search_results = self._search_variants(queries, normalized_keyword)
+        
+        # 리디렉션/추적 파라미터를 정리하고 같은 문서는 하나만 검증 에이전트로 전달
+        if search_results:
+            before = len(search_results)
+            search_results = dedupe_search_results(search_results)
+            if len(search_results) < before:
+                print(f"  🧹 [{self.name}] 중복 결과 {before - len(search_results)}개 제거 ({len(search_results)}개 사용)")
         
         if not search_results:
             print(f"  ⚠️  [{self.name}] 모든 쿼리에서 검색 결과 없음")
@@ -60,4 +66,146 @@ class SearchAgent(BaseAgent):
             "results": search_results,
             "count": len(search_results)
         }
+    
+    @staticmethod
+    def _query_priority(index: int) -> str:
+        """원래 키워드(첫 번째 쿼리)만 Google 예비 할당량까지 사용"""
+        return "high" if index == 0 else "normal"
+    
+    def _fanout_workers(self) -> int:
+        """동시에 검색할 쿼리 수 (Google 할당량이 부족하면 1 = 순서대로)"""
+        max_workers = max(1, int(os.getenv("SEARCH_FANOUT_WORKERS", "2")))
+        if max_workers == 1:
+            return 1
+        
+        from src.services import search
+        if search.USE_GOOGLE_SEARCH:
+            min_quota = int(os.getenv("SEARCH_FANOUT_MIN_GOOGLE_QUOTA", "20"))
+            remaining = search.get_google_quota_remaining("normal")
+            if remaining < min_quota:
+                print(f"  ⏬ [{self.name}] Google 남은 할당량 {remaining}건 (< {min_quota}), 쿼리를 순서대로 검색")
+                return 1
+        return max_workers
+    
+    def _search_variants(self, queries: List[str], keyword: str = None) -> List[Dict[str, str]]:
+        """
+        쿼리 변형들을 동시에 검색
+        
+        first/sequential 모드는 결과를 모을 때마다 로컬 품질 점수(src/utils/result_quality.py)를 계산해
+        기준을 넘으면 멈추고, 낮으면 다음 쿼리 결과를 더 모읍니다.
+        (결과 1개짜리 등 LLM 검색 검증에서 거부될 결과로 바로 진행하지 않음)
+        
+        환경 변수:
+        - SEARCH_FANOUT_MODE: first(기본값, 품질 기준을 넘는 결과가 모이면 아직 시작하지 않은 쿼리는 건너뜀,
+          이미 실행 중인 검색은 중단할 수 없어 끝까지 실행되고 할당량도 사용) /
+          merge(모든 쿼리 결과를 링크 기준으로 합침) / sequential(기존처럼 순서대로)
+        - SEARCH_FANOUT_WORKERS: 동시에 검색할 쿼리 수 (기본값 2, 동시 쿼리마다 검색 할당량을 쓰므로 작게 유지)
+        - SEARCH_FANOUT_MIN_GOOGLE_QUOTA: Google 검색을 쓸 때 남은 할당량(normal 우선순위)이 이 값보다 적으면
+          동시 검색하지 않고 순서대로 검색 (기본값 20)
+        - SEARCH_MERGE_MAX_RESULTS: 합친 결과의 최대 수 (기본값 10)
+        - SEARCH_QUALITY_MIN_SCORE: 검색을 멈추는 품질 점수 (0~100, 기본값 50, 0이면 결과가 있으면 바로 멈춤)
+        """
+        mode = os.getenv("SEARCH_FANOUT_MODE", "first").lower()
+        max_workers = self._fanout_workers() if mode != "sequential" and len(queries) > 1 else 1
+        keyword = keyword or queries[0]
+        collector = _QualityCollector(keyword)
+        
+        if mode == "sequential" or max_workers == 1 or len(queries) == 1:
+            for index, query in enumerate(queries):
+                print(f"  🔍 [{self.name}] 키워드 검색 중: {query}")
+                results = search_keywords(query, num_results=10, priority=self._query_priority(index))
+                if results:
+                    print(f"  ✅ [{self.name}] 검색 결과 {len(results)}개 발견")
+                    if collector.add(results):
+                        print(f"  📏 [{self.name}] {collector.describe()} - 검색 종료")
+                        return collector.results()
+                    print(f"  📏 [{self.name}] {collector.describe()} - 다음 쿼리로 결과 보강")
+            return collector.results()
+        
+        print(f"  🔍 [{self.name}] 쿼리 {len(queries)}개 동시 검색 (최대 {min(max_workers, len(queries))}개씩, {mode} 모드)")
+        
+        # first 모드에서 품질 기준을 넘으면 아직 시작하지 않은 쿼리는 건너뜀 (실행 중인 검색은 끝까지 실행됨)
+        found = threading.Event()
+        
+        def run(query: str, index: int) -> List[Dict[str, str]]:
+            if mode == "first" and found.is_set():
+                return []
+            return search_keywords(query, num_results=10, priority=self._query_priority(index))
+        
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(queries)), thread_name_prefix="search-fanout")
+        futures = {executor.submit(run, query, index): index for index, query in enumerate(queries)}
+        results_by_index: Dict[int, List[Dict[str, str]]] = {}
+        
+        try:
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = futures[future]
+                    try:
+                        results_by_index[index] = future.result()
+                    except Exception as e:
+                        print(f"  ⚠️  [{self.name}] '{queries[index]}' 검색 오류: {e}")
+                        results_by_index[index] = []
+                    
+                    if mode == "first" and results_by_index[index]:
+                        results = results_by_index[index]
+                        if collector.add(results):
+                            found.set()
+                            print(f"  ✅ [{self.name}] '{queries[index]}' 검색 결과 {len(results)}개 발견, "
+                                  f"{collector.describe()} (시작하지 않은 쿼리 건너뜀)")
+                            return collector.results()
+                        print(f"  📏 [{self.name}] '{queries[index]}' 결과 {len(results)}개, {collector.describe()} - 다른 쿼리 결과 대기")
+        finally:
+            # 진행 중인 검색은 기다리지 않고 (결과는 버림), 대기 중인 쿼리는 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        if mode == "first":
+            # 기준에 못 미쳐도 모은 결과 중 가장 나은 것으로 진행 (LLM 검증이 최종 판단)
+            if collector.results():
+                print(f"  ⚠️  [{self.name}] 모든 쿼리 결과를 모아도 품질 기준 미달: {collector.describe()}")
+            return collector.results()
+        
+        # 쿼리 순서대로 같은 문서 없이 합치기 (정규화한 URL 기준)
+        max_results = int(os.getenv("SEARCH_MERGE_MAX_RESULTS", "10"))
+        merged = dedupe_search_results(
+            [result for index in sorted(results_by_index) for result in results_by_index[index]]
+        )
+        
+        if merged:
+            print(f"  ✅ [{self.name}] 쿼리 {len(queries)}개 결과 병합: {len(merged)}개 (최대 {max_results}개 사용)")
+        return merged[:max_results]
+
 
+class _QualityCollector:
+    """쿼리 변형 결과를 모으며 품질 점수 계산 (기준을 넘으면 add가 True)"""
+    
+    def __init__(self, keyword: str):
+        self.keyword = keyword
+        self.tokens = keyword_tokens(keyword)
+        self.min_score = float(os.getenv("SEARCH_QUALITY_MIN_SCORE", "50"))
+        self.max_results = int(os.getenv("SEARCH_MERGE_MAX_RESULTS", "10"))
+        self.collected: List[Dict[str, str]] = []
+        self.fallback: List[Dict[str, str]] = []
+        self.quality = score_search_results(keyword, [])
+    
+    def add(self, results: List[Dict[str, str]]) -> bool:
+        if not self.fallback:
+            self.fallback = results
+        
+        # 키워드가 전혀 없는 결과는 모으지 않음 (검증 프롬프트만 늘리고 점수를 낮춤)
+        relevant = [r for r in results if result_relevance(self.tokens, r) > 0]
+        if relevant:
+            self.collected = dedupe_search_results(self.collected + relevant, max_results=self.max_results)
+            self.quality = score_search_results(self.keyword, self.collected)
+        
+        return bool(self.collected or self.min_score <= 0) and self.quality["score"] >= self.min_score
+    
+    def results(self) -> List[Dict[str, str]]:
+        return self.collected or self.fallback
+    
+    def describe(self) -> str:
+        q = self.quality
+        return (f"품질 점수 {q['score']:.0f}/{self.min_score:.0f} "
+                f"(결과 {len(self.collected)}개, 키워드 {q['keyword_overlap']:.2f}, 도메인 {q['domain_diversity']:.2f}, "
+                f"스니펫 {q['snippet_length']:.2f}, 언어 {q['script_match']:.2f})")
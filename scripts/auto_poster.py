@@ -2,7 +2,7 @@
 """
 자동 포스팅 메인 스크립트
 - 키워드 하나만 처리
-- 영문 1개 + 한글 1개 포스팅 (영문 먼저)
+- 영문 1개 + 한글 1개 포스팅 (영문 생성 → 한글 번역 → 두 페이지 동시 게시)
 - 중복 방지
 - 출처 및 면책문구 필수
 """
@@ -13,6 +13,10 @@ import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 import subprocess
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
@@ -24,6 +28,7 @@ load_env_file()
 
 # 모듈 import
 from src.core.database import Database
+from src.services.publish_outbox import get_outbox_content
 from agents.agent_chain import AgentChain
 from agents.keyword_inference_agent import KeywordInferenceAgent
 
@@ -249,6 +254,137 @@ def validate_and_fix_content(content: dict, keyword: str, language: str, validat
     return None
 
 
+def start_next_keyword_prefetch(next_keyword: str):
+    """
+    다음 커리큘럼 키워드의 검색/검색 검증을 백그라운드로 미리 실행
+    
+    자기 학습 단계와 동시에 실행되고, 다음 날 실행은 콘텐츠 생성부터 바로 시작합니다.
+    SEARCH_PREFETCH_ENABLED=false이면 실행하지 않습니다.
+    
+    Returns:
+        실행 중인 스레드 (종료 전에 join 필요) 또는 None
+    """
+    if os.getenv("SEARCH_PREFETCH_ENABLED", "true").lower() != "true":
+        return None
+    
+    def run():
+        try:
+            AgentChain().prefetch_search(next_keyword)
+        except Exception as e:
+            print(f"  ⚠️  다음 키워드 미리 검색 오류: {e}")
+    
+    thread = threading.Thread(target=run, name="search-prefetch")
+    thread.start()
+    return thread
+
+
+def publish_post(db: Database, keyword_id: str, keyword: str, language: str, content: dict,
+                 parent_page_id: str = None, database_id: str = None) -> dict:
+    """
+    Notion 페이지 생성 + DB 기록 (포스트 저장, 게시 정보, 학습용 캐시)
+    
+    게시는 outbox를 거치므로(src/services/publish_outbox.py) 같은 날 같은 키워드/언어를 다시 게시하면
+    새 페이지를 만들지 않고 이미 생성된 페이지를 사용합니다.
+    
+    Returns:
+        {"status": "success", "page_id", "page_url", "post_id"} 또는 {"status": "failed", "message"}
+    """
+    from src.services.publish_outbox import publish_once, record_outbox_post
+    
+    label = '영문' if language == 'english' else '한글'
+    print(f"\n  📝 {label} 포스팅 중...")
+    
+    try:
+        notion_result = publish_once(
+            db, keyword_id, keyword, language,
+            title=content['title'],
+            content=content['content'],
+            parent_page_id=parent_page_id,
+            database_id=database_id
+        )
+    except Exception as e:
+        return {"status": "failed", "message": str(e)}
+    
+    if not notion_result or notion_result.get("status") != "success":
+        error_msg = notion_result.get("message", "알 수 없는 오류") if notion_result else "결과를 받지 못함"
+        return {"status": "failed", "message": error_msg}
+    
+    page_id = notion_result.get('page_id')
+    page_url = notion_result.get('page_url')
+    # 다른 언어 게시와 동시에 실행되므로 한 번에 출력 (줄이 섞이지 않도록)
+    print(f"  ✅ {label} 포스팅 완료!\n     페이지 ID: {page_id}\n     페이지 URL: {page_url or 'N/A'}\n", end="")
+    
+    # 이전 시도에서 이미 DB에 기록된 게시면 다시 저장하지 않음
+    outbox_entry = notion_result.get("outbox") or {}
+    if notion_result.get("reused") and outbox_entry.get("post_id"):
+        return {"status": "success", "page_id": page_id, "page_url": page_url, "post_id": outbox_entry["post_id"]}
+    
+    # 데이터베이스에 저장
+    post_id = None
+    try:
+        post_id = db.create_post(
+            keyword_id=keyword_id,
+            title=content['title'],
+            content=content['content'],
+            search_results=[],
+            status='published',
+            language=language
+        )
+        
+        if page_id:
+            db.update_post_published(post_id, page_id, page_url or '')
+            # 학습용 캐시 업데이트 (언어별 최근 2건 유지)
+            db.update_learning_cache(
+                post_id=post_id,
+                language=language,
+                title=content['title'],
+                content=content['content']
+            )
+        record_outbox_post(db, keyword, language, post_id)
+    except ValueError as e:
+        if "중복" in str(e):
+            print(f"  ⏭️  중복 포스트: {e}")
+        else:
+            raise
+    
+    return {"status": "success", "page_id": page_id, "page_url": page_url, "post_id": post_id}
+
+
+def publish_posts(db: Database, keyword_id: str, keyword: str, posts: list,
+                  parent_page_id: str = None, database_id: str = None) -> dict:
+    """
+    여러 언어 포스트를 동시에 게시 (페이지 생성과 DB 기록은 언어별로 독립적)
+    
+    - NOTION_PUBLISH_WORKERS: 동시에 게시할 포스트 수 (기본값 2, 1이면 순서대로)
+    
+    Args:
+        posts: [(language, content), ...]
+    
+    Returns:
+        language → publish_post 결과
+    """
+    max_workers = max(1, min(len(posts), int(os.getenv("NOTION_PUBLISH_WORKERS", "2"))))
+    started_at = time.time()
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="notion-publish") as executor:
+        futures = {
+            language: executor.submit(publish_post, db, keyword_id, keyword, language, content, parent_page_id, database_id)
+            for language, content in posts
+        }
+    
+    results = {}
+    for language, future in futures.items():
+        try:
+            results[language] = future.result()
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            results[language] = {"status": "failed", "message": str(e)}
+    
+    print(f"\n  ⏱️  포스팅 {len(posts)}건 완료: {time.time() - started_at:.1f}초 (동시 {max_workers}개)")
+    return results
+
+
 def process_single_keyword_dual_language():
     """단일 키워드를 영문/한글 각 1개씩 포스팅 (영문 먼저)"""
     load_env_file()
@@ -308,157 +444,125 @@ def process_single_keyword_dual_language():
     # ============================================================
     print(f"\n📝 [1/2] 영문 콘텐츠 생성 및 포스팅\n")
     content_english = None
+    english_ready = False
     page_url_english = None
-    post_id_english = None
     rate_limit_error = False
     
-    try:
-        result_english = chain.process(keyword_name, notion_page_id, language='english', skip_posting=True)
-        
-        if result_english["status"] == "success":
-            content_english = result_english['generated_content']
-            validated_results = result_english.get('validated_results', [])
-            
-            # 영문 콘텐츠 검증 (통과될 때까지 반복)
-            print(f"\n  🔍 영문 콘텐츠 검증 시작...")
-            content_english = validate_and_fix_content(
-                content_english,
-                keyword_name,
-                'english',
-                validated_results,
-                max_attempts=3
-            )
+    # 이전 시도에서 outbox에 기록된 영문 콘텐츠가 있으면 생성/검증을 다시 하지 않음
+    outbox_english = get_outbox_content(db, keyword_name, 'english')
+    if outbox_english:
+        print(f"  ♻️  이전 시도에서 저장된 영문 콘텐츠를 사용합니다 (생성 생략): {outbox_english['title']}")
+        content_english = {'title': outbox_english['title'], 'content': outbox_english['content']}
+        english_ready = True
+    else:
+        try:
+            result_english = chain.process(keyword_name, notion_page_id, language='english', skip_posting=True)
             
-            # 검증 실패 시 경고만 하고 계속 진행 (한글 포함만 체크)
-            if content_english is None:
-                print(f"  ⚠️  영문 콘텐츠 검증 실패했지만, 한글 포함 여부를 재확인 후 진행합니다.")
-                # 한글 포함 여부만 재확인
-                from src.utils.helpers import remove_korean_from_english_text
-                # content_english가 None이므로 다시 가져오기
+            if result_english["status"] == "success":
                 content_english = result_english['generated_content']
-                original_content = content_english['content']
-                original_title = content_english['title']
-                
-                # 한글 제거 후 재확인
-                cleaned_content = remove_korean_from_english_text(original_content)
-                cleaned_title = remove_korean_from_english_text(original_title)
+                validated_results = result_english.get('validated_results', [])
                 
-                # 한글이 제거되었다면 경고만 하고 계속 진행
-                import re
-                korean_pattern = re.compile(r'[가-힣]')
-                has_korean = bool(korean_pattern.search(cleaned_content + cleaned_title))
-                
-                if has_korean:
-                    print(f"  ❌ 영문 콘텐츠에 한글이 포함되어 포스팅을 중단합니다.")
-                    rate_limit_error = True
-                    raise Exception("영문 콘텐츠 검증 실패: 한글 포함")
-                else:
-                    print(f"  ⚠️  한글 포함은 없지만 품질 검증 실패. 경고 후 계속 진행합니다.")
-                    content_english['content'] = cleaned_content
-                    content_english['title'] = cleaned_title
-            
-            # 출처 및 면책문구 확인
-            content_english['content'] = ensure_sources_and_disclaimer(content_english['content'])
-            
-            # 영문 포스팅
-            print(f"\n  📝 영문 포스팅 중...")
-            from src.services.notion import create_notion_page
-            database_id = os.getenv("NOTION_DATABASE_ID")
-            
-            notion_result_english = create_notion_page(
-                title=content_english['title'],
-                content=content_english['content'],
-                parent_page_id=notion_page_id,
-                database_id=database_id
-            )
-            
-            if notion_result_english and notion_result_english.get("status") == "success":
-                page_id_english = notion_result_english.get('page_id')
-                page_url_english = notion_result_english.get('page_url')
-                print(f"  ✅ 영문 포스팅 완료!")
-                print(f"     페이지 ID: {page_id_english}")
-                print(f"     페이지 URL: {page_url_english or 'N/A'}")
+                # 영문 콘텐츠 검증 (통과될 때까지 반복)
+                print(f"\n  🔍 영문 콘텐츠 검증 시작...")
+                content_english = validate_and_fix_content(
+                    content_english,
+                    keyword_name,
+                    'english',
+                    validated_results,
+                    max_attempts=3
+                )
                 
-                # 데이터베이스에 저장
-                try:
-                    post_id_english = db.create_post(
-                        keyword_id=keyword_id,
-                        title=content_english['title'],
-                        content=content_english['content'],
-                        search_results=[],
-                        status='published',
-                        language='english'
-                    )
+                # 검증 실패 시 경고만 하고 계속 진행 (한글 포함만 체크)
+                if content_english is None:
+                    print(f"  ⚠️  영문 콘텐츠 검증 실패했지만, 한글 포함 여부를 재확인 후 진행합니다.")
+                    # 한글 포함 여부만 재확인
+                    from src.utils.helpers import remove_korean_from_english_text
+                    # content_english가 None이므로 다시 가져오기
+                    content_english = result_english['generated_content']
+                    original_content = content_english['content']
+                    original_title = content_english['title']
+                    
+                    # 한글 제거 후 재확인
+                    cleaned_content = remove_korean_from_english_text(original_content)
+                    cleaned_title = remove_korean_from_english_text(original_title)
+                    
+                    # 한글이 제거되었다면 경고만 하고 계속 진행
+                    import re
+                    korean_pattern = re.compile(r'[가-힣]')
+                    has_korean = bool(korean_pattern.search(cleaned_content + cleaned_title))
                     
-                    if page_id_english:
-                        db.update_post_published(post_id_english, page_id_english, page_url_english or '')
-                        # 학습용 캐시 업데이트 (영문 최근 2건 유지)
-                        db.update_learning_cache(
-                            post_id=post_id_english,
-                            language='english',
-                            title=content_english['title'],
-                            content=content_english['content']
-                        )
-                except ValueError as e:
-                    if "중복" in str(e):
-                        print(f"  ⏭️  중복 포스트: {e}")
+                    if has_korean:
+                        print(f"  ❌ 영문 콘텐츠에 한글이 포함되어 포스팅을 중단합니다.")
+                        rate_limit_error = True
+                        raise Exception("영문 콘텐츠 검증 실패: 한글 포함")
                     else:
-                        raise
+                        print(f"  ⚠️  한글 포함은 없지만 품질 검증 실패. 경고 후 계속 진행합니다.")
+                        content_english['content'] = cleaned_content
+                        content_english['title'] = cleaned_title
+                
+                # 출처 및 면책문구 확인
+                content_english['content'] = ensure_sources_and_disclaimer(content_english['content'])
+                
+                # 영문 포스팅은 한글 콘텐츠가 준비된 뒤 함께 실행
+                english_ready = True
             else:
-                error_msg = notion_result_english.get("message", "알 수 없는 오류") if notion_result_english else "결과를 받지 못함"
-                print(f"  ❌ 영문 포스팅 실패: {error_msg}")
-                return
-        else:
-            error_msg = result_english.get('message', '알 수 없는 오류')
-            print(f"  ❌ 영문 콘텐츠 생성 실패: {error_msg}")
-            if "rate_limit" in str(error_msg).lower() or "Rate limit" in str(error_msg):
+                error_msg = result_english.get('message', '알 수 없는 오류')
+                print(f"  ❌ 영문 콘텐츠 생성 실패: {error_msg}")
+                if "rate_limit" in str(error_msg).lower() or "Rate limit" in str(error_msg):
+                    rate_limit_error = True
+                    print(f"  ⚠️  Rate Limit 감지: 포스팅을 건너뜁니다.")
+                else:
+                    return
+        except Exception as e:
+            error_str = str(e)
+            print(f"  ❌ 영문 콘텐츠 생성 오류: {e}")
+            if "rate_limit" in error_str.lower() or "Rate limit" in error_str:
                 rate_limit_error = True
-                print(f"  ⚠️  Rate Limit 감지: 포스팅을 건너뜁니다.")
             else:
+                import traceback
+                traceback.print_exc()
                 return
-    except Exception as e:
-        error_str = str(e)
-        print(f"  ❌ 영문 콘텐츠 생성 오류: {e}")
-        if "rate_limit" in error_str.lower() or "Rate limit" in error_str:
-            rate_limit_error = True
-        else:
-            import traceback
-            traceback.print_exc()
-            return
     
     # ============================================================
     # 2단계: 한글 콘텐츠 생성 (영문 기반 번역), 검증, 포스팅
     # ============================================================
     print(f"\n📝 [2/2] 한글 콘텐츠 생성 및 포스팅 (영문 기반 번역)\n")
     content_korean = None
+    korean_ready = False
     page_url_korean = None
-    post_id_korean = None
     
     # 1단계에서 생성된 영문 콘텐츠가 없으면 종료
-    if not content_english:
+    if not content_english or not english_ready:
         print(f"  ❌ 영문 콘텐츠가 없어 한글 포스팅을 건너뜁니다.")
         return
     
-    try:
-        # 1단계에서 생성된 영문 콘텐츠를 직접 한글로 번역
-        print(f"  🔄 1단계에서 생성된 영문 콘텐츠를 한글로 번역 중...")
-        from agents.content_agent import ContentGenerationAgent
-        import json
-        from src.utils.format_fixer import fix_korean_content_format
-        
-        agent = ContentGenerationAgent()
-        
-        english_title = content_english['title']
-        english_content_text = content_english['content']
-        
-        # 영문 본문 구조 분석
-        import re
-        eng_paragraphs = len(re.findall(r'\n\n+', english_content_text))
-        eng_headings = len(re.findall(r'^##\s+', english_content_text, re.MULTILINE))
-        eng_sections = len(re.findall(r'^\*\*', english_content_text, re.MULTILINE))
-        
-        # 번역 프롬프트 준비 (형식 유지 강화 + 구조 정보 포함)
-        translation_prompt = f"""다음 영문 블로그 포스트를 자연스러운 한국어로 번역해주세요.
+    # 이전 시도에서 outbox에 기록된 한글 콘텐츠가 있으면 번역/검증을 다시 하지 않음
+    outbox_korean = get_outbox_content(db, keyword_name, 'korean')
+    if outbox_korean:
+        print(f"  ♻️  이전 시도에서 저장된 한글 콘텐츠를 사용합니다 (번역 생략): {outbox_korean['title']}")
+        content_korean = {'title': outbox_korean['title'], 'content': outbox_korean['content']}
+        korean_ready = True
+    else:
+        try:
+            # 1단계에서 생성된 영문 콘텐츠를 직접 한글로 번역
+            print(f"  🔄 1단계에서 생성된 영문 콘텐츠를 한글로 번역 중...")
+            from agents.content_agent import ContentGenerationAgent
+            import json
+            from src.utils.format_fixer import fix_korean_content_format
+            
+            agent = ContentGenerationAgent()
+            
+            english_title = content_english['title']
+            english_content_text = content_english['content']
+            
+            # 영문 본문 구조 분석
+            import re
+            eng_paragraphs = len(re.findall(r'\n\n+', english_content_text))
+            eng_headings = len(re.findall(r'^##\s+', english_content_text, re.MULTILINE))
+            eng_sections = len(re.findall(r'^\*\*', english_content_text, re.MULTILINE))
+            
+            # 번역 프롬프트 준비 (형식 유지 강화 + 구조 정보 포함)
+            translation_prompt = f"""다음 영문 블로그 포스트를 자연스러운 한국어로 번역해주세요.
 
 🚨🚨🚨 **절대적 명령: 반드시 한글로만 번역! 형식 반드시 유지!** 🚨🚨🚨
 
@@ -530,185 +634,167 @@ def process_single_keyword_dual_language():
   "title": "번역된 한글 제목 (15자 이내)",
   "content": "번역된 한글 본문 (⚠️ 반드시 빈 줄 포함, JSON에서 \\\\n\\\\n으로 표현, 소제목 다음 \\\\n\\\\n, 문단 끝 다음 \\\\n\\\\n, 영문과 동일한 구조 유지 필수)"
 }}"""
-        
-        translation_system_prompt = """당신은 전문 번역가입니다. 영문 블로그 포스트를 자연스러운 한국어로 번역합니다. 
+            
+            translation_system_prompt = """당신은 전문 번역가입니다. 영문 블로그 포스트를 자연스러운 한국어로 번역합니다. 
 🚨🚨🚨 **절대적 명령: 반드시 한글로만 번역! 형식 반드시 유지!** 🚨🚨🚨"""
-        
-        messages = [
-            {"role": "system", "content": translation_system_prompt},
-            {"role": "user", "content": translation_prompt}
-        ]
-        
-        translation_response = agent._call_llm(
-            messages,
-            response_format={"type": "json_object"}
-        )
-        
-        translated_content = json.loads(translation_response)
-        korean_title = translated_content.get("title", "")
-        korean_content_text = translated_content.get("content", "")
-        
-        # 이스케이프 복구 (여러 단계로 처리)
-        # 1단계: \\\\n → \\n (JSON 이스케이프 복구)
-        korean_content_text = korean_content_text.replace('\\\\n', '\n')
-        # 2단계: \\n → \n (일반 이스케이프 복구)
-        if '\\n' in korean_content_text:
-            korean_content_text = korean_content_text.replace('\\n', '\n')
-        
-        # 번역 전후 구조 비교
-        kor_paragraphs = len(re.findall(r'\n\n+', korean_content_text))
-        kor_headings = len(re.findall(r'^##\s+', korean_content_text, re.MULTILINE))
-        
-        print(f"  📊 구조 비교: 영문(빈줄:{eng_paragraphs}, 소제목:{eng_headings}) → 한글(빈줄:{kor_paragraphs}, 소제목:{kor_headings})")
-        
-        # 형식이 많이 손실된 경우 경고
-        if kor_paragraphs < eng_paragraphs * 0.5 or kor_headings < eng_headings * 0.5:
-            print(f"  ⚠️  경고: 형식이 많이 손실되었습니다! 형식 복구를 시도합니다...")
-        
-        # 형식 자동 수정
-        korean_content_text = fix_korean_content_format(korean_content_text)
-        
-        # 수정 후 다시 확인
-        kor_paragraphs_after = len(re.findall(r'\n\n+', korean_content_text))
-        kor_headings_after = len(re.findall(r'^##\s+', korean_content_text, re.MULTILINE))
-        print(f"  🔧 번역 후 형식 자동 수정 완료 (빈줄:{kor_paragraphs_after}, 소제목:{kor_headings_after})")
-        
-        # 한자/외국어 제거
-        from src.utils.helpers import remove_hanja_from_text
-        korean_content_text = remove_hanja_from_text(korean_content_text)
-        korean_title = remove_hanja_from_text(korean_title)
-        
-        # content_korean 딕셔너리 생성
-        content_korean = {
-            'title': korean_title,
-            'content': korean_content_text,
-            'summary': content_english.get('summary', ''),
-            'keywords': content_english.get('keywords', []),
-            'category': content_english.get('category', 'IT/컴퓨터')
-        }
-        
-        validated_results_korean = []
-        
-        # 기존 체인 프로세스 결과를 시뮬레이션
-        result_korean = {
-            'status': 'success',
-            'generated_content': content_korean
-        }
-        
-        if result_korean["status"] == "success":
-            # 한글 콘텐츠 검증 (형식 및 언어 - 통과될 때까지 반복)
-            print(f"\n  🔍 한글 콘텐츠 검증 시작... (형식 및 언어)")
-            content_korean = validate_and_fix_content(
-                content_korean,
-                keyword_name,
-                'korean',
-                validated_results_korean,
-                max_attempts=3
+            
+            messages = [
+                {"role": "system", "content": translation_system_prompt},
+                {"role": "user", "content": translation_prompt}
+            ]
+            
+            translation_response = agent._call_llm(
+                messages,
+                response_format={"type": "json_object"}
             )
             
-            # 검증 실패 시 경고만 하고 계속 진행 (외국어 포함만 체크)
-            if content_korean is None:
-                print(f"  ⚠️  한글 콘텐츠 검증 실패했지만, 외국어 포함 여부를 재확인 후 진행합니다.")
-                # 외국어(일본어, 중국어 등) 포함 여부만 재확인
-                from src.utils.helpers import remove_hanja_from_text
-                # content_korean이 None이므로 다시 가져오기
-                content_korean = result_korean['generated_content']
-                original_content = content_korean['content']
-                original_title = content_korean['title']
-                
-                # 한자/외국어 제거 후 재확인
-                cleaned_content = remove_hanja_from_text(original_content)
-                cleaned_title = remove_hanja_from_text(original_title)
-                
-                # 한자/외국어 제거 여부 확인
-                import re
-                hanja_pattern = re.compile(r'[一-龯\u3040-\u309F\u30A0-\u30FF\u3400-\u4DBF\u4E00-\u9FAF]')
-                has_foreign_chars = bool(hanja_pattern.search(cleaned_content + cleaned_title))
-                
-                if has_foreign_chars:
-                    print(f"  ❌ 한글 콘텐츠에 한자/일본어 등 외국어가 포함되어 포스팅을 중단합니다.")
-                    raise Exception("한글 콘텐츠 검증 실패: 한자/외국어 포함")
-                else:
-                    print(f"  ⚠️  외국어 포함은 없지만 품질/비율 검증 실패. 경고 후 계속 진행합니다.")
-                    content_korean['content'] = cleaned_content
-                    content_korean['title'] = cleaned_title
+            translated_content = json.loads(translation_response)
+            korean_title = translated_content.get("title", "")
+            korean_content_text = translated_content.get("content", "")
             
-            # 출처 및 면책문구 확인
-            content_korean['content'] = ensure_sources_and_disclaimer(content_korean['content'])
+            # 이스케이프 복구 (여러 단계로 처리)
+            # 1단계: \\\\n → \\n (JSON 이스케이프 복구)
+            korean_content_text = korean_content_text.replace('\\\\n', '\n')
+            # 2단계: \\n → \n (일반 이스케이프 복구)
+            if '\\n' in korean_content_text:
+                korean_content_text = korean_content_text.replace('\\n', '\n')
             
-            # 한글 포스팅
-            print(f"\n  📝 한글 포스팅 중...")
-            from src.services.notion import create_notion_page
-            database_id = os.getenv("NOTION_DATABASE_ID")
+            # 번역 전후 구조 비교
+            kor_paragraphs = len(re.findall(r'\n\n+', korean_content_text))
+            kor_headings = len(re.findall(r'^##\s+', korean_content_text, re.MULTILINE))
             
-            if not database_id and not notion_page_id:
-                print(f"  ❌ 한글 포스팅 실패: NOTION_DATABASE_ID 또는 NOTION_PARENT_PAGE_ID가 설정되지 않았습니다.")
-                return
+            print(f"  📊 구조 비교: 영문(빈줄:{eng_paragraphs}, 소제목:{eng_headings}) → 한글(빈줄:{kor_paragraphs}, 소제목:{kor_headings})")
             
-            notion_result_korean = create_notion_page(
-                title=content_korean['title'],
-                content=content_korean['content'],
-                parent_page_id=notion_page_id,
-                database_id=database_id
-            )
+            # 형식이 많이 손실된 경우 경고
+            if kor_paragraphs < eng_paragraphs * 0.5 or kor_headings < eng_headings * 0.5:
+                print(f"  ⚠️  경고: 형식이 많이 손실되었습니다! 형식 복구를 시도합니다...")
+            
+            # 형식 자동 수정
+            korean_content_text = fix_korean_content_format(korean_content_text)
+            
+            # 수정 후 다시 확인
+            kor_paragraphs_after = len(re.findall(r'\n\n+', korean_content_text))
+            kor_headings_after = len(re.findall(r'^##\s+', korean_content_text, re.MULTILINE))
+            print(f"  🔧 번역 후 형식 자동 수정 완료 (빈줄:{kor_paragraphs_after}, 소제목:{kor_headings_after})")
+            
+            # 한자/외국어 제거
+            from src.utils.helpers import remove_hanja_from_text
+            korean_content_text = remove_hanja_from_text(korean_content_text)
+            korean_title = remove_hanja_from_text(korean_title)
             
-            if notion_result_korean and notion_result_korean.get("status") == "success":
-                page_id_korean = notion_result_korean.get('page_id')
-                page_url_korean = notion_result_korean.get('page_url')
-                print(f"  ✅ 한글 포스팅 완료!")
-                print(f"     페이지 ID: {page_id_korean}")
-                print(f"     페이지 URL: {page_url_korean or 'N/A'}")
+            # content_korean 딕셔너리 생성
+            content_korean = {
+                'title': korean_title,
+                'content': korean_content_text,
+                'summary': content_english.get('summary', ''),
+                'keywords': content_english.get('keywords', []),
+                'category': content_english.get('category', 'IT/컴퓨터')
+            }
+            
+            validated_results_korean = []
+            
+            # 기존 체인 프로세스 결과를 시뮬레이션
+            result_korean = {
+                'status': 'success',
+                'generated_content': content_korean
+            }
+            
+            if result_korean["status"] == "success":
+                # 한글 콘텐츠 검증 (형식 및 언어 - 통과될 때까지 반복)
+                print(f"\n  🔍 한글 콘텐츠 검증 시작... (형식 및 언어)")
+                content_korean = validate_and_fix_content(
+                    content_korean,
+                    keyword_name,
+                    'korean',
+                    validated_results_korean,
+                    max_attempts=3
+                )
                 
-                # 데이터베이스에 저장
-                try:
-                    post_id_korean = db.create_post(
-                        keyword_id=keyword_id,
-                        title=content_korean['title'],
-                        content=content_korean['content'],
-                        search_results=[],
-                        status='published',
-                        language='korean'
-                    )
+                # 검증 실패 시 경고만 하고 계속 진행 (외국어 포함만 체크)
+                if content_korean is None:
+                    print(f"  ⚠️  한글 콘텐츠 검증 실패했지만, 외국어 포함 여부를 재확인 후 진행합니다.")
+                    # 외국어(일본어, 중국어 등) 포함 여부만 재확인
+                    from src.utils.helpers import remove_hanja_from_text
+                    # content_korean이 None이므로 다시 가져오기
+                    content_korean = result_korean['generated_content']
+                    original_content = content_korean['content']
+                    original_title = content_korean['title']
+                    
+                    # 한자/외국어 제거 후 재확인
+                    cleaned_content = remove_hanja_from_text(original_content)
+                    cleaned_title = remove_hanja_from_text(original_title)
                     
-                    if page_id_korean:
-                        db.update_post_published(post_id_korean, page_id_korean, page_url_korean or '')
-                        # 학습용 캐시 업데이트 (한글 최근 2건 유지)
-                        db.update_learning_cache(
-                            post_id=post_id_korean,
-                            language='korean',
-                            title=content_korean['title'],
-                            content=content_korean['content']
-                        )
-                except ValueError as e:
-                    if "중복" in str(e):
-                        print(f"  ⏭️  중복 포스트: {e}")
+                    # 한자/외국어 제거 여부 확인
+                    import re
+                    hanja_pattern = re.compile(r'[一-龯\u3040-\u309F\u30A0-\u30FF\u3400-\u4DBF\u4E00-\u9FAF]')
+                    has_foreign_chars = bool(hanja_pattern.search(cleaned_content + cleaned_title))
+                    
+                    if has_foreign_chars:
+                        print(f"  ❌ 한글 콘텐츠에 한자/일본어 등 외국어가 포함되어 포스팅을 중단합니다.")
+                        raise Exception("한글 콘텐츠 검증 실패: 한자/외국어 포함")
                     else:
-                        raise
+                        print(f"  ⚠️  외국어 포함은 없지만 품질/비율 검증 실패. 경고 후 계속 진행합니다.")
+                        content_korean['content'] = cleaned_content
+                        content_korean['title'] = cleaned_title
+                
+                # 출처 및 면책문구 확인
+                content_korean['content'] = ensure_sources_and_disclaimer(content_korean['content'])
+                korean_ready = True
             else:
-                error_msg = notion_result_korean.get("message", "알 수 없는 오류") if notion_result_korean else "결과를 받지 못함"
-                print(f"  ❌ 한글 포스팅 실패: {error_msg}")
-                return
-        else:
-            error_msg = result_korean.get('message', '알 수 없는 오류')
-            print(f"  ❌ 한글 콘텐츠 생성 실패: {error_msg}")
-            if "rate_limit" in str(error_msg).lower() or "Rate limit" in str(error_msg):
+                error_msg = result_korean.get('message', '알 수 없는 오류')
+                print(f"  ❌ 한글 콘텐츠 생성 실패: {error_msg}")
+                if "rate_limit" in str(error_msg).lower() or "Rate limit" in str(error_msg):
+                    rate_limit_error = True
+                    print(f"  ⚠️  Rate Limit 감지: 포스팅을 건너뜁니다.")
+        except Exception as e:
+            error_str = str(e)
+            print(f"  ❌ 한글 콘텐츠 생성 오류: {e}")
+            if "rate_limit" in error_str.lower() or "Rate limit" in error_str:
+                rate_limit_error = True
+            else:
+                import traceback
+                traceback.print_exc()
+    
+    # ============================================================
+    # 영문/한글 포스팅 (페이지 생성과 DB 기록은 서로 독립적이므로 동시 실행)
+    # 한글 콘텐츠가 실패하면 기존처럼 영문만 포스팅하고 종료
+    # ============================================================
+    publish_targets = [('english', content_english)]
+    if korean_ready:
+        publish_targets.append(('korean', content_korean))
+    
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    if not database_id and not notion_page_id:
+        print(f"  ❌ 포스팅 실패: NOTION_DATABASE_ID 또는 NOTION_PARENT_PAGE_ID가 설정되지 않았습니다.")
+        return
+    
+    publish_results = publish_posts(db, keyword_id, keyword_name, publish_targets, notion_page_id, database_id)
+    
+    for language, label in (('english', '영문'), ('korean', '한글')):
+        publish_result = publish_results.get(language)
+        if not publish_result:
+            continue
+        if publish_result["status"] != "success":
+            error_msg = publish_result.get("message", "알 수 없는 오류")
+            print(f"  ❌ {label} 포스팅 실패: {error_msg}")
+            if "rate_limit" in error_msg.lower() or "Rate limit" in error_msg:
                 rate_limit_error = True
-                print(f"  ⚠️  Rate Limit 감지: 포스팅을 건너뜁니다.")
             else:
                 return
-    except Exception as e:
-        error_str = str(e)
-        print(f"  ❌ 한글 콘텐츠 생성 오류: {e}")
-        if "rate_limit" in error_str.lower() or "Rate limit" in error_str:
-            rate_limit_error = True
+        elif language == 'english':
+            page_url_english = publish_result.get("page_url")
         else:
-            import traceback
-            traceback.print_exc()
+            page_url_korean = publish_result.get("page_url")
+    
+    if not korean_ready:
+        if not rate_limit_error:
             return
+        content_korean = None
     
     # ============================================================
     # 3단계: 포스팅 완료 및 키워드 변경
     # ============================================================
+    prefetch_thread = None
     if not rate_limit_error and page_url_english and page_url_korean:
         print(f"\n✅ 포스팅 완료!")
         print(f"   영문: {page_url_english}")
@@ -785,6 +871,9 @@ def process_single_keyword_dual_language():
                     else:
                         print(f"  💡 다음 키워드: [{next_seq}] {next_keyword_name}")
                         print(f"     (AUTO_ACTIVATE_NEXT_KEYWORD=true로 설정하면 자동 활성화됩니다)")
+                    
+                    # 다음 키워드 검색은 지금 미리 실행 (자기 학습과 동시에)
+                    prefetch_thread = start_next_keyword_prefetch(next_keyword_name)
                 else:
                     print(f"  🎉 모든 커리큘럼을 완료했습니다! (현재: [{current_seq}] {keyword_name})")
             else:
@@ -800,33 +889,36 @@ def process_single_keyword_dual_language():
         print(f"📚 자기 학습 시작 (최근 4건 분석)")
         print(f"{'='*60}\n")
         
-        # 한글 포스팅 분석 (캐시에서 최근 2건 가져오기)
-        print(f"  📚 한글 포스팅 분석 중... (캐시에서 최근 2건)")
-        korean_posts = db.get_cached_posts_for_learning('korean', limit=2)
-        if korean_posts:
-            print(f"     캐시된 한글 포스팅 {len(korean_posts)}건 발견 (Notion 참조 없음)")
-            # ContentGenerationAgent의 분석 기능 활용
-            from agents.content_agent import ContentGenerationAgent
-            content_agent = ContentGenerationAgent()
-            korean_analysis = content_agent._analyze_previous_posts_from_cache('korean', keyword_name, korean_posts)
-            print(f"     ✅ 한글 포스팅 분석 완료")
-        else:
-            print(f"     ⚠️  캐시된 한글 포스팅이 없습니다. (최초 포스팅 또는 캐시 미구축)")
+        # 한글/영문 포스팅 분석 (캐시에서 최근 2건씩, 두 분석은 독립적이므로 동시 실행)
+        from agents.content_agent import ContentGenerationAgent
+        from agents.base import run_async
+        content_agent = ContentGenerationAgent()
+        
+        analysis_targets = []
+        for language, label in (('korean', '한글'), ('english', '영문')):
+            print(f"  📚 {label} 포스팅 분석 중... (캐시에서 최근 2건)")
+            cached_posts = db.get_cached_posts_for_learning(language, limit=2)
+            if cached_posts:
+                print(f"     캐시된 {label} 포스팅 {len(cached_posts)}건 발견 (Notion 참조 없음)")
+                analysis_targets.append((language, label, cached_posts))
+            else:
+                print(f"     ⚠️  캐시된 {label} 포스팅이 없습니다. (최초 포스팅 또는 캐시 미구축)")
         
-        # 영문 포스팅 분석 (캐시에서 최근 2건 가져오기)
-        print(f"  📚 영문 포스팅 분석 중... (캐시에서 최근 2건)")
-        english_posts = db.get_cached_posts_for_learning('english', limit=2)
-        if english_posts:
-            print(f"     캐시된 영문 포스팅 {len(english_posts)}건 발견 (Notion 참조 없음)")
-            # ContentGenerationAgent의 분석 기능 활용
-            from agents.content_agent import ContentGenerationAgent
-            content_agent = ContentGenerationAgent()
-            english_analysis = content_agent._analyze_previous_posts_from_cache('english', keyword_name, english_posts)
-            print(f"     ✅ 영문 포스팅 분석 완료")
-        else:
-            print(f"     ⚠️  캐시된 영문 포스팅이 없습니다. (최초 포스팅 또는 캐시 미구축)")
+        async def analyze_all():
+            return await asyncio.gather(*[
+                content_agent._arun(content_agent._analyze_previous_posts_from_cache, language, keyword_name, cached_posts)
+                for language, _, cached_posts in analysis_targets
+            ])
+        
+        if analysis_targets:
+            run_async(analyze_all())
+            for _, label, _ in analysis_targets:
+                print(f"     ✅ {label} 포스팅 분석 완료")
         
         print(f"\n✅ 자기 학습 완료! 다음 포스팅에 개선 사항이 반영됩니다.")
+    
+    if prefetch_thread:
+        prefetch_thread.join()
 
 
 if __name__ == '__main__':
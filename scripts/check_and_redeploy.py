@@ -23,6 +23,37 @@ load_env_file()
 from src.core.database import Database
 
 
+def republish_outbox(db: Database) -> int:
+    """
+    오늘 outbox에 기록됐지만 게시되지 않은 콘텐츠를 저장된 내용 그대로 다시 게시 (LLM 호출 없음)
+    
+    Returns:
+        게시에 성공한 항목 수
+    """
+    from src.services.publish_outbox import get_unpublished_entries
+    from scripts.auto_poster import publish_post
+    
+    entries = get_unpublished_entries(db)
+    if not entries:
+        return 0
+    
+    print(f"📮 게시되지 않은 outbox 항목 {len(entries)}건 재게시 (저장된 콘텐츠 사용)...")
+    notion_page_id = os.getenv("NOTION_PARENT_PAGE_ID")
+    database_id = os.getenv("NOTION_DATABASE_ID")
+    
+    published = 0
+    for entry in entries:
+        content = {'title': entry['title'], 'content': entry['content']}
+        result = publish_post(db, entry.get('keyword_id'), entry['keyword'], entry['language'],
+                              content, notion_page_id, database_id)
+        if result.get("status") == "success":
+            published += 1
+        else:
+            print(f"  ❌ [{entry['language'].upper()}] '{entry['keyword']}' 재게시 실패: {result.get('message', '알 수 없는 오류')}")
+    print()
+    return published
+
+
 def check_recent_posts():
     """최근 포스팅 상태 확인"""
     load_env_file()
@@ -40,6 +71,9 @@ def check_recent_posts():
     print(f"확인 기준 시간: {today_9_10am_kst.strftime('%Y-%m-%d %H:%M:%S KST')} 이후 포스팅")
     print()
     
+    # 이전 실행에서 게시 도중 실패한 콘텐츠는 재생성 없이 먼저 게시
+    republish_outbox(db)
+    
     # 오늘 9시 10분 이후 포스팅 조회
     conn = db._get_connection()
     cursor = conn.cursor()
@@ -134,22 +168,29 @@ def check_recent_posts():
         
         try:
             from agents.agent_chain import AgentChain
-            from src.services.notion import create_notion_page
+            from src.services.publish_outbox import get_outbox_content, publish_once
             from scripts.auto_poster import ensure_sources_and_disclaimer
             
-            chain = AgentChain()
             notion_page_id = os.getenv("NOTION_PARENT_PAGE_ID")
             
-            # 콘텐츠 재생성
-            result = chain.process(keyword, notion_page_id, language=language, skip_posting=True)
+            # outbox에 오늘 콘텐츠가 있으면 그대로 사용, 없으면 콘텐츠 재생성
+            outbox_entry = get_outbox_content(db, keyword, language)
+            if outbox_entry:
+                print(f"     ♻️  outbox에 저장된 콘텐츠 사용 (재생성 생략)")
+                result = {"status": "success",
+                          "generated_content": {'title': outbox_entry['title'], 'content': outbox_entry['content']}}
+            else:
+                chain = AgentChain()
+                result = chain.process(keyword, notion_page_id, language=language, skip_posting=True)
             
             if result["status"] == "success":
                 content = result['generated_content']
                 content['content'] = ensure_sources_and_disclaimer(content['content'])
                 
-                # 재포스팅
+                # 재포스팅 (같은 페이지가 이미 있으면 새로 만들지 않음)
                 database_id = os.getenv("NOTION_DATABASE_ID")
-                notion_result = create_notion_page(
+                notion_result = publish_once(
+                    db, keyword_id, keyword, language,
                     title=content['title'],
                     content=content['content'],
                     parent_page_id=notion_page_id,
@@ -2,6 +2,7 @@
 SQLite 데이터베이스 관리
 """
 
+import os
 import sqlite3
 import json
 from datetime import datetime
@@ -11,6 +12,9 @@ from pathlib import Path
 
 class Database:
     def __init__(self, db_path: str = None):
+        if db_path is None:
+            # KEYWORDS_DB_PATH로 다른 DB 파일 사용 가능 (오프라인 벤치마크 등)
+            db_path = os.getenv("KEYWORDS_DB_PATH") or None
         if db_path is None:
             # 프로젝트 루트 기준으로 데이터베이스 경로 설정 (data/ 폴더)
             from src.core.config import get_project_root
@@ -104,6 +108,150 @@ class Database:
         except sqlite3.OperationalError:
             pass
         
+        # LLM 응답 캐시 테이블 (동일 프롬프트 재호출 방지)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                cache_key TEXT PRIMARY KEY,
+                agent_name TEXT,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                latency_seconds REAL DEFAULT 0,
+                hit_count INTEGER DEFAULT 0,
+                expires_at REAL NOT NULL,
+                last_accessed REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # LRU 정리용 인덱스
+        try:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache(last_accessed)")
+        except sqlite3.OperationalError:
+            pass
+        
+        # Groq API 키 상태 테이블 (서킷 브레이커, 프로세스 간 공유)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_key_health (
+                key_hash TEXT PRIMARY KEY,
+                key_name TEXT,
+                state TEXT DEFAULT 'closed',
+                error_rate REAL DEFAULT 0,
+                consecutive_failures INTEGER DEFAULT 0,
+                consecutive_rate_limits INTEGER DEFAULT 0,
+                open_until REAL DEFAULT 0,
+                open_count INTEGER DEFAULT 0,
+                reason TEXT,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 검색 결과 캐시 테이블 (정규화된 쿼리 + 제공자 + 결과 수 기준, TTL)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                provider TEXT NOT NULL,
+                query TEXT NOT NULL,
+                num_results INTEGER NOT NULL,
+                results TEXT NOT NULL,
+                is_empty INTEGER DEFAULT 0,
+                expires_at REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        try:
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_search_cache_expires_at ON search_cache(expires_at)")
+        except sqlite3.OperationalError:
+            pass
+        
+        # 다음 커리큘럼 키워드의 검색/검색 검증 결과 미리 가져오기 (키워드별 1건, TTL)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_prefetch (
+                keyword TEXT PRIMARY KEY,
+                search_result TEXT NOT NULL,
+                validation_result TEXT,
+                fact_check_result TEXT,
+                expires_at REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 검색 결과 원문 페이지 본문 캐시 (정규화한 URL 기준, TTL, 가져오기 실패는 빈 본문으로 짧게 캐시)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS page_cache (
+                url TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                status INTEGER,
+                expires_at REAL NOT NULL,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Notion 게시 outbox (키워드 + 언어 + 날짜별 1건, 시간 초과 후 재시도 시 중복 페이지/재생성 방지)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS publish_outbox (
+                idempotency_key TEXT PRIMARY KEY,
+                keyword_id TEXT,
+                keyword TEXT NOT NULL,
+                language TEXT NOT NULL,
+                publish_date TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                status TEXT DEFAULT 'pending',
+                notion_page_id TEXT,
+                notion_page_url TEXT,
+                post_id TEXT,
+                attempts INTEGER DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 외부 API 일일 할당량 사용량 (예: Google Custom Search 100건/일, 태평양 시간 기준)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS api_quota (
+                provider TEXT NOT NULL,
+                quota_date TEXT NOT NULL,
+                used INTEGER DEFAULT 0,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (provider, quota_date)
+            )
+        """)
+        
+        # 검색 제공자별 누적 통계 (헤지 검색 승률/지연 시간)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS search_provider_stats (
+                provider TEXT PRIMARY KEY,
+                calls INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                empty_results INTEGER DEFAULT 0,
+                total_latency REAL DEFAULT 0,
+                win_latency REAL DEFAULT 0,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 실행별 LLM 사용량 테이블 (토큰/소요 시간 추이 확인용)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_run_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                keyword TEXT,
+                language TEXT,
+                status TEXT,
+                calls INTEGER DEFAULT 0,
+                prompt_tokens INTEGER DEFAULT 0,
+                completion_tokens INTEGER DEFAULT 0,
+                total_tokens INTEGER DEFAULT 0,
+                wall_time REAL DEFAULT 0,
+                wait_seconds REAL DEFAULT 0,
+                retries INTEGER DEFAULT 0,
+                by_agent TEXT,
+                by_step TEXT,
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
         conn.commit()
         conn.close()
     
@@ -621,4 +769,461 @@ class Database:
         
         conn.commit()
         conn.close()
-
+    
+    def get_llm_cache(self, cache_key: str) -> Optional[Dict]:
+        """LLM 응답 캐시 조회 (만료된 항목 제외, 적중 시 접근 시간 갱신)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = time.time()
+        cursor.execute("""
+            SELECT response, latency_seconds, hit_count
+            FROM llm_cache
+            WHERE cache_key = ? AND expires_at > ?
+        """, (cache_key, now))
+        
+        row = cursor.fetchone()
+        
+        if row:
+            cursor.execute("""
+                UPDATE llm_cache
+                SET last_accessed = ?, hit_count = hit_count + 1
+                WHERE cache_key = ?
+            """, (now, cache_key))
+            conn.commit()
+        
+        conn.close()
+        
+        if row:
+            return {
+                'response': row['response'],
+                'latency_seconds': row['latency_seconds'] or 0.0,
+                'hit_count': row['hit_count'] + 1,
+            }
+        return None
+    
+    def set_llm_cache(self, cache_key: str, agent_name: str, model: str, response: str,
+                      latency_seconds: float, ttl_seconds: float, max_entries: int = 500):
+        """LLM 응답 캐시 저장 (만료 항목 삭제 후 LRU 기준으로 max_entries건 유지)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = time.time()
+        cursor.execute("""
+            INSERT OR REPLACE INTO llm_cache
+                (cache_key, agent_name, model, response, latency_seconds, hit_count, expires_at, last_accessed)
+            VALUES (?, ?, ?, ?, ?, 0, ?, ?)
+        """, (cache_key, agent_name, model, response, latency_seconds, now + ttl_seconds, now))
+        
+        # 만료된 항목 삭제
+        cursor.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+        
+        # 최근 사용 기준 max_entries건만 유지 (가장 오래 사용되지 않은 것 삭제)
+        cursor.execute("""
+            DELETE FROM llm_cache
+            WHERE cache_key IN (
+                SELECT cache_key FROM llm_cache
+                ORDER BY last_accessed DESC
+                LIMIT -1 OFFSET ?
+            )
+        """, (max_entries,))
+        
+        conn.commit()
+        conn.close()
+    
+    def save_llm_run_stats(self, keyword: str, language: str, status: str, usage: Dict) -> int:
+        """
+        에이전트 체인 1회 실행의 LLM 사용량 저장
+        
+        Args:
+            usage: {"total": {...}, "by_agent": {...}, "by_step": [...]} (AgentChain 결과의 llm_usage)
+        """
+        total = usage.get("total", {})
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO llm_run_stats
+                (keyword, language, status, calls, prompt_tokens, completion_tokens, total_tokens,
+                 wall_time, wait_seconds, retries, by_agent, by_step)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            keyword, language, status,
+            total.get("calls", 0), total.get("prompt_tokens", 0), total.get("completion_tokens", 0),
+            total.get("total_tokens", 0), total.get("wall_time", 0.0), total.get("wait_seconds", 0.0),
+            total.get("retries", 0),
+            json.dumps(usage.get("by_agent", {}), ensure_ascii=False),
+            json.dumps(usage.get("by_step", []), ensure_ascii=False)
+        ))
+        
+        run_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+        
+        return run_id
+    
+    def get_api_key_health(self) -> List[Dict]:
+        """저장된 API 키 상태 전체 조회"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT * FROM api_key_health")
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return [dict(row) for row in rows]
+    
+    def save_api_key_health(self, key_hash: str, key_name: str, state: str, error_rate: float,
+                            consecutive_failures: int, consecutive_rate_limits: int,
+                            open_until: float, open_count: int, reason: str):
+        """API 키 상태 저장 (키 자체가 아닌 해시로 식별)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT OR REPLACE INTO api_key_health
+                (key_hash, key_name, state, error_rate, consecutive_failures, consecutive_rate_limits,
+                 open_until, open_count, reason, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """, (key_hash, key_name, state, error_rate, consecutive_failures, consecutive_rate_limits,
+              open_until, open_count, reason))
+        
+        conn.commit()
+        conn.close()
+    
+    def record_search_provider_result(self, provider: str, latency: float, won: bool, empty: bool):
+        """검색 제공자 결과 1건 누적"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO search_provider_stats (provider, calls, wins, empty_results, total_latency, win_latency)
+            VALUES (?, 1, ?, ?, ?, ?)
+            ON CONFLICT(provider) DO UPDATE SET
+                calls = calls + 1,
+                wins = wins + excluded.wins,
+                empty_results = empty_results + excluded.empty_results,
+                total_latency = total_latency + excluded.total_latency,
+                win_latency = win_latency + excluded.win_latency,
+                updated_at = CURRENT_TIMESTAMP
+        """, (provider, 1 if won else 0, 1 if empty else 0, latency, latency if won else 0.0))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_search_provider_stats(self) -> List[Dict]:
+        """검색 제공자별 누적 통계 (승률/평균 지연 시간 포함)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT * FROM search_provider_stats ORDER BY provider")
+        rows = cursor.fetchall()
+        conn.close()
+        
+        stats = []
+        for row in rows:
+            item = dict(row)
+            item['win_rate'] = item['wins'] / item['calls'] if item['calls'] else 0.0
+            item['avg_latency'] = item['total_latency'] / item['calls'] if item['calls'] else 0.0
+            stats.append(item)
+        return stats
+    
+    def get_search_cache(self, cache_key: str) -> Optional[List[Dict]]:
+        """검색 결과 캐시 조회 (없거나 만료되면 None)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT results FROM search_cache
+            WHERE cache_key = ? AND expires_at > ?
+        """, (cache_key, time.time()))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        if row:
+            return json.loads(row['results'])
+        return None
+    
+    def set_search_cache(self, cache_key: str, provider: str, query: str, num_results: int,
+                         results: List[Dict], ttl_seconds: float):
+        """검색 결과 캐시 저장 (만료된 항목은 함께 삭제)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = time.time()
+        cursor.execute("""
+            INSERT OR REPLACE INTO search_cache
+                (cache_key, provider, query, num_results, results, is_empty, expires_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (cache_key, provider, query, num_results, json.dumps(results, ensure_ascii=False),
+              0 if results else 1, now + ttl_seconds))
+        
+        cursor.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_search_prefetch(self, keyword: str) -> Optional[Dict]:
+        """미리 가져온 검색 결과 조회 (없거나 만료되면 None)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT search_result, validation_result, fact_check_result, created_at FROM search_prefetch
+            WHERE keyword = ? AND expires_at > ?
+        """, (keyword, time.time()))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        if not row:
+            return None
+        return {
+            "search_result": json.loads(row['search_result']),
+            "validation_result": json.loads(row['validation_result']) if row['validation_result'] else None,
+            "fact_check_result": json.loads(row['fact_check_result']) if row['fact_check_result'] else None,
+            "created_at": row['created_at'],
+        }
+    
+    def save_search_prefetch(self, keyword: str, search_result: Dict, validation_result: Optional[Dict],
+                             fact_check_result: Optional[Dict], ttl_seconds: float):
+        """미리 가져온 검색 결과 저장 (만료된 항목은 함께 삭제)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = time.time()
+        cursor.execute("""
+            INSERT OR REPLACE INTO search_prefetch
+                (keyword, search_result, validation_result, fact_check_result, expires_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, (keyword, json.dumps(search_result, ensure_ascii=False),
+              json.dumps(validation_result, ensure_ascii=False) if validation_result is not None else None,
+              json.dumps(fact_check_result, ensure_ascii=False) if fact_check_result is not None else None,
+              now + ttl_seconds))
+        
+        cursor.execute("DELETE FROM search_prefetch WHERE expires_at <= ?", (now,))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_api_quota_used(self, provider: str, quota_date: str) -> int:
+        """해당 날짜의 API 할당량 사용량"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT used FROM api_quota WHERE provider = ? AND quota_date = ?", (provider, quota_date))
+        row = cursor.fetchone()
+        conn.close()
+        
+        return row['used'] if row else 0
+    
+    def try_consume_api_quota(self, provider: str, quota_date: str, allowance: int) -> tuple:
+        """
+        할당량 1건 차감 (여러 프로세스가 동시에 호출해도 allowance를 넘지 않도록 트랜잭션으로 처리)
+        
+        Returns:
+            (차감 성공 여부, 현재 사용량)
+        """
+        conn = self._get_connection()
+        conn.isolation_level = None
+        cursor = conn.cursor()
+        
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT used FROM api_quota WHERE provider = ? AND quota_date = ?", (provider, quota_date))
+            row = cursor.fetchone()
+            used = row['used'] if row else 0
+            
+            if used >= allowance:
+                cursor.execute("COMMIT")
+                return False, used
+            
+            cursor.execute("""
+                INSERT INTO api_quota (provider, quota_date, used) VALUES (?, ?, 1)
+                ON CONFLICT(provider, quota_date) DO UPDATE SET used = used + 1, updated_at = CURRENT_TIMESTAMP
+            """, (provider, quota_date))
+            cursor.execute("COMMIT")
+            return True, used + 1
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+    
+    def mark_api_quota_exhausted(self, provider: str, quota_date: str, limit: int):
+        """서버가 할당량 소진을 알려 준 경우 사용량을 한도로 설정"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO api_quota (provider, quota_date, used) VALUES (?, ?, ?)
+            ON CONFLICT(provider, quota_date) DO UPDATE SET used = MAX(used, excluded.used), updated_at = CURRENT_TIMESTAMP
+        """, (provider, quota_date, limit))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_page_cache(self, url: str) -> Optional[str]:
+        """페이지 본문 캐시 조회 (없거나 만료되면 None, 가져오기 실패로 캐시된 경우 빈 문자열)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT text FROM page_cache
+            WHERE url = ? AND expires_at > ?
+        """, (url, time.time()))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        return row['text'] if row else None
+    
+    def set_page_cache(self, url: str, text: str, status: Optional[int], ttl_seconds: float):
+        """페이지 본문 캐시 저장 (만료된 항목은 함께 삭제)"""
+        import time
+        
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        now = time.time()
+        cursor.execute("""
+            INSERT OR REPLACE INTO page_cache (url, text, status, expires_at)
+            VALUES (?, ?, ?, ?)
+        """, (url, text, status, now + ttl_seconds))
+        
+        cursor.execute("DELETE FROM page_cache WHERE expires_at <= ?", (now,))
+        
+        conn.commit()
+        conn.close()
+    
+    def get_publish_outbox(self, idempotency_key: str) -> Optional[Dict]:
+        """게시 outbox 항목 조회 (없으면 None)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("SELECT * FROM publish_outbox WHERE idempotency_key = ?", (idempotency_key,))
+        
+        row = cursor.fetchone()
+        conn.close()
+        
+        return dict(row) if row else None
+    
+    def get_unpublished_outbox(self, publish_date: str) -> List[Dict]:
+        """해당 날짜에 게시되지 않은(pending/failed) outbox 항목"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT * FROM publish_outbox
+            WHERE publish_date = ? AND status != 'published'
+            ORDER BY created_at
+        """, (publish_date,))
+        
+        rows = cursor.fetchall()
+        conn.close()
+        
+        return [dict(row) for row in rows]
+    
+    def save_publish_outbox(self, idempotency_key: str, keyword_id: Optional[str], keyword: str, language: str,
+                            publish_date: str, title: str, content: str):
+        """
+        게시 직전 콘텐츠를 outbox에 기록 (pending, 시도 횟수 증가)
+        
+        이미 게시된 항목은 바꾸지 않고, 미완성 페이지가 있는 항목은 상태를 유지합니다.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            INSERT INTO publish_outbox
+                (idempotency_key, keyword_id, keyword, language, publish_date, title, content, status, attempts)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', 1)
+            ON CONFLICT(idempotency_key) DO UPDATE SET
+                title = excluded.title,
+                content = excluded.content,
+                status = CASE WHEN publish_outbox.notion_page_id IS NULL THEN 'pending' ELSE publish_outbox.status END,
+                attempts = attempts + 1,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE publish_outbox.status != 'published'
+        """, (idempotency_key, keyword_id, keyword, language, publish_date, title, content))
+        
+        conn.commit()
+        conn.close()
+    
+    def mark_publish_outbox_created(self, idempotency_key: str, notion_page_id: str, notion_page_url: str):
+        """
+        페이지가 생성된 직후 page_id 기록 (created: 블록 추가가 끝나기 전, 게시 완료 아님)
+        
+        이후 블록 추가에 실패해도 다음 시도에서 이 페이지를 이어서 완성하거나 보관 처리할 수 있습니다.
+        """
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE publish_outbox
+            SET status = 'created', notion_page_id = ?, notion_page_url = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE idempotency_key = ? AND status != 'published'
+        """, (notion_page_id, notion_page_url, idempotency_key))
+        
+        conn.commit()
+        conn.close()
+    
+    def clear_publish_outbox_page(self, idempotency_key: str):
+        """미완성 페이지를 보관 처리한 뒤 outbox 항목의 page_id 제거 (pending으로 되돌림)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE publish_outbox
+            SET status = 'pending', notion_page_id = NULL, notion_page_url = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE idempotency_key = ? AND status != 'published'
+        """, (idempotency_key,))
+        
+        conn.commit()
+        conn.close()
+    
+    def mark_publish_outbox_published(self, idempotency_key: str, notion_page_id: str, notion_page_url: str,
+                                      post_id: Optional[str] = None):
+        """outbox 항목을 게시 완료로 표시"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE publish_outbox
+            SET status = 'published', notion_page_id = ?, notion_page_url = ?,
+                post_id = COALESCE(?, post_id), last_error = NULL, updated_at = CURRENT_TIMESTAMP
+            WHERE idempotency_key = ?
+        """, (notion_page_id, notion_page_url, post_id, idempotency_key))
+        
+        conn.commit()
+        conn.close()
+    
+    def mark_publish_outbox_failed(self, idempotency_key: str, error: str):
+        """outbox 항목에 게시 실패 기록 (게시 완료 항목은 그대로, 생성된 page_id는 유지)"""
+        conn = self._get_connection()
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            UPDATE publish_outbox
+            SET status = 'failed', last_error = ?, updated_at = CURRENT_TIMESTAMP
+            WHERE idempotency_key = ? AND status != 'published'
+        """, (error[:1000], idempotency_key))
+        
+        conn.commit()
+        conn.close()
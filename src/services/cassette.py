@@ -0,0 +1,237 @@
+"""
+HTTP 녹화/재생 (카세트)
+- 녹화 모드: 공용 세션(create_session)으로 나가는 모든 요청/응답을 카세트 파일(JSONL)에 저장
+- 재생 모드: 네트워크 없이 카세트의 응답을 그대로 돌려줌 (녹화 당시 지연 시간을 배율로 재현 가능)
+- Groq(_call_groq), Google/DuckDuckGo 검색, Notion 페이지 생성이 모두 같은 세션 생성 함수를 사용하므로
+  process_single_keyword_dual_language 전체 실행을 반복 가능한 성능 측정 환경으로 만들 수 있음
+
+환경 변수:
+- HTTP_CASSETTE_MODE: record / replay (없으면 사용 안 함)
+- HTTP_CASSETTE_PATH: 카세트 파일 경로 (기본값 data/cassettes/http_cassette.jsonl)
+- HTTP_CASSETTE_TIME_SCALE: 재생 시 녹화된 지연 시간 배율 (기본값 0 = 지연 없이 즉시 응답, 1 = 녹화 당시와 동일)
+"""
+
+import io
+import os
+import json
+import time
+import base64
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.response import HTTPResponse
+
+
+# 카세트에 저장하지 않는 값 (API 키 등)
+_SECRET_QUERY_PARAMS = {"key", "cx", "api_key", "apikey"}
+_SECRET_HEADERS = {"authorization", "cookie", "set-cookie", "x-api-key"}
+
+
+class CassetteMissError(requests.exceptions.ConnectionError):
+    """재생 모드에서 카세트에 없는 요청"""
+
+
+def _redact_url(url: str) -> str:
+    """URL에서 비밀 쿼리 파라미터 제거"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in _SECRET_QUERY_PARAMS]
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
+def _endpoint(method: str, url: str) -> str:
+    """순서 기반 매칭용 엔드포인트 (메서드 + 호스트 + 경로)"""
+    parts = urlsplit(url)
+    return f"{method.upper()} {parts.netloc}{parts.path}"
+
+
+def _body_bytes(body) -> bytes:
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    return b""
+
+
+def _request_key(method: str, url: str, body) -> str:
+    """정확한 매칭용 요청 키 (메서드 + 비밀 값을 뺀 URL + 본문 해시)"""
+    digest = hashlib.sha256(_body_bytes(body)).hexdigest()
+    return f"{method.upper()} {_redact_url(url)} {digest}"
+
+
+def _encode_body(content: bytes) -> Tuple[str, str]:
+    """응답 본문 저장 형식 (UTF-8 텍스트가 아니면 base64)"""
+    try:
+        return content.decode("utf-8"), "text"
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode("ascii"), "base64"
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if entry.get("body_encoding") == "base64":
+        return base64.b64decode(entry.get("body", ""))
+    return entry.get("body", "").encode("utf-8")
+
+
+class Cassette:
+    """
+    카세트 파일 (녹화된 요청/응답 목록)
+
+    재생 시 같은 요청(메서드, URL, 본문)이 있으면 녹화된 순서대로 돌려주고,
+    프롬프트에 날짜가 들어가는 등 본문이 달라진 경우 같은 엔드포인트의 다음 응답을 사용합니다.
+    """
+
+    def __init__(self, path: str, mode: str, time_scale: float = 0.0):
+        self.path = Path(path)
+        self.mode = mode
+        self.time_scale = time_scale
+        self._lock = threading.Lock()
+
+        self.entries: List[Dict[str, Any]] = []
+        self._by_key: Dict[str, List[int]] = {}
+        self._by_endpoint: Dict[str, List[int]] = {}
+        self._used = set()
+        self.stats = {"recorded": 0, "replayed": 0, "fallback": 0, "missed": 0, "replayed_seconds": 0.0}
+
+        if mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text("", encoding="utf-8")
+        elif mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"카세트 파일이 없습니다: {self.path}")
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._index(json.loads(line))
+
+    def _index(self, entry: Dict[str, Any]):
+        index = len(self.entries)
+        self.entries.append(entry)
+        self._by_key.setdefault(entry["key"], []).append(index)
+        self._by_endpoint.setdefault(entry["endpoint"], []).append(index)
+
+    def record(self, request: requests.PreparedRequest, status: int, reason: str,
+               headers: Dict[str, str], content: bytes, elapsed: float):
+        """요청/응답 1건 녹화"""
+        body, body_encoding = _encode_body(content)
+        entry = {
+            "key": _request_key(request.method, request.url, request.body),
+            "endpoint": _endpoint(request.method, request.url),
+            "method": request.method,
+            "url": _redact_url(request.url),
+            "status": status,
+            "reason": reason,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in _SECRET_HEADERS},
+            "body": body,
+            "body_encoding": body_encoding,
+            "elapsed": elapsed,
+            "recorded_at": time.time(),
+        }
+        with self._lock:
+            self._index(entry)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self.stats["recorded"] += 1
+
+    def find(self, request: requests.PreparedRequest) -> Optional[Dict[str, Any]]:
+        """재생할 응답 찾기 (정확한 매칭 → 같은 엔드포인트의 다음 응답)"""
+        key = _request_key(request.method, request.url, request.body)
+        endpoint = _endpoint(request.method, request.url)
+
+        with self._lock:
+            for indexes, stat in ((self._by_key.get(key, []), "replayed"), (self._by_endpoint.get(endpoint, []), "fallback")):
+                for index in indexes:
+                    if index not in self._used:
+                        self._used.add(index)
+                        self.stats[stat] += 1
+                        return self.entries[index]
+
+            # 모두 사용했으면 마지막으로 녹화된 같은 요청을 다시 사용
+            indexes = self._by_key.get(key) or self._by_endpoint.get(endpoint)
+            if indexes:
+                self.stats["replayed"] += 1
+                return self.entries[indexes[-1]]
+
+            self.stats["missed"] += 1
+            return None
+
+
+class CassetteAdapter(HTTPAdapter):
+    """녹화/재생용 requests 어댑터 (create_session에서 기존 어댑터 대신 마운트)"""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if self.cassette.mode == "replay":
+            return self._replay(request)
+
+        started_at = time.monotonic()
+        response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        content = response.content  # 스트리밍 응답도 전부 읽어서 녹화
+        elapsed = time.monotonic() - started_at
+
+        self.cassette.record(request, response.status_code, response.reason, dict(response.headers), content, elapsed)
+        return self._build_response(request, response.status_code, response.reason, dict(response.headers), content)
+
+    def _replay(self, request):
+        entry = self.cassette.find(request)
+        if entry is None:
+            raise CassetteMissError(f"카세트에 없는 요청: {request.method} {_redact_url(request.url)}", request=request)
+
+        delay = entry.get("elapsed", 0.0) * self.cassette.time_scale
+        if delay > 0:
+            time.sleep(delay)
+            with self.cassette._lock:
+                self.cassette.stats["replayed_seconds"] += delay
+
+        return self._build_response(request, entry["status"], entry.get("reason", ""), entry.get("headers", {}), _decode_body(entry))
+
+    def _build_response(self, request, status: int, reason: str, headers: Dict[str, str], content: bytes) -> requests.Response:
+        # 압축/청크 전송은 이미 풀린 상태로 저장되므로 해당 헤더는 제거
+        headers = {k: v for k, v in headers.items() if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")}
+        raw = HTTPResponse(
+            body=io.BytesIO(content),
+            headers=headers,
+            status=status,
+            reason=reason,
+            preload_content=False,
+            decode_content=False
+        )
+        response = self.build_response(request, raw)
+        response.headers = CaseInsensitiveDict(headers)
+        return response
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """환경 변수 설정에 따른 공용 카세트 (사용 안 하면 None)"""
+    global _cassette
+
+    mode = (os.getenv("HTTP_CASSETTE_MODE") or "").strip().lower()
+    if mode not in ("record", "replay"):
+        return None
+
+    if _cassette is None:
+        with _cassette_lock:
+            if _cassette is None:
+                from src.core.config import get_project_root
+                default_path = get_project_root() / "data" / "cassettes" / "http_cassette.jsonl"
+                path = os.getenv("HTTP_CASSETTE_PATH") or str(default_path)
+                time_scale = float(os.getenv("HTTP_CASSETTE_TIME_SCALE", "0"))
+                _cassette = Cassette(path, mode, time_scale)
+                action = "녹화" if mode == "record" else f"재생 (지연 배율 {time_scale:g})"
+                print(f"  📼 HTTP 카세트 {action}: {path}")
+
+    return _cassette
@@ -0,0 +1,265 @@
+"""
+Groq API 키 서킷 브레이커 (키 상태를 DB에 저장해 프로세스 간 공유)
+- 키별 최근 에러율과 연속 429 횟수 추적
+- 일일 한도가 소진된 키는 다음 일일 초기화 시각까지 회로를 열어 호출하지 않음
+- cron, check_and_redeploy, translate_english_to_korean 등 새 프로세스도
+  이미 소진된 키를 다시 호출해 보는 왕복 비용 없이 바로 건너뜀
+
+상태:
+- closed: 정상 사용
+- open: open_until까지 사용하지 않음
+- half_open: open_until이 지나 한 번만 시험 호출 (성공하면 closed, 실패하면 다시 open)
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+
+
+# 일일 한도 소진을 나타내는 429 메시지 (예: "Limit 100000, Used 99980 ... tokens per day (TPD)")
+_DAILY_LIMIT_PATTERN = re.compile(r'per day|\(RPD\)|\(TPD\)|daily', re.IGNORECASE)
+
+
+def next_daily_reset(now: Optional[float] = None, reset_hour_utc: Optional[int] = None) -> float:
+    """
+    다음 일일 한도 초기화 시각 (epoch 초)
+
+    GROQ_DAILY_RESET_UTC_HOUR(기본값 0 = 한국 시간 오전 9시)를 사용합니다.
+    """
+    if reset_hour_utc is None:
+        reset_hour_utc = int(os.getenv("GROQ_DAILY_RESET_UTC_HOUR", "0"))
+
+    now_dt = datetime.fromtimestamp(now if now is not None else time.time(), tz=timezone.utc)
+    reset = now_dt.replace(hour=reset_hour_utc, minute=0, second=0, microsecond=0)
+    if reset <= now_dt:
+        reset += timedelta(days=1)
+    return reset.timestamp()
+
+
+def key_fingerprint(api_key: str) -> str:
+    """API 키 식별자 (키 자체는 저장하지 않음)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class KeyHealth:
+    """API 키 하나의 상태"""
+
+    def __init__(self, key_hash: str, key_name: str):
+        self.key_hash = key_hash
+        self.key_name = key_name
+        self.state = "closed"
+        self.error_rate = 0.0
+        self.consecutive_failures = 0
+        self.consecutive_rate_limits = 0
+        self.open_until = 0.0
+        self.open_count = 0
+        self.reason = ""
+        self.probing = False  # half_open 상태에서 시험 호출 진행 중 (저장 안 함)
+
+    def to_row(self) -> Dict:
+        return {
+            "key_hash": self.key_hash,
+            "key_name": self.key_name,
+            "state": self.state,
+            "error_rate": self.error_rate,
+            "consecutive_failures": self.consecutive_failures,
+            "consecutive_rate_limits": self.consecutive_rate_limits,
+            "open_until": self.open_until,
+            "open_count": self.open_count,
+            "reason": self.reason,
+        }
+
+    @classmethod
+    def from_row(cls, row: Dict, key_name: str) -> "KeyHealth":
+        health = cls(row["key_hash"], key_name)
+        health.state = row.get("state") or "closed"
+        health.error_rate = row.get("error_rate") or 0.0
+        health.consecutive_failures = row.get("consecutive_failures") or 0
+        health.consecutive_rate_limits = row.get("consecutive_rate_limits") or 0
+        health.open_until = row.get("open_until") or 0.0
+        health.open_count = row.get("open_count") or 0
+        health.reason = row.get("reason") or ""
+        return health
+
+
+class GroqCircuitBreaker:
+    """
+    키별 서킷 브레이커
+
+    환경 변수:
+    - GROQ_BREAKER_ENABLED: 사용 여부 (기본값 true)
+    - GROQ_BREAKER_RATE_LIMIT_STREAK: 회로를 여는 연속 429 횟수 (기본값 3)
+    - GROQ_BREAKER_FAILURE_STREAK: 회로를 여는 연속 오류(네트워크/5xx) 횟수 (기본값 3)
+    - GROQ_BREAKER_COOLDOWN_SECONDS: 일시적 문제로 연 회로의 기본 유지 시간 (기본값 60, 반복될수록 2배)
+    - GROQ_BREAKER_DAILY_THRESHOLD_SECONDS: retry-after가 이 이상이면 일일 한도 소진으로 판단 (기본값 600)
+    - GROQ_DAILY_RESET_UTC_HOUR: 일일 한도 초기화 시각 (UTC 시, 기본값 0)
+    """
+
+    ERROR_RATE_WEIGHT = 0.2
+
+    def __init__(self, api_keys: List[str], key_names: List[str], db=None):
+        self.enabled = os.getenv("GROQ_BREAKER_ENABLED", "true").lower() == "true"
+        self.rate_limit_streak = int(os.getenv("GROQ_BREAKER_RATE_LIMIT_STREAK", "3"))
+        self.failure_streak = int(os.getenv("GROQ_BREAKER_FAILURE_STREAK", "3"))
+        self.cooldown = float(os.getenv("GROQ_BREAKER_COOLDOWN_SECONDS", "60"))
+        self.daily_threshold = float(os.getenv("GROQ_BREAKER_DAILY_THRESHOLD_SECONDS", "600"))
+
+        self.db = db
+        self._lock = threading.Lock()
+        self.keys: List[KeyHealth] = [
+            KeyHealth(key_fingerprint(api_key), key_name) for api_key, key_name in zip(api_keys, key_names)
+        ]
+
+        if self.enabled and self.db is not None:
+            self._load()
+
+    def _load(self):
+        """저장된 키 상태 불러오기 (다른 프로세스가 기록한 상태 포함)"""
+        try:
+            rows = {row["key_hash"]: row for row in self.db.get_api_key_health()}
+        except Exception as e:
+            print(f"  ⚠️  API 키 상태 불러오기 실패: {e}")
+            return
+
+        now = time.time()
+        for i, health in enumerate(self.keys):
+            row = rows.get(health.key_hash)
+            if row:
+                self.keys[i] = KeyHealth.from_row(row, health.key_name)
+                if self.keys[i].state == "open" and self.keys[i].open_until > now:
+                    remaining = self.keys[i].open_until - now
+                    print(f"  🚫 {health.key_name} 회로 열림 ({self.keys[i].reason}, {remaining / 60:.0f}분 후 재시도)")
+
+    def _save(self, health: KeyHealth):
+        if self.db is None:
+            return
+        try:
+            self.db.save_api_key_health(**health.to_row())
+        except Exception as e:
+            print(f"  ⚠️  API 키 상태 저장 실패: {e}")
+
+    def _open(self, health: KeyHealth, until: float, reason: str):
+        health.state = "open"
+        health.open_until = until
+        health.open_count += 1
+        health.reason = reason
+        remaining = max(0.0, until - time.time())
+        print(f"  🚫 {health.key_name} 회로 열림: {reason} ({remaining / 60:.1f}분 동안 사용 안 함)")
+
+    def _cooldown_for(self, health: KeyHealth, hint: Optional[float] = None) -> float:
+        """반복해서 열릴수록 길어지는 유지 시간 (최대 1시간)"""
+        cooldown = min(3600.0, self.cooldown * (2 ** min(health.open_count, 6)))
+        return max(cooldown, hint or 0.0)
+
+    def blocked_indices(self) -> Set[int]:
+        """
+        지금 호출하면 안 되는 키 인덱스
+
+        open_until이 지난 키는 half_open으로 바꿔 시험 호출 1번을 허용합니다.
+        """
+        if not self.enabled:
+            return set()
+
+        blocked = set()
+        now = time.time()
+        with self._lock:
+            for i, health in enumerate(self.keys):
+                if health.state == "open":
+                    if now < health.open_until:
+                        blocked.add(i)
+                    else:
+                        health.state = "half_open"
+                elif health.state == "half_open" and health.probing:
+                    blocked.add(i)
+        return blocked
+
+    def retry_after(self) -> Optional[float]:
+        """열린 회로 중 가장 빨리 닫히는 키까지 남은 시간"""
+        now = time.time()
+        with self._lock:
+            waits = [h.open_until - now for h in self.keys if h.state == "open" and h.open_until > now]
+        return min(waits) if waits else None
+
+    def on_attempt(self, key_index: int):
+        """호출 직전 (half_open 키는 동시에 한 번만 시험)"""
+        with self._lock:
+            health = self.keys[key_index]
+            if health.state == "half_open":
+                health.probing = True
+
+    def end_attempt(self, key_index: int):
+        """호출 직후 (성공/실패를 기록하지 못하고 끝난 시험 호출도 다음 시험을 막지 않도록 해제)"""
+        with self._lock:
+            self.keys[key_index].probing = False
+
+    def record_success(self, key_index: int):
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self.keys[key_index]
+            changed = health.state != "closed" or health.consecutive_failures or health.consecutive_rate_limits
+            if health.state == "half_open":
+                print(f"  ✅ {health.key_name} 회로 닫힘 (시험 호출 성공)")
+            health.state = "closed"
+            health.probing = False
+            health.consecutive_failures = 0
+            health.consecutive_rate_limits = 0
+            health.open_count = 0
+            health.reason = ""
+            previous_rate = health.error_rate
+            health.error_rate *= (1 - self.ERROR_RATE_WEIGHT)
+            # 상태가 바뀌었거나 에러율이 의미 있게 떨어졌을 때만 저장
+            if changed or previous_rate - health.error_rate > 0.05:
+                self._save(health)
+
+    def record_rate_limited(self, key_index: int, retry_after: Optional[float] = None, message: str = ""):
+        """429 응답 기록 (일일 한도 소진이면 다음 초기화 시각까지 회로 열기)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self.keys[key_index]
+            health.probing = False
+            health.consecutive_rate_limits += 1
+            health.error_rate = health.error_rate * (1 - self.ERROR_RATE_WEIGHT) + self.ERROR_RATE_WEIGHT
+
+            daily = bool(_DAILY_LIMIT_PATTERN.search(message or "")) or (retry_after is not None and retry_after >= self.daily_threshold)
+            if daily:
+                until = time.time() + retry_after if retry_after else next_daily_reset()
+                self._open(health, until, "일일 한도 소진")
+            elif health.state == "half_open":
+                self._open(health, time.time() + self._cooldown_for(health, retry_after), "시험 호출 중 Rate Limit")
+            elif health.consecutive_rate_limits >= self.rate_limit_streak:
+                self._open(health, time.time() + self._cooldown_for(health, retry_after), f"연속 Rate Limit {health.consecutive_rate_limits}회")
+            self._save(health)
+
+    def record_failure(self, key_index: int, status_code: Optional[int] = None, message: str = ""):
+        """429 이외의 오류 기록 (인증 오류는 바로 회로 열기)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            health = self.keys[key_index]
+            health.probing = False
+            health.consecutive_failures += 1
+            health.error_rate = health.error_rate * (1 - self.ERROR_RATE_WEIGHT) + self.ERROR_RATE_WEIGHT
+
+            if status_code in (401, 403):
+                # 잘못되었거나 폐기된 키: 다음 일일 초기화까지 사용 안 함
+                self._open(health, next_daily_reset(), f"인증 오류 ({status_code})")
+            elif health.state == "half_open":
+                self._open(health, time.time() + self._cooldown_for(health), "시험 호출 실패")
+            elif health.consecutive_failures >= self.failure_streak:
+                self._open(health, time.time() + self._cooldown_for(health), f"연속 오류 {health.consecutive_failures}회")
+            self._save(health)
+
+    def snapshot(self) -> List[Dict]:
+        """키별 상태 (디버깅용)"""
+        now = time.time()
+        with self._lock:
+            return [
+                {**health.to_row(), "open_for": max(0.0, health.open_until - now)}
+                for health in self.keys
+            ]
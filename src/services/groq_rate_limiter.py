@@ -0,0 +1,302 @@
+"""
+Groq API 키별 Rate Limit 스케줄러 (토큰 버킷)
+- 응답 헤더(x-ratelimit-*)로 키별 요청/토큰 잔여량 추적
+- 호출 전에 여유가 가장 많은 키를 선택
+- 모든 키가 소진되면 실패 대신 버킷이 다시 찰 때까지 대기
+"""
+
+import os
+import re
+import time
+import random
+import threading
+from typing import Dict, List, Optional, Iterable, Tuple
+
+
+_DURATION_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Groq 헤더의 시간 문자열을 초 단위로 변환
+
+    예: "2m59.56s" → 179.56, "7.66s" → 7.66, "120ms" → 0.12, "30" → 30.0
+    """
+    if value is None:
+        return None
+
+    value = str(value).strip()
+    if not value:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    total = 0.0
+    matched = False
+    for number, unit in _DURATION_PATTERN.findall(value):
+        matched = True
+        number = float(number)
+        if unit == 'h':
+            total += number * 3600
+        elif unit == 'm':
+            total += number * 60
+        elif unit == 's':
+            total += number
+        elif unit == 'ms':
+            total += number / 1000
+
+    return total if matched else None
+
+
+def _header_float(headers, name: str) -> Optional[float]:
+    """헤더 값을 float으로 읽기 (없거나 잘못된 값이면 None)"""
+    value = headers.get(name) if headers else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GroqRateLimitError(Exception):
+    """모든 키가 Rate Limit에 걸린 경우 (retry_after: 서버가 알려준 대기 시간)"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def retry_delay_from_headers(headers) -> Optional[float]:
+    """
+    429 응답 헤더에서 재시도까지 기다릴 시간 계산
+
+    retry-after가 있으면 우선 사용하고, 없으면 소진된 항목(요청/토큰)의
+    x-ratelimit-reset-* 값을 사용합니다.
+    """
+    if not headers:
+        return None
+
+    retry_after = parse_duration(headers.get("retry-after"))
+    if retry_after is not None:
+        return retry_after
+
+    resets = []
+    for kind in ("requests", "tokens"):
+        reset = parse_duration(headers.get(f"x-ratelimit-reset-{kind}"))
+        remaining = _header_float(headers, f"x-ratelimit-remaining-{kind}")
+        if reset is not None and (remaining is None or remaining <= 0):
+            resets.append(reset)
+
+    return max(resets) if resets else None
+
+
+def backoff_delay(attempt: int, hint: Optional[float] = None, base: float = 1.0, cap: float = 60.0) -> float:
+    """
+    지터가 적용된 지수 백오프 대기 시간
+
+    Args:
+        attempt: 재시도 회차 (0부터)
+        hint: 서버가 알려준 대기 시간 (있으면 최소 이 시간은 대기)
+        base: 첫 대기 시간
+        cap: 최대 대기 시간
+    """
+    exponential = min(cap, base * (2 ** attempt))
+    delay = random.uniform(exponential / 2, exponential)
+    if hint is not None:
+        # 여러 프로세스가 동시에 깨어나지 않도록 서버 힌트에도 약간의 지터 추가
+        delay = max(delay, hint + random.uniform(0, min(1.0, hint * 0.1 + 0.1)))
+    return delay
+
+
+class TokenBucket:
+    """용량(capacity)과 초당 충전량(refill_rate)을 가진 토큰 버킷"""
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.level = capacity
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        """경과 시간만큼 충전"""
+        elapsed = max(0.0, now - self.updated_at)
+        self.level = min(self.capacity, self.level + elapsed * self.refill_rate)
+        self.updated_at = now
+
+    def _fit(self, amount: float) -> float:
+        """
+        용량보다 큰 요청은 버킷이 가득 찼을 때 허용하도록 용량으로 제한
+
+        (제한하지 않으면 가득 찬 버킷에서도 여유가 음수로 남아 대기 시간 0으로 계속 기다림)
+        """
+        return min(amount, self.capacity)
+
+    def fraction_after(self, amount: float) -> float:
+        """amount 사용 후 남는 비율 (음수면 부족)"""
+        if self.capacity <= 0:
+            return 0.0
+        return (self.level - self._fit(amount)) / self.capacity
+
+    def wait_time(self, amount: float) -> float:
+        """amount를 사용할 수 있을 때까지 남은 시간 (초)"""
+        amount = self._fit(amount)
+        if self.level >= amount:
+            return 0.0
+        if self.refill_rate <= 0:
+            return float('inf')
+        return (amount - self.level) / self.refill_rate
+
+    def consume(self, amount: float):
+        # 용량보다 큰 요청도 실제 사용량만큼 차감 (음수가 되면 그만큼 다음 호출이 더 기다림)
+        self.level -= amount
+
+    def sync(self, limit: Optional[float], remaining: Optional[float], reset_seconds: Optional[float], now: float):
+        """
+        서버가 알려준 한도/잔여량/리셋 시간으로 버킷 보정
+
+        reset_seconds 안에 limit까지 다시 찬다고 보고 충전 속도를 계산합니다.
+        """
+        if limit is not None and limit > 0:
+            self.capacity = limit
+        if remaining is not None:
+            self.level = min(self.capacity, max(0.0, remaining))
+        if reset_seconds is not None and reset_seconds > 0:
+            deficit = self.capacity - self.level
+            if deficit > 0:
+                self.refill_rate = deficit / reset_seconds
+        self.updated_at = now
+
+
+class KeyBudget:
+    """API 키 하나의 요청/토큰 예산"""
+
+    def __init__(self, key_name: str, requests_per_minute: float, tokens_per_minute: float):
+        self.key_name = key_name
+        self.requests = TokenBucket(requests_per_minute, requests_per_minute / 60.0)
+        self.tokens = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0)
+        self.blocked_until = 0.0
+
+    def refill(self, now: float):
+        self.requests.refill(now)
+        self.tokens.refill(now)
+
+    def headroom(self, estimated_tokens: float, now: float) -> float:
+        """호출 후 남는 여유 비율 (요청/토큰 중 작은 쪽, 음수면 대기 필요)"""
+        if now < self.blocked_until:
+            return -1.0
+        return min(self.requests.fraction_after(1), self.tokens.fraction_after(estimated_tokens))
+
+    def wait_time(self, estimated_tokens: float, now: float) -> float:
+        """호출 가능해질 때까지 남은 시간 (초)"""
+        blocked = max(0.0, self.blocked_until - now)
+        return max(blocked, self.requests.wait_time(1), self.tokens.wait_time(estimated_tokens))
+
+    def consume(self, estimated_tokens: float):
+        self.requests.consume(1)
+        self.tokens.consume(estimated_tokens)
+
+    def update_from_headers(self, headers, now: float):
+        """Groq 응답 헤더로 예산 갱신"""
+        self.requests.sync(
+            _header_float(headers, "x-ratelimit-limit-requests"),
+            _header_float(headers, "x-ratelimit-remaining-requests"),
+            parse_duration(headers.get("x-ratelimit-reset-requests")) if headers else None,
+            now
+        )
+        self.tokens.sync(
+            _header_float(headers, "x-ratelimit-limit-tokens"),
+            _header_float(headers, "x-ratelimit-remaining-tokens"),
+            parse_duration(headers.get("x-ratelimit-reset-tokens")) if headers else None,
+            now
+        )
+
+    def block(self, seconds: float, now: float):
+        """Rate Limit 응답을 받은 키를 seconds 동안 제외"""
+        self.blocked_until = max(self.blocked_until, now + max(0.0, seconds))
+
+
+class GroqKeyScheduler:
+    """
+    여러 Groq API 키에 호출을 분배하는 스케줄러
+
+    환경 변수:
+    - GROQ_RPM_LIMIT: 헤더를 받기 전 가정할 키별 분당 요청 수 (기본값 30)
+    - GROQ_TPM_LIMIT: 헤더를 받기 전 가정할 키별 분당 토큰 수 (기본값 12000)
+    - GROQ_SCHEDULER_MAX_WAIT_SECONDS: 키가 다시 찰 때까지 최대 대기 시간 (기본값 60)
+    """
+
+    def __init__(self, key_names: List[str]):
+        requests_per_minute = float(os.getenv("GROQ_RPM_LIMIT", "30"))
+        tokens_per_minute = float(os.getenv("GROQ_TPM_LIMIT", "12000"))
+
+        self.budgets = [KeyBudget(name, requests_per_minute, tokens_per_minute) for name in key_names]
+        self.max_wait = float(os.getenv("GROQ_SCHEDULER_MAX_WAIT_SECONDS", "60"))
+        self._lock = threading.Lock()
+
+    def acquire(self, estimated_tokens: float, exclude: Iterable[int] = ()) -> Tuple[Optional[int], float]:
+        """
+        여유가 가장 많은 키의 인덱스를 선택하고 예산 차감
+
+        모든 키가 소진된 경우 가장 빨리 충전되는 키를 기다린 뒤 반환합니다.
+        max_wait를 넘기면 더 기다리지 않고 가장 빨리 풀리는 키를 반환합니다.
+
+        Returns:
+            (키 인덱스, 대기한 시간) - exclude로 모든 키가 제외되면 인덱스는 None
+        """
+        excluded = set(exclude)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                candidates = [i for i in range(len(self.budgets)) if i not in excluded]
+                if not candidates:
+                    return None, waited
+
+                for i in candidates:
+                    self.budgets[i].refill(now)
+
+                best = max(candidates, key=lambda i: self.budgets[i].headroom(estimated_tokens, now))
+                if self.budgets[best].headroom(estimated_tokens, now) >= 0:
+                    self.budgets[best].consume(estimated_tokens)
+                    return best, waited
+
+                soonest = min(candidates, key=lambda i: self.budgets[i].wait_time(estimated_tokens, now))
+                wait = self.budgets[soonest].wait_time(estimated_tokens, now)
+
+                if waited + wait > self.max_wait:
+                    self.budgets[soonest].consume(estimated_tokens)
+                    return soonest, waited
+
+            print(f"  ⏳ 모든 Groq API 키 예산 소진, {self.budgets[soonest].key_name} 충전 대기 중... ({wait:.1f}초)")
+            time.sleep(wait)
+            waited += wait
+
+    def update_from_headers(self, key_index: int, headers):
+        """응답 헤더로 키 예산 갱신"""
+        with self._lock:
+            self.budgets[key_index].update_from_headers(headers, time.monotonic())
+
+    def report_rate_limited(self, key_index: int, retry_after: Optional[float] = None):
+        """429 응답을 받은 키를 retry_after(없으면 60초) 동안 제외"""
+        with self._lock:
+            self.budgets[key_index].block(retry_after if retry_after is not None else 60.0, time.monotonic())
+
+    def snapshot(self) -> List[Dict[str, float]]:
+        """키별 현재 예산 상태 (디버깅용)"""
+        with self._lock:
+            now = time.monotonic()
+            result = []
+            for budget in self.budgets:
+                budget.refill(now)
+                result.append({
+                    "key": budget.key_name,
+                    "requests_remaining": budget.requests.level,
+                    "tokens_remaining": budget.tokens.level,
+                    "blocked_for": max(0.0, budget.blocked_until - now),
+                })
+            return result
@@ -0,0 +1,86 @@
+"""
+공용 HTTP 세션 (커넥션 풀 + Keep-Alive)
+- 호출마다 TCP/TLS 핸드셰이크를 반복하지 않도록 requests.Session 재사용
+"""
+
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경 변수 읽기 (잘못된 값이면 기본값)"""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """불리언 환경 변수 읽기"""
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def create_session(
+    pool_connections: int = 4,
+    pool_maxsize: int = 10,
+    keep_alive: bool = True,
+    pool_block: bool = False
+) -> requests.Session:
+    """
+    커넥션 풀이 설정된 requests.Session 생성
+
+    Args:
+        pool_connections: 호스트별로 유지할 커넥션 풀 개수
+        pool_maxsize: 호스트당 최대 커넥션 수
+        keep_alive: HTTP Keep-Alive 사용 여부 (False면 매 요청 후 연결 종료)
+        pool_block: True면 호스트당 커넥션이 pool_maxsize를 넘지 않도록 대기
+
+    Returns:
+        설정된 세션
+    """
+    session = requests.Session()
+
+    # 재시도는 호출하는 쪽에서 직접 처리하므로 어댑터 재시도는 끔
+    adapter_options = dict(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=0,
+        pool_block=pool_block
+    )
+    
+    # HTTP_CASSETTE_MODE가 설정되면 녹화/재생 어댑터 사용 (src/services/cassette.py)
+    from src.services.cassette import get_cassette, CassetteAdapter
+    cassette = get_cassette()
+    if cassette is not None:
+        adapter = CassetteAdapter(cassette, **adapter_options)
+    else:
+        adapter = HTTPAdapter(**adapter_options)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    session.headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+    return session
+
+
+def create_session_from_env(prefix: str) -> requests.Session:
+    """
+    환경 변수 설정으로 세션 생성
+
+    지원 환경 변수 ({prefix}는 예: GROQ_HTTP):
+    - {prefix}_POOL_CONNECTIONS: 커넥션 풀 개수 (기본값 4)
+    - {prefix}_POOL_MAXSIZE: 호스트당 최대 커넥션 수 (기본값 10)
+    - {prefix}_KEEP_ALIVE: Keep-Alive 사용 여부 (기본값 true)
+    - {prefix}_POOL_BLOCK: 호스트당 커넥션 수 제한 강제 여부 (기본값 true)
+    """
+    return create_session(
+        pool_connections=max(1, _env_int(f"{prefix}_POOL_CONNECTIONS", 4)),
+        pool_maxsize=max(1, _env_int(f"{prefix}_POOL_MAXSIZE", 10)),
+        keep_alive=_env_bool(f"{prefix}_KEEP_ALIVE", True),
+        pool_block=_env_bool(f"{prefix}_POOL_BLOCK", True)
+    )
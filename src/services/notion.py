@@ -5,8 +5,8 @@ Notion API 서비스
 """
 
 import os
-import requests
-from typing import Dict, Optional, List
+import threading
+from typing import Callable, Dict, Optional, List
 import json
 from datetime import datetime, timezone, timedelta
 
@@ -14,177 +14,215 @@ from datetime import datetime, timezone, timedelta
 from src.core.config import load_env_file
 load_env_file()
 
+from src.services.notion_markdown import compile_markdown
+from src.services.notion_client import notion_request
+
+
+NOTION_API_BASE_URL = "https://api.notion.com"
+
+# Notion 요청용 공용 세션 (커넥션 풀 재사용, HTTP 카세트 녹화/재생 지원)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """Notion용 HTTP 세션 가져오기 (최초 호출 시 생성)"""
+    global _http_session
+    
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from src.services.http_client import create_session_from_env
+                _http_session = create_session_from_env("NOTION_HTTP")
+    
+    return _http_session
+
+
+def get_notion_api_base_url() -> str:
+    """Notion API 기본 URL (NOTION_API_BASE_URL 환경 변수로 변경 가능, 예: 로컬 스텁 서버)"""
+    return (os.getenv("NOTION_API_BASE_URL") or NOTION_API_BASE_URL).rstrip("/")
+
 
 def markdown_to_notion_blocks(markdown_text: str) -> List[Dict]:
     """
     마크다운 텍스트를 노션 블록으로 변환
+    
+    제목/구분선/목록/인용/코드 블록과 굵게/기울임/코드/링크 인라인 서식을 지원합니다
+    (src/services/notion_markdown.py의 컴파일러 사용).
     """
-    blocks = []
-    lines = markdown_text.split('\n')
+    return compile_markdown(markdown_text)
+
+
+# Notion API 제한: 요청 하나의 children 최대 개수, 중첩 포함 최대 블록 수
+NOTION_MAX_CHILDREN = 100
+NOTION_MAX_BLOCKS_PER_REQUEST = 1000
+
+
+class NotionPartialPageError(Exception):
+    """
+    페이지는 생성됐지만 나머지 블록 묶음을 추가하지 못한 경우
+
+    page_id/page_url: 생성된 페이지, appended_chunks: 반영된 묶음 수 (페이지 생성 요청 포함),
+    total_chunks: 전체 묶음 수. resume_notion_page()로 이어서 추가하거나 페이지를 보관 처리할 수 있습니다.
+    """
+
+    def __init__(self, message: str, page_id: str, page_url: str, appended_chunks: int, total_chunks: int):
+        super().__init__(message)
+        self.page_id = page_id
+        self.page_url = page_url
+        self.appended_chunks = appended_chunks
+        self.total_chunks = total_chunks
+
+
+def _notion_headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "Notion-Version": "2022-06-28"
+    }
+
+
+def _count_blocks(block: Dict) -> int:
+    """중첩된 children까지 포함한 블록 수"""
+    children = block.get(block.get("type"), {}).get("children", [])
+    return 1 + sum(_count_blocks(child) for child in children)
+
+
+def chunk_blocks(
+    blocks: List[Dict],
+    max_children: int = NOTION_MAX_CHILDREN,
+    max_blocks: int = NOTION_MAX_BLOCKS_PER_REQUEST
+) -> List[List[Dict]]:
+    """
+    블록 목록을 요청 하나에 보낼 수 있는 크기로 나누기
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        if not line:
-            i += 1
-            continue
-        
-        # 제목 (### 제목)
-        if line.startswith('### '):
-            blocks.append({
-                "object": "block",
-                "type": "heading_3",
-                "heading_3": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": line[4:]}
-                    }]
-                }
-            })
-        
-        # 제목 (## 제목)
-        elif line.startswith('## '):
-            heading_text = line[3:].strip()
-            # Notion API 제한: heading_2는 최대 2000자
-            if len(heading_text) > 2000:
-                heading_text = heading_text[:1997] + "..."
-            blocks.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": heading_text}
-                    }]
-                }
-            })
-        
-        # 제목 (# 제목)
-        elif line.startswith('# '):
-            heading_text = line[2:].strip()
-            
-            # Notion API 제한: heading_1은 최대 2000자
-            if len(heading_text) > 2000:
-                heading_text = heading_text[:1997] + "..."
-            
-            blocks.append({
-                "object": "block",
-                "type": "heading_1",
-                "heading_1": {
-                    "rich_text": [{
-                        "type": "text",
-                        "text": {"content": heading_text}
-                    }]
-                }
-            })
-        
-        # 구분선 (---)
-        elif line == '---' or line.startswith('---'):
-            blocks.append({
-                "object": "block",
-                "type": "divider",
-                "divider": {}
-            })
-        
-        # 링크 ([텍스트](URL))
-        elif '[' in line and '](' in line:
-            import re
-            link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-            matches = re.findall(link_pattern, line)
-            
-            rich_text = []
-            last_end = 0
-            current_line = line
-            
-            for match_text, match_url in matches:
-                # 링크 앞의 텍스트
-                link_pattern_full = f'[{match_text}]({match_url})'
-                link_start = current_line.find(link_pattern_full, last_end)
-                
-                if link_start > last_end:
-                    before_text = current_line[last_end:link_start].strip()
-                    if before_text:
-                        rich_text.append({
-                            "type": "text",
-                            "text": {"content": before_text}
-                        })
-                
-                # 링크 (Notion API 형식)
-                rich_text.append({
-                    "type": "text",
-                    "text": {
-                        "content": match_text,
-                        "link": {"url": match_url}
-                    }
-                })
-                
-                last_end = link_start + len(link_pattern_full)
-            
-            # 링크 뒤의 텍스트
-            if last_end < len(current_line):
-                after_text = current_line[last_end:].strip()
-                if after_text:
-                    rich_text.append({
-                        "type": "text",
-                        "text": {"content": after_text}
-                    })
-            
-            if not rich_text:
-                rich_text = [{"type": "text", "text": {"content": line}}]
-            
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {"rich_text": rich_text}
-            })
-        
-        # 일반 텍스트
-        else:
-            # HTML 태그 제거 (예: <small>)
-            import re
-            clean_line = re.sub(r'<[^>]+>', '', line)
-            
-            if clean_line:
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{
-                            "type": "text",
-                            "text": {"content": clean_line}
-                        }]
-                    }
-                })
-        
-        i += 1
+    각 묶음은 최상위 블록 max_children개 이하, 중첩 포함 max_blocks개 이하입니다.
+    """
+    chunks = []
+    current = []
+    current_blocks = 0
     
-    return blocks
+    for block in blocks:
+        size = _count_blocks(block)
+        if current and (len(current) >= max_children or current_blocks + size > max_blocks):
+            chunks.append(current)
+            current = []
+            current_blocks = 0
+        current.append(block)
+        current_blocks += size
+    
+    if current:
+        chunks.append(current)
+    return chunks
 
 
-def create_notion_page(
+def append_block_children(block_id: str, children: List[Dict], api_key: Optional[str] = None) -> int:
+    """
+    블록(페이지) 아래에 자식 블록 추가 (PATCH /v1/blocks/{id}/children, 100개씩 나눠 요청)
+    
+    요청은 Integration별 속도 제한에 맞춰 순서대로 보내고, 429/409/5xx는 재시도합니다.
+    
+    Returns:
+        추가 요청 횟수
+    """
+    api_key = api_key or os.getenv("NOTION_API_KEY")
+    if not api_key:
+        raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다.")
+    
+    url = f"{get_notion_api_base_url()}/v1/blocks/{block_id}/children"
+    chunks = chunk_blocks(children)
+    
+    for index, chunk in enumerate(chunks, 1):
+        response = notion_request("PATCH", url, api_key, idempotent=False,
+                                  headers=_notion_headers(api_key), json={"children": chunk})
+        if not response.ok:
+            raise Exception(f"Notion API 오류 (블록 추가 {index}/{len(chunks)}번째 요청): {response.text}")
+    
+    return len(chunks)
+
+
+def _kst_date(timestamp: Optional[str]) -> Optional[str]:
+    """Notion 시각(ISO 8601, UTC)을 한국 시간 날짜(YYYY-MM-DD)로 변환"""
+    if not timestamp:
+        return None
+    try:
+        moment = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone(timedelta(hours=9))).strftime("%Y-%m-%d")
+
+
+def find_page_by_title(
     title: str,
-    content: str,
     parent_page_id: Optional[str] = None,
-    database_id: Optional[str] = None
-) -> Dict:
+    database_id: Optional[str] = None,
+    api_key: Optional[str] = None,
+    created_on: Optional[str] = None
+) -> Optional[Dict]:
     """
-    Notion API를 사용하여 페이지 생성
+    부모 페이지(또는 데이터베이스) 아래에서 같은 제목의 페이지 찾기
     
-    Args:
-        title: 페이지 제목
-        content: 마크다운 형식의 콘텐츠
-        parent_page_id: 부모 페이지 ID (선택사항)
-        database_id: 데이터베이스 ID (선택사항)
+    게시 요청이 시간 초과됐지만 Notion에는 페이지가 생성된 경우를 확인하는 데 사용합니다.
+    created_on(YYYY-MM-DD, 한국 시간)을 주면 그날 생성된 페이지만 찾습니다
+    (예전에 같은 제목으로 게시한 페이지는 제외).
     
     Returns:
-        생성된 페이지 정보
+        {"page_id", "page_url"} 또는 None
     """
-    api_key = os.getenv("NOTION_API_KEY")
-    
+    api_key = api_key or os.getenv("NOTION_API_KEY")
     if not api_key:
         raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다.")
     
+    base_url = get_notion_api_base_url()
+    headers = _notion_headers(api_key)
+    start_cursor = None
+    
+    while True:
+        if parent_page_id:
+            params = {"page_size": 100}
+            if start_cursor:
+                params["start_cursor"] = start_cursor
+            response = notion_request(
+                "GET", f"{base_url}/v1/blocks/{parent_page_id}/children", api_key, headers=headers, params=params
+            )
+        elif database_id:
+            payload = {"page_size": 100, "filter": {"property": "title", "title": {"equals": title}}}
+            if start_cursor:
+                payload["start_cursor"] = start_cursor
+            response = notion_request(
+                "POST", f"{base_url}/v1/databases/{database_id}/query", api_key, headers=headers, json=payload
+            )
+        else:
+            return None
+        
+        if not response.ok:
+            raise Exception(f"Notion API 오류 (페이지 조회): {response.text}")
+        
+        data = response.json()
+        for item in data.get("results", []):
+            if parent_page_id:
+                found = item.get("type") == "child_page" and item.get("child_page", {}).get("title") == title
+            else:
+                # 제목 속성은 이름이 데이터베이스마다 달라 type으로 찾음 (필터는 속성 ID "title" 사용)
+                title_parts = next((prop.get("title", []) for prop in item.get("properties", {}).values()
+                                    if prop.get("type") == "title"), [])
+                found = "".join(part.get("plain_text") or part.get("text", {}).get("content", "") for part in title_parts) == title
+            if found and created_on and _kst_date(item.get("created_time")) != created_on:
+                found = False
+            if found and not item.get("archived") and not item.get("in_trash"):
+                page_id = item.get("id")
+                page_url = item.get("url") or f"https://notion.so/{page_id.replace('-', '')}"
+                return {"page_id": page_id, "page_url": page_url.replace("https://www.notion.so/", "https://notion.so/")}
+        
+        if not data.get("has_more"):
+            return None
+        start_cursor = data.get("next_cursor")
+
+
+def _page_blocks(content: str) -> List[Dict]:
+    """페이지 본문 블록 (날짜 블록 + 마크다운 변환 블록)"""
     # 한국 시간 기준 날짜 포맷팅
     kst = timezone(timedelta(hours=9))
     now_kst = datetime.now(kst)
@@ -228,14 +266,69 @@ def create_notion_page(
     # 마크다운을 노션 블록으로 변환
     content_blocks = markdown_to_notion_blocks(content)
     
+    # 날짜 블록 + 콘텐츠 블록 결합 (날짜가 먼저 오도록)
+    return date_blocks + content_blocks
+
+
+def _append_chunks(page_id: str, page_url: str, chunks: List[List[Dict]], start: int, api_key: str,
+                   on_progress: Optional[Callable[[str, str, int, int], None]] = None):
+    """
+    chunks[start:]를 순서대로 페이지에 추가 (묶음 하나가 요청 하나)
+    
+    실패하면 반영된 묶음 수와 함께 NotionPartialPageError를 발생시킵니다.
+    """
+    url = f"{get_notion_api_base_url()}/v1/blocks/{page_id}/children"
+    headers = _notion_headers(api_key)
+    
+    for index in range(start, len(chunks)):
+        try:
+            response = notion_request("PATCH", url, api_key, idempotent=False,
+                                      headers=headers, json={"children": chunks[index]})
+            error = None if response.ok else response.text
+        except Exception as e:
+            error = str(e)
+        if error is not None:
+            raise NotionPartialPageError(
+                f"페이지는 생성되었지만 블록 추가 실패 ({index + 1}/{len(chunks)}번째 묶음, page_id={page_id}): {error}",
+                page_id, page_url, index, len(chunks)
+            )
+        if on_progress:
+            on_progress(page_id, page_url, index + 1, len(chunks))
+
+
+def create_notion_page(
+    title: str,
+    content: str,
+    parent_page_id: Optional[str] = None,
+    database_id: Optional[str] = None,
+    on_progress: Optional[Callable[[str, str, int, int], None]] = None
+) -> Dict:
+    """
+    Notion API를 사용하여 페이지 생성
+    
+    Args:
+        title: 페이지 제목
+        content: 마크다운 형식의 콘텐츠
+        parent_page_id: 부모 페이지 ID (선택사항)
+        database_id: 데이터베이스 ID (선택사항)
+        on_progress: 묶음이 반영될 때마다 호출 (page_id, page_url, 반영된 묶음 수, 전체 묶음 수)
+            - 페이지 생성 직후에도 호출되므로 page_id를 바로 기록할 수 있음
+    
+    Returns:
+        생성된 페이지 정보
+    
+    Raises:
+        NotionPartialPageError: 페이지 생성 후 나머지 블록 추가에 실패한 경우 (resume_notion_page로 이어서 추가)
+    """
+    api_key = os.getenv("NOTION_API_KEY")
+    
+    if not api_key:
+        raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다.")
+    
     # 페이지 생성 요청
-    url = "https://api.notion.com/v1/pages"
+    url = f"{get_notion_api_base_url()}/v1/pages"
     
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json",
-        "Notion-Version": "2022-06-28"
-    }
+    headers = _notion_headers(api_key)
     
     # 부모 설정
     if parent_page_id:
@@ -252,10 +345,12 @@ def create_notion_page(
         # 루트에 생성 (Integration의 공유 페이지가 있어야 함)
         raise ValueError("parent_page_id 또는 database_id 중 하나는 필수입니다.")
     
-    # 날짜 블록 + 콘텐츠 블록 결합 (날짜가 먼저 오도록)
-    all_blocks = date_blocks + content_blocks
+    all_blocks = _page_blocks(content)
     
-    # 페이지 생성 시 children 블록을 함께 전달
+    # Notion API 제한(요청당 children 100개)을 넘으면 첫 묶음으로 페이지를 만들고 나머지는 이어서 추가
+    chunks = chunk_blocks(all_blocks)
+    
+    # 페이지 생성 시 첫 번째 children 묶음을 함께 전달
     payload = {
         "parent": parent,
         "properties": {
@@ -269,25 +364,110 @@ def create_notion_page(
                 ]
             }
         },
-        "children": all_blocks  # 날짜 블록 + 콘텐츠 블록을 함께 전달
+        "children": chunks[0]  # 날짜 블록 + 콘텐츠 블록 (첫 묶음)
     }
     
-    response = requests.post(url, headers=headers, json=payload, timeout=30)
+    # 속도 제한에 맞춰 요청하고 429/409/5xx는 재시도 (src/services/notion_client.py)
+    response = notion_request("POST", url, api_key, idempotent=False, headers=headers, json=payload)
     
     if not response.ok:
         error_text = response.text
         raise Exception(f"Notion API 오류: {error_text}")
     
     data = response.json()
+    page_id = data.get("id")
+    page_url = data.get("url", "").replace("https://www.notion.so/", "https://notion.so/")
+    if on_progress:
+        on_progress(page_id, page_url, 1, len(chunks))
+    
+    if len(chunks) > 1:
+        remaining = sum(len(chunk) for chunk in chunks[1:])
+        print(f"  📦 블록 {len(all_blocks)}개 중 {len(chunks[0])}개로 페이지 생성, 나머지 {remaining}개 이어서 추가")
+        _append_chunks(page_id, page_url, chunks, 1, api_key, on_progress)
     
     return {
         "status": "success",
-        "page_id": data.get("id"),
-        "page_url": data.get("url", "").replace("https://www.notion.so/", "https://notion.so/"),
+        "page_id": page_id,
+        "page_url": page_url,
         "data": data
     }
 
 
+def archive_notion_page(page_id: str, api_key: Optional[str] = None):
+    """페이지 보관 처리 (PATCH /v1/pages/{id}, archived=true, 미완성 페이지 정리용)"""
+    api_key = api_key or os.getenv("NOTION_API_KEY")
+    if not api_key:
+        raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다.")
+    
+    response = notion_request("PATCH", f"{get_notion_api_base_url()}/v1/pages/{page_id}", api_key,
+                              headers=_notion_headers(api_key), json={"archived": True})
+    if not response.ok:
+        raise Exception(f"Notion API 오류 (페이지 보관): {response.text}")
+
+
+def _count_block_children(block_id: str, api_key: str) -> int:
+    """블록(페이지) 바로 아래의 자식 블록 수 (GET /v1/blocks/{id}/children, 페이지 단위로 조회)"""
+    url = f"{get_notion_api_base_url()}/v1/blocks/{block_id}/children"
+    headers = _notion_headers(api_key)
+    count = 0
+    start_cursor = None
+    
+    while True:
+        params = {"page_size": 100}
+        if start_cursor:
+            params["start_cursor"] = start_cursor
+        response = notion_request("GET", url, api_key, headers=headers, params=params)
+        if not response.ok:
+            raise Exception(f"Notion API 오류 (블록 조회): {response.text}")
+        data = response.json()
+        count += len(data.get("results", []))
+        if not data.get("has_more"):
+            return count
+        start_cursor = data.get("next_cursor")
+
+
+def resume_notion_page(
+    page_id: str,
+    content: str,
+    page_url: Optional[str] = None,
+    on_progress: Optional[Callable[[str, str, int, int], None]] = None
+) -> Optional[Dict]:
+    """
+    블록 추가 도중 실패한 페이지에 나머지 묶음 이어서 추가
+    
+    페이지에 실제로 있는 블록 수로 반영된 묶음 수를 확인하므로, 응답을 받지 못한 추가 요청이
+    반영됐는지와 관계없이 블록이 중복되지 않습니다.
+    
+    Returns:
+        생성 결과 (create_notion_page와 같은 형식), 페이지 블록 수가 묶음 경계와 맞지 않으면 None
+        (다른 콘텐츠로 만든 페이지 등, 이어서 추가할 수 없음)
+    
+    Raises:
+        NotionPartialPageError: 이어서 추가하다 다시 실패한 경우
+    """
+    api_key = os.getenv("NOTION_API_KEY")
+    if not api_key:
+        raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다.")
+    
+    page_url = page_url or f"https://notion.so/{page_id.replace('-', '')}"
+    chunks = chunk_blocks(_page_blocks(content))
+    existing = _count_block_children(page_id, api_key)
+    
+    appended = 0
+    boundary = 0
+    while boundary < existing and appended < len(chunks):
+        boundary += len(chunks[appended])
+        appended += 1
+    if boundary != existing:
+        return None
+    
+    if appended < len(chunks):
+        print(f"  📦 블록 추가 이어서 진행 ({appended}/{len(chunks)}번째 묶음까지 반영됨)")
+        _append_chunks(page_id, page_url, chunks, appended, api_key, on_progress)
+    
+    return {"status": "success", "page_id": page_id, "page_url": page_url}
+
+
 def publish_to_notion_api(
     title: str,
     content: str,
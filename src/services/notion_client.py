@@ -0,0 +1,133 @@
+"""
+Notion API 요청 클라이언트 (요청 속도 조절 + 재시도)
+- Integration(API 키)별로 요청 간격을 맞춰 평균 초당 요청 수를 제한 (Notion 권장: 초당 약 3회)
+- 429 응답은 Retry-After만큼 같은 Integration의 모든 요청을 멈춘 뒤 재시도
+- 409(충돌), 5xx, 연결 오류는 지터가 적용된 지수 백오프로 재시도
+- 페이지 생성/블록 추가처럼 반복하면 중복이 생기는 요청은 처리되지 않았다고 확실한 응답
+  (429, 409, 500/502/503)만 재시도 (시간 초과/504는 게시 outbox가 다음 실행에서 확인)
+
+환경 변수:
+- NOTION_REQUESTS_PER_SECOND: Integration별 초당 요청 수 (기본값 3, 0이면 제한 없음)
+- NOTION_MAX_RETRIES: 요청별 최대 재시도 횟수 (기본값 4)
+- NOTION_RETRY_BASE_DELAY: 첫 재시도 대기 시간 (초, 기본값 1)
+- NOTION_RETRY_MAX_DELAY: 재시도 대기 시간 상한 (초, 기본값 30)
+"""
+
+import os
+import time
+import threading
+from typing import Dict
+
+from src.services.groq_rate_limiter import backoff_delay, parse_duration
+
+
+# 재시도할 응답 코드 (409: 동시 수정 충돌, 429: Rate Limit, 5xx: 일시적인 서버 오류)
+RETRYABLE_STATUSES = frozenset({409, 429, 500, 502, 503, 504})
+
+# 반복하면 중복이 생기는 요청도 재시도할 수 있는 응답 코드 (Notion이 요청을 처리하지 않은 경우)
+UNPROCESSED_STATUSES = frozenset({409, 429, 500, 502, 503})
+
+
+class NotionRequestPacer:
+    """
+    요청 간격 조절기 (Integration 하나당 하나, 스레드 간 공유)
+
+    요청마다 다음 전송 시각을 예약하고 그때까지 대기하므로, 여러 스레드가 동시에 호출해도
+    초당 requests_per_second회를 넘지 않습니다. 429를 받으면 pause()로 모든 요청을 뒤로 미룹니다.
+    """
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> float:
+        """
+        다음 요청 차례까지 대기
+
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_at)
+            self._next_at = send_at + self.interval
+        delay = send_at - now
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def pause(self, seconds: float):
+        """지금부터 seconds 동안 새 요청을 보내지 않음 (429 Retry-After)"""
+        with self._lock:
+            self._next_at = max(self._next_at, time.monotonic() + seconds)
+
+
+_pacers: Dict[str, NotionRequestPacer] = {}
+_pacers_lock = threading.Lock()
+
+
+def get_request_pacer(api_key: str) -> NotionRequestPacer:
+    """Integration(API 키)별 요청 간격 조절기 (NOTION_REQUESTS_PER_SECOND)"""
+    with _pacers_lock:
+        pacer = _pacers.get(api_key)
+        if pacer is None:
+            pacer = NotionRequestPacer(float(os.getenv("NOTION_REQUESTS_PER_SECOND", "3")))
+            _pacers[api_key] = pacer
+        return pacer
+
+
+def notion_request(method: str, url: str, api_key: str, idempotent: bool = True, **kwargs):
+    """
+    Notion API 요청 (속도 조절 + 재시도)
+
+    Args:
+        method: HTTP 메서드
+        url: 요청 URL
+        api_key: Notion API 키 (속도 조절 단위)
+        idempotent: 반복해도 결과가 같은 요청인지 (False면 처리되지 않은 것이 확실한 응답만 재시도)
+        **kwargs: requests에 전달할 인자 (headers, json, params, timeout 등)
+
+    Returns:
+        마지막 응답 (재시도 후에도 실패하면 실패 응답 그대로, 판단은 호출자가 함)
+    """
+    import requests
+    from src.services.cassette import CassetteMissError
+    from src.services.notion import _get_http_session
+
+    max_retries = int(os.getenv("NOTION_MAX_RETRIES", "4"))
+    base_delay = float(os.getenv("NOTION_RETRY_BASE_DELAY", "1"))
+    max_delay = float(os.getenv("NOTION_RETRY_MAX_DELAY", "30"))
+    retry_statuses = RETRYABLE_STATUSES if idempotent else UNPROCESSED_STATUSES
+    kwargs.setdefault("timeout", 30)
+    pacer = get_request_pacer(api_key)
+
+    attempt = 0
+    while True:
+        pacer.wait()
+        try:
+            response = _get_http_session().request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            # 응답을 못 받은 요청은 처리됐는지 알 수 없으므로 멱등 요청만 재시도
+            if not idempotent or attempt >= max_retries or isinstance(e, CassetteMissError):
+                raise
+            delay = backoff_delay(attempt, base=base_delay, cap=max_delay)
+            print(f"  ⚠️  Notion API 연결 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries}): {e}")
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        if response.status_code not in retry_statuses or attempt >= max_retries:
+            return response
+
+        hint = parse_duration(response.headers.get("Retry-After"))
+        delay = backoff_delay(attempt, hint=hint, base=base_delay, cap=max(max_delay, hint or 0))
+        if response.status_code == 429:
+            # 같은 Integration을 쓰는 다른 요청도 함께 대기
+            pacer.pause(delay)
+            print(f"  ⏳ Notion API Rate Limit, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+        else:
+            print(f"  ⚠️  Notion API 응답 {response.status_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+        response.close()
+        attempt += 1
@@ -0,0 +1,307 @@
+"""
+마크다운 → 노션 블록 컴파일러
+- 문서를 한 번만 훑으며 줄 단위로 블록 종류를 판별 (정규식은 모듈 로드 시 한 번만 컴파일)
+- 블록: 제목(#~###), 구분선, 글머리 기호/번호 목록(들여쓰기 중첩), 인용, 코드 블록(```), 문단
+- 인라인: **굵게**, *기울임*, `코드`, ~~취소선~~, [링크](URL)를 주석(annotations)이 붙은 rich_text로 변환
+- Notion API 제한: rich_text 항목 하나당 최대 2000자 (넘으면 여러 항목으로 나눔),
+  2000자를 넘는 문단은 문장 경계에서 여러 문단으로 나눔,
+  블록 하나당 rich_text 최대 100개 (넘으면 같은 종류의 블록 여러 개로 나눔, 제목은 100개까지만)
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+# Notion API 제한: rich_text 항목 하나의 content 최대 길이, 블록 하나의 rich_text 항목 수
+RICH_TEXT_LIMIT = 2000
+RICH_TEXT_MAX_ITEMS = 100
+
+# 줄 단위 블록 패턴
+_HEADING = re.compile(r'(#{1,6})\s+(.*)')
+_DIVIDER = re.compile(r'(?:-{3,}|\*{3,}|_{3,})\s*$')
+_FENCE = re.compile(r'(`{3,}|~{3,})\s*([\w+#.-]*)')
+_BULLET = re.compile(r'([ \t]*)[-*+]\s+(.*)')
+_NUMBERED = re.compile(r'([ \t]*)\d{1,9}[.)]\s+(.*)')
+_TODO = re.compile(r'\[([ xX])\]\s+(.*)')
+_QUOTE = re.compile(r'>\s?(.*)')
+
+# 인라인 토큰: 서식 문자 위치에서만 해당 패턴을 시도 (긴 대안 정규식으로 모든 위치를 검사하지 않음)
+_INLINE_TRIGGER = re.compile(r'[`*_~\[]')
+_INLINE_PATTERNS = {
+    "`": [("code", re.compile(r'(`+)(.+?)\1'))],
+    "[": [("link", re.compile(r'\[([^\]]+)\]\(([^)\s]+)(?:\s+"[^"]*")?\)'))],
+    "*": [("bold", re.compile(r'\*\*(.+?)\*\*')),
+          ("italic", re.compile(r'(?<![\w*])\*([^*\s](?:[^*]*[^*\s])?)\*(?!\*)'))],
+    "_": [("bold", re.compile(r'__(.+?)__')),
+          ("italic", re.compile(r'(?<!\w)_([^_\s](?:[^_]*[^_\s])?)_(?!\w)'))],
+    "~": [("strikethrough", re.compile(r'~~(.+?)~~'))],
+}
+_HTML_TAG = re.compile(r'<[^>]+>')
+_CODE = {"code": True}
+_SENTENCE_END = re.compile(r'(?<=[.!?。…])\s+')
+
+# 노션 링크로 허용하는 URL (상대 경로 등은 API 오류가 나므로 일반 텍스트로 둠)
+_LINKABLE = re.compile(r'(?:https?://|mailto:)', re.IGNORECASE)
+
+# 코드 블록 언어 별칭 → 노션 언어 이름
+_CODE_LANGUAGES = {
+    "": "plain text", "text": "plain text", "txt": "plain text", "plaintext": "plain text",
+    "py": "python", "python": "python", "python3": "python",
+    "js": "javascript", "javascript": "javascript", "jsx": "javascript",
+    "ts": "typescript", "typescript": "typescript", "tsx": "typescript",
+    "sh": "shell", "shell": "shell", "zsh": "shell", "bash": "bash", "console": "shell",
+    "json": "json", "yaml": "yaml", "yml": "yaml", "toml": "toml", "xml": "xml",
+    "html": "html", "css": "css", "scss": "scss", "sql": "sql", "markdown": "markdown", "md": "markdown",
+    "java": "java", "kotlin": "kotlin", "kt": "kotlin", "c": "c", "cpp": "c++", "c++": "c++",
+    "cs": "c#", "csharp": "c#", "c#": "c#", "go": "go", "golang": "go", "rust": "rust", "rs": "rust",
+    "ruby": "ruby", "rb": "ruby", "php": "php", "swift": "swift", "r": "r", "scala": "scala",
+    "dockerfile": "docker", "docker": "docker", "graphql": "graphql", "lua": "lua", "perl": "perl",
+}
+
+_HEADING_TYPES = {1: "heading_1", 2: "heading_2", 3: "heading_3"}
+
+# 줄 첫 글자가 이 중 하나일 때만 블록 패턴을 검사
+_BLOCK_MARKERS = frozenset("#>-*+_`~0123456789")
+
+# 들여쓰기 한 단계 (탭은 4칸으로 계산)
+_INDENT_WIDTH = 2
+
+# Notion API 제한: 요청 하나에서 children 중첩은 2단계까지 (더 깊은 항목은 2단계에 둠)
+_MAX_LIST_DEPTH = 3
+
+
+def _text_items(content: str, annotations: Optional[Dict] = None) -> List[Dict]:
+    """rich_text 항목 만들기 (2000자를 넘으면 나눔)"""
+    if len(content) <= RICH_TEXT_LIMIT:
+        item = {"type": "text", "text": {"content": content}}
+        if annotations:
+            item["annotations"] = dict(annotations)
+        return [item]
+    items = []
+    for start in range(0, len(content), RICH_TEXT_LIMIT):
+        item = {"type": "text", "text": {"content": content[start:start + RICH_TEXT_LIMIT]}}
+        if annotations:
+            item["annotations"] = dict(annotations)
+        items.append(item)
+    return items
+
+
+def parse_inline(text: str, annotations: Optional[Dict] = None, strip_html: bool = True) -> List[Dict]:
+    """
+    인라인 마크다운을 rich_text 목록으로 변환
+
+    굵게/기울임/취소선 안의 링크, 코드 등 중첩도 처리합니다 (바깥 주석이 안쪽에 합쳐짐).
+    """
+    if strip_html and "<" in text:
+        text = _HTML_TAG.sub('', text)
+    if not _INLINE_TRIGGER.search(text):
+        return _text_items(text, annotations) if text else []
+
+    rich_text = []
+    position = 0
+    for trigger in _INLINE_TRIGGER.finditer(text):
+        start = trigger.start()
+        if start < position:
+            continue
+
+        for kind, pattern in _INLINE_PATTERNS[trigger.group()]:
+            match = pattern.match(text, start)
+            if match:
+                break
+        else:
+            continue
+
+        if start > position:
+            rich_text.extend(_text_items(text[position:start], annotations))
+        position = match.end()
+
+        if kind == "code":
+            rich_text.extend(_text_items(match.group(2), {**annotations, "code": True} if annotations else _CODE))
+            continue
+
+        if kind == "link":
+            inner, url = match.group(1), match.group(2)
+            inner_annotations = annotations
+        else:
+            inner, url = match.group(1), None
+            inner_annotations = {**annotations, kind: True} if annotations else {kind: True}
+        # 안쪽에 서식 문자가 없으면 (대부분) 재귀 호출 없이 바로 항목 생성
+        if _INLINE_TRIGGER.search(inner):
+            items = parse_inline(inner, inner_annotations, strip_html=False)
+        else:
+            items = _text_items(inner, inner_annotations)
+        if url is not None and _LINKABLE.match(url):
+            for item in items:
+                item["text"]["link"] = {"url": url}
+        rich_text.extend(items)
+
+    if position < len(text):
+        rich_text.extend(_text_items(text[position:], annotations))
+    return rich_text
+
+
+def _block(block_type: str, rich_text: List[Dict], **extra) -> Dict:
+    return {"object": "block", "type": block_type, block_type: {"rich_text": rich_text, **extra}}
+
+
+def _split_blocks(block_type: str, rich_text: List[Dict], **extra) -> List[Dict]:
+    """rich_text 항목이 100개를 넘으면 같은 종류의 블록 여러 개로 나눔 (Notion API 제한)"""
+    if len(rich_text) <= RICH_TEXT_MAX_ITEMS:
+        return [_block(block_type, rich_text, **extra)]
+    return [_block(block_type, rich_text[start:start + RICH_TEXT_MAX_ITEMS], **extra)
+            for start in range(0, len(rich_text), RICH_TEXT_MAX_ITEMS)]
+
+
+def _code_blocks(lines: List[str], language: str) -> List[Dict]:
+    code = "\n".join(lines)
+    return _split_blocks("code", _text_items(code) or _text_items(" "),
+                         language=_CODE_LANGUAGES.get(language.lower(), "plain text"))
+
+
+def _indent_level(indent: str) -> int:
+    return len(indent.replace("\t", "    ")) // _INDENT_WIDTH
+
+
+def _truncate(text: str, limit: int = RICH_TEXT_LIMIT) -> str:
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def split_sentences(text: str, limit: int = RICH_TEXT_LIMIT) -> List[str]:
+    """
+    긴 텍스트를 limit자 이하 조각으로 나누기 (문장 경계 우선)
+
+    문장 하나가 limit보다 길면 마지막 공백에서, 공백도 없으면 limit에서 자릅니다.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    pieces = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text):
+        if current and len(current) + 1 + len(sentence) <= limit:
+            current = f"{current} {sentence}"
+            continue
+        if current:
+            pieces.append(current)
+        while len(sentence) > limit:
+            cut = sentence.rfind(" ", 0, limit + 1)
+            if cut <= 0:
+                cut = limit
+            pieces.append(sentence[:cut].rstrip())
+            sentence = sentence[cut:].lstrip()
+        current = sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _append_paragraph(blocks: List[Dict], line: str):
+    """문단 블록 추가 (HTML 태그 제거 후 비어 있으면 건너뜀, 2000자를 넘으면 문장 경계에서 나눔)"""
+    if "<" in line:
+        line = _HTML_TAG.sub('', line).strip()
+        if not line:
+            return
+    if len(line) <= RICH_TEXT_LIMIT and not _INLINE_TRIGGER.search(line):
+        # 서식 없는 짧은 문단 (가장 흔한 경우): 나누기/인라인 해석 없이 바로 블록 생성
+        blocks.append({"object": "block", "type": "paragraph",
+                       "paragraph": {"rich_text": [{"type": "text", "text": {"content": line}}]}})
+        return
+    for piece in split_sentences(line):
+        blocks.extend(_split_blocks("paragraph", parse_inline(piece, strip_html=False)))
+
+
+def compile_markdown(markdown_text: str) -> List[Dict]:
+    """
+    마크다운 문서를 노션 블록 목록으로 변환 (한 번만 훑음)
+
+    - 빈 줄이 아닌 줄 하나가 문단 하나 (기존 변환과 같은 단위)
+    - 목록 항목은 들여쓰기에 따라 앞 항목의 children으로 중첩 (최대 2단계)
+    - 닫히지 않은 코드 블록은 문서 끝까지 코드로 처리
+    """
+    blocks: List[Dict] = []
+    # 열려 있는 목록 항목 (들여쓰기 단계, 블록)
+    list_stack: List[Tuple[int, Dict]] = []
+    code_fence = None
+    code_language = ""
+    code_lines: List[str] = []
+
+    for raw_line in markdown_text.split('\n'):
+        if code_fence is not None:
+            if raw_line.strip().startswith(code_fence):
+                blocks.extend(_code_blocks(code_lines, code_language))
+                code_fence = None
+                code_lines = []
+            else:
+                code_lines.append(raw_line)
+            continue
+
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        first = line[0]
+
+        # 블록 표시 문자로 시작하지 않는 줄은 바로 문단 처리 (대부분의 줄)
+        if first not in _BLOCK_MARKERS:
+            list_stack = []
+            _append_paragraph(blocks, line)
+            continue
+
+        if first in "`~":
+            fence = _FENCE.match(line)
+            if fence:
+                code_fence = fence.group(1)
+                code_language = fence.group(2)
+                list_stack = []
+                continue
+
+        if first in "-*+" or first.isdigit():
+            item = _BULLET.match(raw_line) if first in "-*+" else _NUMBERED.match(raw_line)
+            if item and not (first in "-*_" and _DIVIDER.match(line)):
+                level = _indent_level(item.group(1))
+                text = item.group(2)
+                todo = _TODO.match(text) if first in "-*+" else None
+                # rich_text가 100개를 넘는 항목은 같은 종류의 항목 여러 개로 나누고, 하위 항목은 마지막 조각에 붙임
+                if todo:
+                    items = _split_blocks("to_do", parse_inline(todo.group(2)), checked=todo.group(1) != " ")
+                else:
+                    items = _split_blocks("bulleted_list_item" if first in "-*+" else "numbered_list_item", parse_inline(text))
+
+                while list_stack and (list_stack[-1][0] >= level or len(list_stack) >= _MAX_LIST_DEPTH):
+                    list_stack.pop()
+                if list_stack:
+                    parent = list_stack[-1][1]
+                    parent[parent["type"]].setdefault("children", []).extend(items)
+                else:
+                    blocks.extend(items)
+                list_stack.append((level, items[-1]))
+                continue
+
+        list_stack = []
+
+        if first == "#":
+            heading = _HEADING.match(line)
+            if heading:
+                level = min(len(heading.group(1)), 3)
+                text = _truncate(heading.group(2).strip())
+                # 제목은 나누면 제목이 여러 개가 되므로 100개까지만 사용
+                blocks.append(_block(_HEADING_TYPES[level], parse_inline(text)[:RICH_TEXT_MAX_ITEMS]))
+                continue
+
+        if first in "-*_" and _DIVIDER.match(line):
+            blocks.append({"object": "block", "type": "divider", "divider": {}})
+            continue
+
+        if first == ">":
+            quote = _QUOTE.match(line)
+            rich_text = parse_inline(quote.group(1).strip())
+            if rich_text:
+                blocks.extend(_split_blocks("quote", rich_text))
+            continue
+
+        _append_paragraph(blocks, line)
+
+    if code_fence is not None:
+        blocks.extend(_code_blocks(code_lines, code_language))
+
+    return blocks
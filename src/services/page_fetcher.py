@@ -0,0 +1,260 @@
+"""
+검색 결과 원문 페이지 가져오기 및 발췌 보강
+- 상위 N개 결과 페이지를 동시에 가져옴 (전체 동시 실행 수 + 호스트별 동시 실행 수 제한)
+- 본문 크기 상한 (PAGE_FETCH_MAX_BYTES까지만 읽고 연결 종료)
+- 추출한 본문은 메모리 + SQLite(page_cache)에 캐시해 검증/재시도/다른 언어 포스팅이 공유
+- 키워드와 관련된 발췌를 토큰 예산 안에서 골라 결과의 "passages"에 추가
+
+환경 변수:
+- PAGE_ENRICH_ENABLED: 원문 발췌 보강 사용 여부 (기본값 false)
+- PAGE_ENRICH_TOP_N: 가져올 상위 결과 수 (기본값 3)
+- PAGE_ENRICH_TOKEN_BUDGET: 모든 발췌를 합친 토큰 예산 (기본값 1500)
+- PAGE_FETCH_WORKERS: 동시에 가져올 페이지 수 (기본값 4)
+- PAGE_FETCH_PER_HOST: 호스트별 동시 요청 수 (기본값 1)
+- PAGE_FETCH_TIMEOUT: 페이지별 요청 타임아웃 (초, 기본값 8)
+- PAGE_FETCH_MAX_BYTES: 페이지별 최대 읽기 크기 (기본값 1000000)
+- PAGE_CACHE_TTL_SECONDS: 본문 캐시 유효 시간 (기본값 604800, 7일)
+- PAGE_CACHE_FAILURE_TTL_SECONDS: 가져오기 실패 캐시 유효 시간 (기본값 3600)
+"""
+
+import os
+import codecs
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from src.utils.text_extract import extract_main_text, select_passages, estimate_tokens
+from src.utils.url_canonical import canonicalize_url, resolve_url
+
+
+_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# 본문을 추출할 수 있는 응답 형식
+_TEXT_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+# 페이지 요청용 공용 세션
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """페이지 요청용 HTTP 세션 가져오기 (PAGE_FETCH_HTTP_* 환경 변수로 커넥션 풀 설정)"""
+    global _http_session
+
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from src.services.http_client import create_session_from_env
+                _http_session = create_session_from_env("PAGE_FETCH_HTTP")
+
+    return _http_session
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """페이지 가져오기 실행기 (PAGE_FETCH_WORKERS, 모든 호출이 공유)"""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=max(1, int(os.getenv("PAGE_FETCH_WORKERS", "4"))),
+                    thread_name_prefix="page-fetch"
+                )
+
+    return _executor
+
+
+# 호스트별 동시 요청 제한
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(host: str) -> threading.BoundedSemaphore:
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = threading.BoundedSemaphore(max(1, int(os.getenv("PAGE_FETCH_PER_HOST", "1"))))
+            _host_semaphores[host] = semaphore
+        return semaphore
+
+
+# 본문 캐시 (메모리 → DB 순서로 조회)
+_memory_cache: Dict[str, str] = {}
+_memory_cache_lock = threading.Lock()
+_cache_db = None
+
+
+def _get_cache_db():
+    global _cache_db
+
+    if _cache_db is None:
+        with _memory_cache_lock:
+            if _cache_db is None:
+                from src.core.database import Database
+                _cache_db = Database()
+
+    return _cache_db
+
+
+def _cache_get(url: str) -> Optional[str]:
+    with _memory_cache_lock:
+        if url in _memory_cache:
+            return _memory_cache[url]
+    try:
+        text = _get_cache_db().get_page_cache(url)
+    except Exception as e:
+        print(f"  ⚠️  페이지 캐시 조회 실패: {e}")
+        return None
+    if text is not None:
+        with _memory_cache_lock:
+            _memory_cache[url] = text
+    return text
+
+
+def _cache_set(url: str, text: str, status: Optional[int]):
+    with _memory_cache_lock:
+        _memory_cache[url] = text
+    if text:
+        ttl = float(os.getenv("PAGE_CACHE_TTL_SECONDS", "604800"))
+    else:
+        ttl = float(os.getenv("PAGE_CACHE_FAILURE_TTL_SECONDS", "3600"))
+    if ttl <= 0:
+        return
+    try:
+        _get_cache_db().set_page_cache(url, text, status, ttl)
+    except Exception as e:
+        print(f"  ⚠️  페이지 캐시 저장 실패: {e}")
+
+
+def _read_capped(response, max_bytes: int) -> str:
+    """응답 본문을 max_bytes까지만 읽어 문자열로 변환 (나머지는 받지 않고 연결 종료)"""
+    encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else "utf-8"
+    try:
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    parts = []
+    read = 0
+    try:
+        for chunk in response.iter_content(chunk_size=16384):
+            if not chunk:
+                continue
+            chunk = chunk[:max_bytes - read]
+            read += len(chunk)
+            parts.append(decoder.decode(chunk))
+            if read >= max_bytes:
+                break
+        parts.append(decoder.decode(b"", final=True))
+    finally:
+        response.close()
+    return "".join(parts)
+
+
+def fetch_page_text(url: str) -> str:
+    """
+    페이지 본문 텍스트 가져오기 (캐시 사용)
+
+    Returns:
+        추출한 본문 (가져오기 실패, HTML이 아님 등은 빈 문자열)
+    """
+    # 정규화한 URL은 캐시 키로만 쓰고, 요청은 리디렉션만 푼 원래 URL로 보냄
+    # (쿼리를 다시 인코딩하거나 파라미터를 빼면 다른 페이지가 될 수 있음)
+    cache_key = canonicalize_url(url)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
+    url = resolve_url(url)
+    host = (urlsplit(url).hostname or "").lower()
+    if not host:
+        return ""
+
+    timeout = float(os.getenv("PAGE_FETCH_TIMEOUT", "8"))
+    max_bytes = int(os.getenv("PAGE_FETCH_MAX_BYTES", "1000000"))
+    status = None
+    text = ""
+
+    with _host_semaphore(host):
+        try:
+            response = _get_http_session().get(
+                url,
+                headers={"User-Agent": _USER_AGENT, "Accept": "text/html,application/xhtml+xml;q=0.9,text/plain;q=0.8"},
+                timeout=timeout,
+                allow_redirects=True,
+                stream=True
+            )
+            status = response.status_code
+            content_type = response.headers.get("Content-Type", "").lower()
+            if status == 200 and (not content_type or content_type.startswith(_TEXT_CONTENT_TYPES)):
+                page = _read_capped(response, max_bytes)
+                text = page.strip() if content_type.startswith("text/plain") else extract_main_text(page)
+            else:
+                response.close()
+        except Exception as e:
+            print(f"  ⚠️  페이지 가져오기 실패 ({host}): {e}")
+
+    _cache_set(cache_key, text, status)
+    return text
+
+
+def fetch_page_texts(urls: List[str]) -> Dict[str, str]:
+    """여러 페이지를 동시에 가져오기 (url → 본문, 순서 유지)"""
+    executor = _get_executor()
+    futures = {url: executor.submit(fetch_page_text, url) for url in dict.fromkeys(urls) if url}
+    texts = {}
+    for url, future in futures.items():
+        try:
+            texts[url] = future.result()
+        except Exception as e:
+            print(f"  ⚠️  페이지 가져오기 오류 ({url}): {e}")
+            texts[url] = ""
+    return texts
+
+
+def page_enrichment_enabled() -> bool:
+    return os.getenv("PAGE_ENRICH_ENABLED", "false").lower() == "true"
+
+
+def enrich_search_results(keyword: str, results: List[Dict[str, str]],
+                          top_n: Optional[int] = None, token_budget: Optional[int] = None) -> List[Dict[str, str]]:
+    """
+    상위 결과에 원문 발췌 추가
+
+    발췌는 결과의 "passages" 목록에 넣고, 토큰 예산은 본문을 가져온 페이지에 나눠 씁니다.
+    (가져오지 못한 페이지의 몫은 다음 페이지로 넘어감)
+
+    Returns:
+        새 결과 목록 (원본은 변경하지 않음)
+    """
+    if top_n is None:
+        top_n = int(os.getenv("PAGE_ENRICH_TOP_N", "3"))
+    if token_budget is None:
+        token_budget = int(os.getenv("PAGE_ENRICH_TOKEN_BUDGET", "1500"))
+    if not results or top_n <= 0 or token_budget <= 0:
+        return results
+
+    targets = [r for r in results[:top_n] if (r.get("link") or "").startswith(("http://", "https://"))]
+    texts = fetch_page_texts([r["link"] for r in targets])
+
+    enriched = []
+    remaining_budget = token_budget
+    remaining_pages = sum(1 for r in targets if texts.get(r["link"]))
+    for index, result in enumerate(results):
+        text = texts.get(result.get("link")) if index < top_n else None
+        if not text:
+            enriched.append(result)
+            continue
+        passages = select_passages(keyword, text, remaining_budget // remaining_pages)
+        remaining_pages -= 1
+        remaining_budget -= sum(estimate_tokens(p) for p in passages)
+        enriched.append({**result, "passages": passages} if passages else result)
+
+    return enriched
@@ -0,0 +1,140 @@
+"""
+Notion 게시 outbox (중복 페이지 방지 + 재시도 시 재생성 방지)
+- 게시 직전 콘텐츠를 DB publish_outbox 테이블에 키워드 + 언어 + 날짜(KST) 키로 기록
+- 페이지 생성 직후 page_id를 기록하고(created), 블록 추가까지 끝나야 게시 완료(published)로 표시
+- 재시도 시 미완성 페이지는 이어서 완성하거나 보관 처리 후 새로 생성 (제목 일치만으로 게시 완료로 보지 않음)
+- 시간 초과로 결과를 못 받았어도 다음 재시도는 저장된 콘텐츠로 조회/게시만 하므로 LLM을 다시 호출하지 않음
+"""
+
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+
+_KST = timezone(timedelta(hours=9))
+
+# 같은 제목의 기록되지 않은 페이지를 정리할 최대 개수 (무한 반복 방지)
+_MAX_ORPHAN_PAGES = 5
+
+
+def publish_date_kst() -> str:
+    """게시 날짜 (한국 시간 기준 YYYY-MM-DD)"""
+    return datetime.now(_KST).strftime("%Y-%m-%d")
+
+
+def publish_idempotency_key(keyword: str, language: str, publish_date: Optional[str] = None) -> str:
+    """게시 멱등성 키 (같은 키워드/언어/날짜면 같은 키)"""
+    normalized = " ".join(unicodedata.normalize("NFKC", keyword).lower().split())
+    return f"{normalized}|{language}|{publish_date or publish_date_kst()}"
+
+
+def get_outbox_content(db, keyword: str, language: str, publish_date: Optional[str] = None) -> Optional[Dict]:
+    """
+    오늘 게시하려고 기록해 둔 콘텐츠 (재시도 시 재생성 대신 사용)
+
+    Returns:
+        {"title", "content", "status", ...} 또는 None
+    """
+    try:
+        entry = db.get_publish_outbox(publish_idempotency_key(keyword, language, publish_date))
+    except Exception as e:
+        print(f"  ⚠️  게시 outbox 조회 실패: {e}")
+        return None
+    if not entry or not entry.get("content"):
+        return None
+    return entry
+
+
+def publish_once(db, keyword_id: Optional[str], keyword: str, language: str, title: str, content: str,
+                 parent_page_id: Optional[str] = None, database_id: Optional[str] = None,
+                 publish_date: Optional[str] = None) -> Dict:
+    """
+    멱등 게시: outbox 게시 완료 → 이전 시도의 미완성 페이지 → 새 페이지 생성 순서로 처리
+
+    - 게시 완료(published)는 블록 추가까지 끝난 경우에만 기록 (페이지 생성 직후에는 created + page_id)
+    - 이전 시도에서 만든 미완성 페이지는 콘텐츠가 같으면 나머지 블록을 이어서 추가하고,
+      다르면 보관 처리한 뒤 새로 생성
+    - page_id를 기록하기 전에 응답을 못 받아 생긴 페이지(같은 제목, 게시 날짜에 생성)는
+      내용이 완전한지 알 수 없으므로 보관 처리한 뒤 새로 생성
+
+    Returns:
+        {"status": "success", "page_id", "page_url", "reused": 이미 게시 완료된 페이지면 True, "outbox": 항목}
+        (실패는 outbox에 기록 후 예외 전달)
+    """
+    from src.services.notion import (
+        create_notion_page, resume_notion_page, archive_notion_page, find_page_by_title
+    )
+
+    key = publish_idempotency_key(keyword, language, publish_date)
+    publish_date = publish_date or publish_date_kst()
+    label = '영문' if language == 'english' else '한글'
+
+    entry = db.get_publish_outbox(key)
+    if entry and entry["status"] == "published" and entry.get("notion_page_id"):
+        print(f"  ♻️  {label} 페이지가 이미 게시되어 있습니다 (outbox): {entry.get('notion_page_url') or entry['notion_page_id']}")
+        return {"status": "success", "page_id": entry["notion_page_id"], "page_url": entry.get("notion_page_url"),
+                "reused": True, "outbox": entry}
+
+    def on_progress(page_id: str, page_url: str, appended: int, total: int):
+        if appended == 1:
+            db.mark_publish_outbox_created(key, page_id, page_url)
+
+    try:
+        # 이전 시도에서 생성했지만 블록 추가가 끝나지 않은 페이지
+        if entry and entry.get("notion_page_id"):
+            page_id = entry["notion_page_id"]
+            result = None
+            if entry["title"] == title and entry["content"] == content:
+                print(f"  🔁 {label} 미완성 페이지 이어서 완성: {entry.get('notion_page_url') or page_id}")
+                result = resume_notion_page(page_id, content, entry.get("notion_page_url"))
+            if result:
+                db.mark_publish_outbox_published(key, result["page_id"], result["page_url"])
+                return {"status": "success", "page_id": result["page_id"], "page_url": result["page_url"],
+                        "reused": False, "outbox": db.get_publish_outbox(key)}
+            print(f"  🗑️  {label} 미완성 페이지를 보관 처리하고 새로 생성합니다: {page_id}")
+            archive_notion_page(page_id)
+            db.clear_publish_outbox_page(key)
+
+        # 페이지 생성 응답을 받지 못한 시도의 페이지 (이전 제목도 확인)
+        titles = [title]
+        if entry and entry.get("title") and entry["title"] != title:
+            titles.append(entry["title"])
+
+        db.save_publish_outbox(key, keyword_id, keyword, language, publish_date, title, content)
+
+        for candidate in titles:
+            for _ in range(_MAX_ORPHAN_PAGES):
+                orphan = find_page_by_title(candidate, parent_page_id=parent_page_id, database_id=database_id,
+                                            created_on=publish_date)
+                if not orphan:
+                    break
+                print(f"  🗑️  기록되지 않은 {label} 페이지를 보관 처리하고 새로 생성합니다: {orphan['page_url']}")
+                archive_notion_page(orphan["page_id"])
+
+        result = create_notion_page(title=title, content=content, parent_page_id=parent_page_id,
+                                    database_id=database_id, on_progress=on_progress)
+    except Exception as e:
+        db.mark_publish_outbox_failed(key, str(e))
+        raise
+
+    if not result or result.get("status") != "success":
+        error_msg = result.get("message", "알 수 없는 오류") if result else "결과를 받지 못함"
+        db.mark_publish_outbox_failed(key, error_msg)
+        return {"status": "failed", "message": error_msg}
+
+    db.mark_publish_outbox_published(key, result.get("page_id"), result.get("page_url") or "")
+    return {"status": "success", "page_id": result.get("page_id"), "page_url": result.get("page_url"),
+            "reused": False, "outbox": db.get_publish_outbox(key)}
+
+
+def record_outbox_post(db, keyword: str, language: str, post_id: str, publish_date: Optional[str] = None):
+    """게시 후 만든 posts 레코드를 outbox 항목에 연결"""
+    entry = db.get_publish_outbox(publish_idempotency_key(keyword, language, publish_date))
+    if entry and entry.get("notion_page_id"):
+        db.mark_publish_outbox_published(entry["idempotency_key"], entry["notion_page_id"],
+                                         entry.get("notion_page_url") or "", post_id)
+
+
+def get_unpublished_entries(db, publish_date: Optional[str] = None) -> List[Dict]:
+    """오늘 게시되지 않은 outbox 항목 (재배포 확인용)"""
+    return db.get_unpublished_outbox(publish_date or publish_date_kst())
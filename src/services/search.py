@@ -2,25 +2,157 @@
 검색 기능 (Google Custom Search API 우선, Rate Limit 시 Groq Search API 폴백)
 """
 
-import requests
 import re
 import os
-from typing import List, Dict
+import time
+import hashlib
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional
 from urllib.parse import quote_plus
 
+from src.services.search_providers import (
+    SearchProvider, LocalFileSearch, register_search_provider, select_search_providers
+)
+
 # 환경 변수에서 API 키 로드
 GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
 USE_GOOGLE_SEARCH = bool(GOOGLE_API_KEY and GOOGLE_CSE_ID)
 
+# 검색 요청용 공용 세션 (커넥션 풀 재사용, HTTP 카세트 녹화/재생 지원)
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session():
+    """검색용 HTTP 세션 가져오기 (최초 호출 시 생성)"""
+    global _http_session
+    
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                from src.services.http_client import create_session_from_env
+                _http_session = create_session_from_env("SEARCH_HTTP")
+    
+    return _http_session
+
+
+# Groq 검색용 에이전트 (BaseAgent의 공유 세션/API 키 관리 재사용)
+_groq_search_agent = None
+
+
+def _get_groq_search_agent():
+    """Groq 검색용 에이전트 가져오기 (최초 호출 시 생성)"""
+    global _groq_search_agent
+    
+    if _groq_search_agent is None:
+        from agents.groq_search_agent import GroqSearchAgent
+        _groq_search_agent = GroqSearchAgent()
+    
+    return _groq_search_agent
+
+
+# Google 일일 할당량 (태평양 시간 자정에 초기화)
+GOOGLE_QUOTA_PROVIDER = "google_cse"
+
+# 우선순위별로 남겨 둘 할당량 배수 (high는 전부 사용 가능, low는 예비분의 3배를 남김)
+_QUOTA_RESERVE_MULTIPLIER = {"high": 0, "normal": 1, "low": 3}
+
+_quota_db = None
+_quota_db_lock = threading.Lock()
+
+
+def _get_quota_db():
+    global _quota_db
+    
+    if _quota_db is None:
+        with _quota_db_lock:
+            if _quota_db is None:
+                from src.core.database import Database
+                _quota_db = Database()
+    
+    return _quota_db
+
+
+def _google_quota_date() -> str:
+    """Google 할당량 기준 날짜 (태평양 시간)"""
+    try:
+        from zoneinfo import ZoneInfo
+        pacific = ZoneInfo("America/Los_Angeles")
+    except Exception:
+        # 시간대 DB가 없으면 PST 고정 오프셋 사용
+        pacific = timezone(timedelta(hours=-8))
+    return datetime.now(pacific).strftime("%Y-%m-%d")
+
+
+def _google_quota_limit() -> int:
+    """GOOGLE_DAILY_QUOTA: 하루 최대 호출 수 (기본값 100, 무료 한도)"""
+    return int(os.getenv("GOOGLE_DAILY_QUOTA", "100"))
+
+
+def _google_quota_allowance(priority: str) -> int:
+    """
+    우선순위별로 사용할 수 있는 최대 호출 수
+    
+    GOOGLE_QUOTA_RESERVE(기본값 10)만큼은 high 우선순위 쿼리용으로 남겨 둡니다.
+    """
+    reserve = int(os.getenv("GOOGLE_QUOTA_RESERVE", "10"))
+    multiplier = _QUOTA_RESERVE_MULTIPLIER.get(priority, 1)
+    return max(0, _google_quota_limit() - reserve * multiplier)
+
+
+def get_google_quota_remaining(priority: str = "high") -> int:
+    """
+    오늘(태평양 시간) 남은 Google 검색 할당량
+    
+    Args:
+        priority: high / normal / low (낮을수록 예비분을 남기므로 남은 양이 적게 보임)
+    """
+    if not USE_GOOGLE_SEARCH:
+        return 0
+    try:
+        used = _get_quota_db().get_api_quota_used(GOOGLE_QUOTA_PROVIDER, _google_quota_date())
+    except Exception as e:
+        print(f"  ⚠️  Google 할당량 조회 실패: {e}")
+        return 0
+    return max(0, _google_quota_allowance(priority) - used)
+
 
-def search_keywords_google(query: str, num_results: int = 10) -> List[Dict[str, str]]:
-    """Google Custom Search API 사용 (하루 100건 무료)"""
+def _consume_google_quota(priority: str) -> bool:
+    """Google 호출 1건 차감 (우선순위별 허용량을 넘으면 False)"""
+    try:
+        allowed, used = _get_quota_db().try_consume_api_quota(
+            GOOGLE_QUOTA_PROVIDER,
+            _google_quota_date(),
+            _google_quota_allowance(priority)
+        )
+    except Exception as e:
+        # 할당량 DB 문제로 검색 자체를 막지는 않음
+        print(f"  ⚠️  Google 할당량 기록 실패: {e}")
+        return True
+    
+    if not allowed:
+        print(f"  ⏭️  Google 일일 할당량 도달 ({used}/{_google_quota_limit()}, {priority} 우선순위), Google 검색 건너뜀")
+    return allowed
+
+
+def search_keywords_google(query: str, num_results: int = 10, priority: str = "normal", timeout: float = 15) -> List[Dict[str, str]]:
+    """
+    Google Custom Search API 사용 (하루 100건 무료)
+    
+    호출 전에 일일 할당량을 차감하고, 우선순위별 허용량을 넘으면 호출하지 않습니다.
+    """
     results = []
     
     if not USE_GOOGLE_SEARCH:
         return []
     
+    if not _consume_google_quota(priority):
+        return []
+    
     try:
         # Google Custom Search API 호출
         url = "https://www.googleapis.com/customsearch/v1"
@@ -31,7 +163,7 @@ def search_keywords_google(query: str, num_results: int = 10) -> List[Dict[str,
             "num": min(num_results, 10),  # Google API는 한 번에 최대 10개
         }
         
-        response = requests.get(url, params=params, timeout=15)
+        response = _get_http_session().get(url, params=params, timeout=timeout)
         
         if response.ok:
             data = response.json()
@@ -45,6 +177,7 @@ def search_keywords_google(query: str, num_results: int = 10) -> List[Dict[str,
                 # Rate Limit 오류 (429 또는 quota 관련)
                 if error_code == 429 or "quota" in error_message.lower() or "rate" in error_message.lower():
                     print(f"  ⚠️  Google Search API Rate Limit 감지: {error_message}")
+                    _mark_google_quota_exhausted()
                     return []  # 빈 결과 반환하여 폴백 트리거
             
             # 검색 결과 파싱
@@ -65,49 +198,12 @@ def search_keywords_google(query: str, num_results: int = 10) -> List[Dict[str,
 
 def search_keywords_groq(query: str, num_results: int = 10) -> List[Dict[str, str]]:
     """Groq API를 사용한 웹 검색 (Google Rate Limit 시 폴백)"""
-    results = []
-    
     try:
-        from agents.base import BaseAgent
-        
-        # Groq API를 통한 검색 (LLM 기반 웹 검색 시뮬레이션)
-        # 실제로는 Groq는 검색 API를 제공하지 않으므로, 
-        # 웹 검색 결과를 생성하는 프롬프트를 사용합니다.
-        
-        system_prompt = """You are a web search assistant. Generate realistic web search results based on the query."""
-        
-        user_prompt = f"""Generate web search results for the query: "{query}"
-
-Please provide {num_results} search results in the following JSON format:
-{{
-  "results": [
-    {{
-      "title": "Result title",
-      "link": "https://example.com/article",
-      "snippet": "Article snippet or summary"
-    }}
-  ]
-}}
-
-Make the results relevant and realistic based on the query."""
-        
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ]
-        
-        # BaseAgent의 API 키 관리 사용
-        base_agent = BaseAgent("Groq Search Agent")
-        response = base_agent._call_groq(
-            messages,
-            response_format={"type": "json_object"}
-        )
-        
-        import json
-        data = json.loads(response)
-        
-        if "results" in data:
-            results = data["results"][:num_results]
+        # LLM 기반 웹 검색 시뮬레이션 (GroqSearchAgent 참고)
+        results = _get_groq_search_agent().process({
+            "query": query,
+            "num_results": num_results
+        })["results"]
         
         if results:
             print(f"  ✅ Groq 검색 결과 {len(results)}개 생성됨")
@@ -119,7 +215,7 @@ Make the results relevant and realistic based on the query."""
         return []
 
 
-def search_keywords_duckduckgo(query: str, num_results: int = 10) -> List[Dict[str, str]]:
+def search_keywords_duckduckgo(query: str, num_results: int = 10, timeout: float = 15) -> List[Dict[str, str]]:
     """DuckDuckGo 검색 (백업용)"""
     results = []
     
@@ -131,11 +227,11 @@ def search_keywords_duckduckgo(query: str, num_results: int = 10) -> List[Dict[s
             "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
         }
         
-        response = requests.get(
+        response = _get_http_session().get(
             "https://html.duckduckgo.com/html/",
             params={"q": query},
             headers=headers,
-            timeout=15,
+            timeout=timeout,
             allow_redirects=True
         )
         
@@ -190,7 +286,7 @@ def search_keywords_duckduckgo(query: str, num_results: int = 10) -> List[Dict[s
         # 결과가 부족하면 Instant Answer API도 시도
         if len(results) < num_results:
             try:
-                ia_response = requests.get(
+                ia_response = _get_http_session().get(
                     "https://api.duckduckgo.com/",
                     params={
                         "q": query,
@@ -233,7 +329,7 @@ def search_keywords_duckduckgo(query: str, num_results: int = 10) -> List[Dict[s
         # 결과가 없으면 간단한 웹 검색 시도
         if not results:
             try:
-                simple_response = requests.get(
+                simple_response = _get_http_session().get(
                     f"https://duckduckgo.com/?q={quote_plus(query)}",
                     headers={
                         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
@@ -274,11 +370,69 @@ def search_keywords_duckduckgo(query: str, num_results: int = 10) -> List[Dict[s
         return []
 
 
-def search_keywords(query: str, num_results: int = 10) -> List[Dict[str, str]]:
+def _mark_google_quota_exhausted():
+    """서버가 할당량 소진을 알려 주면 오늘 남은 할당량을 0으로 기록"""
+    try:
+        _get_quota_db().mark_api_quota_exhausted(GOOGLE_QUOTA_PROVIDER, _google_quota_date(), _google_quota_limit())
+    except Exception as e:
+        print(f"  ⚠️  Google 할당량 기록 실패: {e}")
+
+
+_default_providers_registered = False
+_default_providers_lock = threading.Lock()
+
+
+def _register_default_providers():
+    """
+    기본 검색 제공자 등록 (같은 이름으로 먼저 등록된 제공자가 있으면 유지)
+    
+    - Local: SEARCH_LOCAL_PATH가 있으면 가장 먼저 사용 (네트워크 없음, 캐시 안 함)
+    - Google: 무료지만 일일 할당량 (GOOGLE_DAILY_QUOTA)
+    - Groq: LLM 토큰을 쓰므로 비용 1
+    - DuckDuckGo: 무료, 스크래핑이므로 동시 실행 수를 낮게 유지
     """
-    검색 함수 (Google 우선, Rate Limit 시 Groq, 최종 폴백 DuckDuckGo)
+    global _default_providers_registered
     
-    우선순위:
+    if _default_providers_registered:
+        return
+    
+    with _default_providers_lock:
+        if _default_providers_registered:
+            return
+        
+        local_path = os.getenv("SEARCH_LOCAL_PATH")
+        if local_path:
+            register_search_provider(SearchProvider(
+                "Local", LocalFileSearch(local_path), cost=0.0, timeout=1.0,
+                max_concurrency=16, expected_latency=0.05, order=0, cacheable=False
+            ), replace=False)
+        
+        register_search_provider(SearchProvider(
+            "Google",
+            lambda query, num_results, priority, timeout: search_keywords_google(query, num_results, priority=priority, timeout=timeout),
+            cost=0.0, timeout=15.0, max_concurrency=4, expected_latency=1.5, order=10,
+            quota_func=get_google_quota_remaining, enabled=USE_GOOGLE_SEARCH
+        ), replace=False)
+        register_search_provider(SearchProvider(
+            "Groq",
+            lambda query, num_results, priority, timeout: search_keywords_groq(query, num_results),
+            cost=1.0, timeout=30.0, max_concurrency=2, expected_latency=4.0, order=20
+        ), replace=False)
+        register_search_provider(SearchProvider(
+            "DuckDuckGo",
+            lambda query, num_results, priority, timeout: search_keywords_duckduckgo(query, num_results, timeout=timeout),
+            cost=0.0, timeout=15.0, max_concurrency=2, expected_latency=2.0, order=30
+        ), replace=False)
+        
+        _default_providers_registered = True
+
+
+def search_keywords(query: str, num_results: int = 10, priority: str = "normal") -> List[Dict[str, str]]:
+    """
+    검색 함수 (등록된 검색 제공자를 순서대로/헤지 실행)
+    
+    기본 순서 (src/services/search_providers.py 레지스트리):
+    0. 로컬 파일 (SEARCH_LOCAL_PATH가 있을 때)
     1. Google Custom Search API (하루 100건 무료)
     2. Groq Search API (Google Rate Limit 시)
     3. DuckDuckGo (최종 폴백)
@@ -286,30 +440,294 @@ def search_keywords(query: str, num_results: int = 10) -> List[Dict[str, str]]:
     환경 변수:
     - GOOGLE_API_KEY: Google Custom Search API 키
     - GOOGLE_CSE_ID: Custom Search Engine ID
+    - GOOGLE_DAILY_QUOTA / GOOGLE_QUOTA_RESERVE: Google 일일 할당량과 high 우선순위용 예비분
+    - SEARCH_COST_BUDGET: 검색 1회당 제공자 비용 예산 (예: 0이면 Groq 제외)
+    - SEARCH_PROVIDER_MODE: sequential(기본값) / hedged
+      (hedged는 지연 시간을 줄이지만 늦은 제공자와 다음 제공자가 모두 할당량/비용을 쓰므로 선택 사항)
+    - SEARCH_HEDGE_DELAY_SECONDS: hedged 모드에서 다음 검색 제공자를 함께 시작하기까지 기다리는 최대 시간
+      (기본값 2, 제공자의 예상 지연 시간이 더 짧으면 그 시간)
+    
+    Args:
+        priority: Google 할당량 우선순위 (high: 예비분까지 사용 / normal / low)
     """
+    _register_default_providers()
+    selected = select_search_providers(priority)
+    
+    if not selected:
+        print(f"  ⚠️  사용할 수 있는 검색 제공자가 없습니다 (예산/할당량)")
+        return []
+    
+    def bind(provider: SearchProvider):
+        def run(query: str, num_results: int = 10):
+            return provider.search(query, num_results, priority)
+        return run
+    
+    providers = [(provider, bind(provider)) for provider in selected]
+    
+    # 검색 캐시: 우선순위가 높은 제공자의 유효한 캐시가 있으면 바로 사용,
+    # 최근에 결과가 없었던 제공자는 건너뜀
+    if _search_cache_enabled():
+        remaining = []
+        for provider, search_func in providers:
+            if not provider.cacheable:
+                remaining.append((provider, search_func))
+                continue
+            cached = _search_cache_get(provider.name, query, num_results)
+            if cached:
+                print(f"  💾 검색 캐시 적중 ({provider.name}): {len(cached)}개 결과")
+                return cached
+            if cached is None:
+                remaining.append((provider, _with_search_cache(provider.name, search_func)))
+        
+        if not remaining:
+            print(f"  💾 검색 캐시: 모든 제공자에서 최근 결과 없음")
+            return []
+        providers = remaining
+    
+    if os.getenv("SEARCH_PROVIDER_MODE", "sequential").lower() == "hedged":
+        return _search_hedged(providers, query, num_results)
+    
+    return _search_sequential(providers, query, num_results)
+
+
+def _search_sequential(providers, query: str, num_results: int) -> List[Dict[str, str]]:
+    """검색 제공자를 순서대로 시도"""
     results = []
     
-    # 1. Google Search API 우선 시도
-    if USE_GOOGLE_SEARCH:
-        print(f"  🔍 Google 검색 시도 중...")
-        results = search_keywords_google(query, num_results)
+    for position, (provider, search_func) in enumerate(providers):
+        name = provider.name
+        print(f"  🔍 {name} 검색 시도 중{' (최종 폴백)' if position == len(providers) - 1 and position > 0 else ''}...")
+        started_at = time.monotonic()
+        results = search_func(query, num_results)
+        if results is None:
+            # 동시 실행 한도/할당량으로 실행하지 않음 (통계에 기록하지 않음)
+            results = []
+        else:
+            _record_provider_result(name, results, time.monotonic() - started_at, won=bool(results))
         if results:
-            print(f"  ✅ Google 검색 성공: {len(results)}개 결과")
+            print(f"  ✅ {name} 검색 성공: {len(results)}개 결과")
             return results
+        if position < len(providers) - 1:
+            print(f"  ⚠️  {name} 검색 실패 또는 Rate Limit, {providers[position + 1][0].name} 검색으로 폴백...")
+    
+    return results
+
+
+def _search_hedged(providers, query: str, num_results: int) -> List[Dict[str, str]]:
+    """
+    헤지 검색: 우선 제공자를 시작하고 예상 지연 시간 안에 결과가 없으면 다음 제공자를 함께 시작
+    
+    결과가 비어 있으면 기다리지 않고 바로 다음 제공자를 시작하며,
+    먼저 유효한 결과를 돌려준 제공자의 결과를 사용합니다.
+    승자가 정해지면 나머지 실행 중인 검색은 기다리지 않고 (통계에만 패자로 기록) 새 제공자도 시작하지 않습니다.
+    """
+    max_hedge_delay = float(os.getenv("SEARCH_HEDGE_DELAY_SECONDS", "2"))
+    executor = _get_provider_executor()
+    
+    winner = {"name": None, "results": None}
+    winner_lock = threading.Lock()
+    
+    def run(name, search_func):
+        started_at = time.monotonic()
+        try:
+            results = search_func(query, num_results)
+        except Exception as e:
+            print(f"  ⚠️  {name} 검색 오류: {e}")
+            results = []
+        if results is None:
+            # 동시 실행 한도/할당량으로 실행하지 않음 (통계에 기록하지 않음)
+            return []
+        latency = time.monotonic() - started_at
+        with winner_lock:
+            won = bool(results) and winner["name"] is None
+            if won:
+                winner["name"] = name
+                winner["results"] = results
+        _record_provider_result(name, results, latency, won=won)
+        return results
+    
+    running = {}
+    next_provider = 0
+    hedge_delay = max_hedge_delay
+    
+    def launch():
+        nonlocal next_provider, hedge_delay
+        provider, search_func = providers[next_provider]
+        next_provider += 1
+        if running:
+            print(f"  🔀 {provider.name} 검색 동시 시작 (앞선 검색 {hedge_delay:g}초 내 응답 없음 또는 실패)")
         else:
-            print(f"  ⚠️  Google 검색 실패 또는 Rate Limit, Groq 검색으로 폴백...")
+            print(f"  🔍 {provider.name} 검색 시도 중...")
+        hedge_delay = min(max_hedge_delay, provider.expected_latency)
+        running[executor.submit(run, provider.name, search_func)] = provider.name
+    
+    launch()
+    
+    while running:
+        timeout = hedge_delay if next_provider < len(providers) else None
+        done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+        
+        with winner_lock:
+            winner_name, winner_results = winner["name"], winner["results"]
+        if winner_name is not None:
+            # 승자가 정해지면 남은 검색 결과는 무시 (실행 중인 검색은 끝나면 통계에만 기록)
+            print(f"  ✅ {winner_name} 검색 성공: {len(winner_results)}개 결과")
+            return winner_results
+        
+        if not done:
+            # 예상 지연 시간 동안 응답 없음 → 다음 제공자 함께 시작
+            launch()
+            continue
+        
+        for future in done:
+            name = running.pop(future)
+            print(f"  ⚠️  {name} 검색 결과 없음 또는 Rate Limit")
+        
+        # 실패한 제공자가 있으면 대기 없이 다음 제공자 시작
+        if next_provider < len(providers) and len(running) < len(providers):
+            launch()
+    
+    return []
+
+
+# 검색 결과 캐시 (SQLite, 정규화된 쿼리 + 제공자 + 결과 수 기준)
+_search_cache_db = None
+_search_cache_lock = threading.Lock()
+
+
+def _search_cache_enabled() -> bool:
+    return os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (유니코드 정규화, 대소문자, 쉼표/공백 정리)"""
+    normalized = unicodedata.normalize("NFKC", query).casefold()
+    normalized = normalized.replace(",", " ")
+    return " ".join(normalized.split())
+
+
+def _search_cache_key(provider: str, query: str, num_results: int) -> str:
+    key_source = f"{provider}\n{normalize_query(query)}\n{num_results}"
+    return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+
+def _get_search_cache_db():
+    global _search_cache_db
+    
+    if _search_cache_db is None:
+        with _search_cache_lock:
+            if _search_cache_db is None:
+                from src.core.database import Database
+                _search_cache_db = Database()
     
-    # 2. Groq Search API 시도 (Google Rate Limit 시)
-    print(f"  🔍 Groq 검색 시도 중...")
-    results = search_keywords_groq(query, num_results)
+    return _search_cache_db
+
+
+def _search_cache_get(provider: str, query: str, num_results: int) -> Optional[List[Dict[str, str]]]:
+    """캐시 조회 (없거나 만료되면 None, 결과 없음이 캐시되어 있으면 빈 목록)"""
+    try:
+        return _get_search_cache_db().get_search_cache(_search_cache_key(provider, query, num_results))
+    except Exception as e:
+        print(f"  ⚠️  검색 캐시 조회 실패: {e}")
+        return None
+
+
+def _search_cache_set(provider: str, query: str, num_results: int, results: List[Dict[str, str]]):
+    """
+    캐시 저장
+    
+    - SEARCH_CACHE_TTL_SECONDS: 결과가 있을 때 유지 시간 (기본값 86400)
+    - SEARCH_CACHE_EMPTY_TTL_SECONDS: 결과가 없을 때 유지 시간 (기본값 900, Rate Limit이 풀리면 다시 시도하도록 짧게)
+    """
     if results:
-        print(f"  ✅ Groq 검색 성공: {len(results)}개 결과")
+        ttl = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "86400"))
+    else:
+        ttl = float(os.getenv("SEARCH_CACHE_EMPTY_TTL_SECONDS", "900"))
+    
+    if ttl <= 0:
+        return
+    
+    try:
+        _get_search_cache_db().set_search_cache(
+            _search_cache_key(provider, query, num_results),
+            provider,
+            normalize_query(query),
+            num_results,
+            results,
+            ttl
+        )
+    except Exception as e:
+        print(f"  ⚠️  검색 캐시 저장 실패: {e}")
+
+
+def _with_search_cache(provider: str, search_func):
+    """검색 함수 결과를 캐시에 저장하도록 감싸기"""
+    def cached_search(query: str, num_results: int = 10) -> Optional[List[Dict[str, str]]]:
+        results = search_func(query, num_results)
+        if results is not None:
+            _search_cache_set(provider, query, num_results, results)
         return results
     
-    # 3. DuckDuckGo 검색 (최종 폴백)
-    print(f"  🔍 DuckDuckGo 검색 시도 중 (최종 폴백)...")
-    results = search_keywords_duckduckgo(query, num_results)
-    if results:
-        print(f"  ✅ DuckDuckGo 검색 성공: {len(results)}개 결과")
+    return cached_search
+
+
+# 헤지 검색용 실행기 (모든 검색 요청이 공유)
+_provider_executor = None
+_provider_executor_lock = threading.Lock()
+
+
+def _get_provider_executor() -> ThreadPoolExecutor:
+    """검색 제공자 실행기 가져오기 (SEARCH_PROVIDER_MAX_WORKERS, 기본값 8)"""
+    global _provider_executor
     
-    return results
+    if _provider_executor is None:
+        with _provider_executor_lock:
+            if _provider_executor is None:
+                _provider_executor = ThreadPoolExecutor(
+                    max_workers=max(1, int(os.getenv("SEARCH_PROVIDER_MAX_WORKERS", "8"))),
+                    thread_name_prefix="search-provider"
+                )
+    
+    return _provider_executor
+
+
+# 검색 제공자별 통계 (승률, 지연 시간)
+_provider_stats: Dict[str, Dict[str, float]] = {}
+_provider_stats_lock = threading.Lock()
+_provider_stats_db = None
+
+
+def _record_provider_result(name: str, results: List[Dict[str, str]], latency: float, won: bool):
+    """검색 제공자 1회 결과 기록 (메모리 + DB 누적)"""
+    global _provider_stats_db
+    
+    with _provider_stats_lock:
+        stats = _provider_stats.setdefault(name, {"calls": 0, "wins": 0, "empty": 0, "total_latency": 0.0, "win_latency": 0.0})
+        stats["calls"] += 1
+        stats["total_latency"] += latency
+        if won:
+            stats["wins"] += 1
+            stats["win_latency"] += latency
+        if not results:
+            stats["empty"] += 1
+    
+    try:
+        if _provider_stats_db is None:
+            from src.core.database import Database
+            _provider_stats_db = Database()
+        _provider_stats_db.record_search_provider_result(name, latency, won, not results)
+    except Exception as e:
+        print(f"  ⚠️  검색 제공자 통계 저장 실패: {e}")
+
+
+def get_search_provider_stats() -> Dict[str, Dict[str, float]]:
+    """현재 프로세스의 검색 제공자별 통계 (호출 수, 승리 수, 빈 결과 수, 평균 지연 시간, 승률)"""
+    with _provider_stats_lock:
+        summary = {}
+        for name, stats in _provider_stats.items():
+            summary[name] = {
+                **stats,
+                "win_rate": stats["wins"] / stats["calls"] if stats["calls"] else 0.0,
+                "avg_latency": stats["total_latency"] / stats["calls"] if stats["calls"] else 0.0,
+            }
+        return summary
@@ -0,0 +1,249 @@
+"""
+검색 제공자 레지스트리
+- 제공자마다 비용, 일일 할당량, 타임아웃, 최대 동시 실행 수, 예상 지연 시간을 선언
+- search_keywords는 레지스트리에서 예산(SEARCH_COST_BUDGET)과 할당량에 맞는 제공자를 골라 순서대로/헤지 실행
+- 로컬 파일 제공자(SEARCH_LOCAL_PATH)로 네트워크 없이 실행 가능
+
+새 제공자 추가 예:
+    from src.services.search_providers import SearchProvider, register_search_provider
+    register_search_provider(SearchProvider("MySearch", my_search, cost=0.0, order=5))
+
+search_func는 (query, num_results, priority, timeout)을 받아 [{"title", "link", "snippet"}, ...]를 돌려줍니다.
+
+환경 변수로 제공자별 설정 덮어쓰기 (이름은 대문자):
+- SEARCH_<NAME>_ENABLED / _COST / _DAILY_QUOTA / _TIMEOUT / _MAX_CONCURRENCY / _EXPECTED_LATENCY / _ORDER
+  (예: SEARCH_DUCKDUCKGO_MAX_CONCURRENCY=2)
+"""
+
+import os
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+SearchFunc = Callable[[str, int, str, float], List[Dict[str, str]]]
+
+
+def _setting(name: str, field: str, default):
+    """제공자별 환경 변수 설정 (없으면 기본값)"""
+    value = os.getenv(f"SEARCH_{name.upper()}_{field}")
+    if value is None or value == "":
+        return default
+    if isinstance(default, bool):
+        return value.lower() == "true"
+    if default is None:
+        return int(value)
+    return type(default)(value)
+
+
+class SearchProvider:
+    """
+    검색 제공자 하나
+
+    Args:
+        name: 표시/통계/캐시 키에 쓰는 이름
+        search_func: (query, num_results, priority, timeout) -> 결과 목록
+        cost: 호출 1회의 상대 비용 (LLM 토큰 등, 0이면 무료)
+        daily_quota: 하루 최대 호출 수 (None이면 무제한, UTC 날짜 기준으로 DB에 기록)
+        timeout: 동시 실행 자리가 날 때까지 기다리는 최대 시간 (초, 제공자 HTTP 요청 타임아웃에도 사용)
+        max_concurrency: 동시에 실행할 수 있는 요청 수 (쿼리 변형 동시 검색 시 부하 제한)
+        expected_latency: 예상 응답 시간 (헤지 모드에서 다음 제공자를 함께 시작하기까지 기다리는 시간,
+                          SEARCH_HEDGE_DELAY_SECONDS를 넘지 않음)
+        order: 시도 순서 (작을수록 먼저)
+        cacheable: 검색 결과 캐시 사용 여부 (로컬 제공자는 캐시 불필요)
+        quota_func: 할당량을 제공자가 직접 관리하는 경우 priority별 남은 호출 수를 돌려주는 함수
+    """
+
+    def __init__(self, name: str, search_func: SearchFunc, cost: float = 0.0, daily_quota: Optional[int] = None,
+                 timeout: float = 15.0, max_concurrency: int = 4, expected_latency: float = 2.0, order: int = 50,
+                 cacheable: bool = True, quota_func: Optional[Callable[[str], int]] = None, enabled: bool = True):
+        self.name = name
+        self.search_func = search_func
+        self.cost = _setting(name, "COST", float(cost))
+        self.daily_quota = _setting(name, "DAILY_QUOTA", daily_quota)
+        self.timeout = _setting(name, "TIMEOUT", float(timeout))
+        self.max_concurrency = max(1, _setting(name, "MAX_CONCURRENCY", int(max_concurrency)))
+        self.expected_latency = _setting(name, "EXPECTED_LATENCY", float(expected_latency))
+        self.order = _setting(name, "ORDER", int(order))
+        self.cacheable = cacheable
+        self.quota_func = quota_func
+        self.enabled = _setting(name, "ENABLED", bool(enabled))
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+
+    @property
+    def quota_key(self) -> str:
+        return f"search_{self.name.lower()}"
+
+    def remaining_quota(self, priority: str = "normal") -> Optional[int]:
+        """오늘 남은 호출 수 (무제한이면 None)"""
+        if self.quota_func is not None:
+            return self.quota_func(priority)
+        if self.daily_quota is None:
+            return None
+        try:
+            used = _get_db().get_api_quota_used(self.quota_key, _utc_date())
+        except Exception as e:
+            print(f"  ⚠️  {self.name} 할당량 조회 실패: {e}")
+            return None
+        return max(0, self.daily_quota - used)
+
+    def available(self, priority: str = "normal") -> bool:
+        if not self.enabled:
+            return False
+        remaining = self.remaining_quota(priority)
+        return remaining is None or remaining > 0
+
+    def search(self, query: str, num_results: int = 10, priority: str = "normal") -> Optional[List[Dict[str, str]]]:
+        """
+        검색 실행 (동시 실행 수/할당량 적용)
+
+        Returns:
+            결과 목록, 자리가 나지 않았거나 할당량이 없어 실행하지 않았으면 None (캐시에 저장하지 않음)
+        """
+        if not self._semaphore.acquire(timeout=self.timeout):
+            print(f"  ⏳ {self.name} 동시 실행 한도({self.max_concurrency}) 초과, 건너뜀")
+            return None
+        try:
+            if self.daily_quota is not None and self.quota_func is None:
+                try:
+                    allowed, used = _get_db().try_consume_api_quota(self.quota_key, _utc_date(), self.daily_quota)
+                except Exception as e:
+                    print(f"  ⚠️  {self.name} 할당량 기록 실패: {e}")
+                    allowed = True
+                if not allowed:
+                    print(f"  ⏭️  {self.name} 일일 할당량 도달 ({used}/{self.daily_quota}), 건너뜀")
+                    return None
+            return self.search_func(query, num_results, priority, self.timeout)
+        finally:
+            self._semaphore.release()
+
+    def describe(self) -> Dict:
+        """설정 요약 (디버깅용)"""
+        return {
+            "name": self.name,
+            "enabled": self.enabled,
+            "order": self.order,
+            "cost": self.cost,
+            "daily_quota": self.daily_quota,
+            "timeout": self.timeout,
+            "max_concurrency": self.max_concurrency,
+            "expected_latency": self.expected_latency,
+            "cacheable": self.cacheable,
+        }
+
+
+_db = None
+_db_lock = threading.Lock()
+
+
+def _get_db():
+    global _db
+
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                from src.core.database import Database
+                _db = Database()
+
+    return _db
+
+
+def _utc_date() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+# 제공자 레지스트리 (이름 → 제공자)
+_providers: Dict[str, SearchProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def register_search_provider(provider: SearchProvider, replace: bool = True):
+    """제공자 등록 (replace=False면 같은 이름이 이미 있을 때 유지)"""
+    with _providers_lock:
+        if replace or provider.name not in _providers:
+            _providers[provider.name] = provider
+
+
+def unregister_search_provider(name: str):
+    with _providers_lock:
+        _providers.pop(name, None)
+
+
+def get_search_providers() -> List[SearchProvider]:
+    """등록된 제공자 (시도 순서대로)"""
+    with _providers_lock:
+        return sorted(_providers.values(), key=lambda p: p.order)
+
+
+def select_search_providers(priority: str = "normal", budget: Optional[float] = None) -> List[SearchProvider]:
+    """
+    이번 검색에 사용할 제공자 선택
+
+    사용 가능한(활성, 할당량 남음) 제공자를 순서대로 고르되,
+    헤지 모드에서 모두 실행되더라도 비용 합계가 예산을 넘지 않도록 합니다.
+
+    - SEARCH_COST_BUDGET: 검색 1회당 비용 예산 (기본값 없음 = 무제한, 0이면 무료 제공자만)
+    """
+    if budget is None:
+        budget_env = os.getenv("SEARCH_COST_BUDGET")
+        budget = float(budget_env) if budget_env else None
+
+    selected = []
+    spent = 0.0
+    for provider in get_search_providers():
+        if not provider.available(priority):
+            continue
+        if budget is not None and spent + provider.cost > budget:
+            continue
+        spent += provider.cost
+        selected.append(provider)
+    return selected
+
+
+class LocalFileSearch:
+    """
+    로컬 파일 검색 제공자 (오프라인 실행/벤치마크용)
+
+    파일 형식 (JSON):
+    - 결과 목록: 모든 쿼리에 같은 결과 사용
+    - {"쿼리": [결과...], "*": [기본 결과...]}: 정규화한 쿼리로 찾고, 없으면 "*" 사용
+    디렉터리를 지정하면 안의 *.json 파일을 모두 합칩니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._entries: Optional[Dict[str, List[Dict[str, str]]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, List[Dict[str, str]]]:
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    from src.services.search import normalize_query
+
+                    files = sorted(self.path.glob("*.json")) if self.path.is_dir() else [self.path]
+                    entries: Dict[str, List[Dict[str, str]]] = {}
+                    for file in files:
+                        with open(file, "r", encoding="utf-8") as f:
+                            data = json.load(f)
+                        if isinstance(data, list):
+                            entries.setdefault("*", []).extend(data)
+                        else:
+                            for query, results in data.items():
+                                key = query if query == "*" else normalize_query(query)
+                                entries.setdefault(key, []).extend(results)
+                    self._entries = entries
+        return self._entries
+
+    def __call__(self, query: str, num_results: int = 10, priority: str = "normal", timeout: float = None) -> List[Dict[str, str]]:
+        from src.services.search import normalize_query
+
+        try:
+            entries = self._load()
+        except (OSError, ValueError) as e:
+            print(f"  ⚠️  로컬 검색 파일 읽기 실패 ({self.path}): {e}")
+            return []
+        results = entries.get(normalize_query(query)) or entries.get("*") or []
+        return results[:num_results]
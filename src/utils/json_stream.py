@@ -0,0 +1,153 @@
+"""
+스트리밍 JSON 필드 추출기
+- LLM이 JSON 객체를 토큰 단위로 보내는 동안 최상위 문자열 필드를 점진적으로 꺼냄
+- 예: {"title": "...", "content": "..."} 에서 title이 끝나는 즉시 사용 가능
+"""
+
+from typing import Dict, List, Iterable, Optional
+
+
+_SIMPLE_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t',
+}
+
+
+class JsonFieldStreamExtractor:
+    """
+    최상위 JSON 객체의 문자열 필드를 청크 단위로 추출
+
+    사용 예:
+        extractor = JsonFieldStreamExtractor(fields=("title", "content"))
+        for chunk in stream:
+            for event in extractor.feed(chunk):
+                # event: {"field": "title", "delta": "...", "done": False}
+                ...
+        extractor.values["title"]  # 지금까지 받은 전체 값
+
+    중첩된 객체/배열 안의 문자열은 건너뛰며, 청크 경계에서 잘린 이스케이프(\\uXXXX 포함)도 처리합니다.
+    """
+
+    def __init__(self, fields: Optional[Iterable[str]] = None):
+        self.fields = set(fields) if fields else None
+        self.values: Dict[str, str] = {}
+        self.completed: List[str] = []
+
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._unicode_buffer: Optional[str] = None
+        self._pending_surrogate: Optional[int] = None
+        self._string_is_value = False
+        self._expect_value = False
+        self._key_buffer: List[str] = []
+        self._current_key: Optional[str] = None
+
+    def _tracking(self) -> bool:
+        """현재 문자열이 추출 대상 필드의 값인지"""
+        if not self._string_is_value or self._current_key is None:
+            return False
+        return self.fields is None or self._current_key in self.fields
+
+    def _append(self, text: str, deltas: Dict[str, List[str]]):
+        if self._string_is_value:
+            if self._tracking():
+                deltas.setdefault(self._current_key, []).append(text)
+        elif self._depth == 1:
+            self._key_buffer.append(text)
+
+    def _decode_unicode(self, code: int) -> str:
+        """\\uXXXX 디코딩 (서로게이트 쌍 결합)"""
+        if 0xD800 <= code <= 0xDBFF:
+            self._pending_surrogate = code
+            return ''
+        if 0xDC00 <= code <= 0xDFFF and self._pending_surrogate is not None:
+            high = self._pending_surrogate
+            self._pending_surrogate = None
+            return chr(0x10000 + ((high - 0xD800) << 10) + (code - 0xDC00))
+        self._pending_surrogate = None
+        return chr(code)
+
+    def feed(self, chunk: str) -> List[Dict]:
+        """
+        청크 입력
+
+        Returns:
+            이벤트 목록 [{"field": 필드명, "delta": 새로 받은 텍스트, "done": 값 완료 여부}]
+        """
+        deltas: Dict[str, List[str]] = {}
+        finished: List[str] = []
+
+        for ch in chunk:
+            if self._in_string:
+                if self._unicode_buffer is not None:
+                    self._unicode_buffer += ch
+                    if len(self._unicode_buffer) == 4:
+                        try:
+                            decoded = self._decode_unicode(int(self._unicode_buffer, 16))
+                        except ValueError:
+                            decoded = ''
+                        self._unicode_buffer = None
+                        if decoded:
+                            self._append(decoded, deltas)
+                elif self._escape:
+                    self._escape = False
+                    if ch == 'u':
+                        self._unicode_buffer = ''
+                    else:
+                        self._append(_SIMPLE_ESCAPES.get(ch, ch), deltas)
+                elif ch == '\\':
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_is_value:
+                        if self._tracking():
+                            deltas.setdefault(self._current_key, [])
+                            finished.append(self._current_key)
+                        self._string_is_value = False
+                        self._expect_value = False
+                    elif self._depth == 1:
+                        self._current_key = ''.join(self._key_buffer)
+                        self._key_buffer = []
+                else:
+                    self._append(ch, deltas)
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_is_value = self._depth == 1 and self._expect_value
+                if self._depth == 1 and not self._expect_value:
+                    self._key_buffer = []
+            elif ch in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_value = False
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 1:
+                    self._expect_value = False
+            elif self._depth == 1:
+                if ch == ':':
+                    self._expect_value = True
+                elif ch == ',':
+                    self._expect_value = False
+
+        events = []
+        for field, parts in deltas.items():
+            delta = ''.join(parts)
+            if delta:
+                self.values[field] = self.values.get(field, '') + delta
+            else:
+                self.values.setdefault(field, '')
+            done = field in finished
+            if done and field not in self.completed:
+                self.completed.append(field)
+            events.append({"field": field, "delta": delta, "done": done})
+
+        return events
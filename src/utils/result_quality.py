@@ -0,0 +1,112 @@
+"""
+검색 결과 품질 점수 (LLM 없이 로컬에서 계산)
+- 키워드 일치: 제목/스니펫에 키워드 단어가 들어 있는 비율
+- 도메인 다양성: 서로 다른 사이트 수
+- 스니펫 길이: 내용이 있는 스니펫인지
+- 문자 일치: 키워드와 같은 문자(한글/영문)로 쓰인 결과인지
+
+SearchAgent가 쿼리 변형을 더 검색할지 판단하는 데 사용해,
+LLM 검색 검증 단계에서 늦게 거부되는 실행을 줄입니다.
+"""
+
+import re
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+
+_HANGUL = re.compile(r'[가-힣]')
+_LATIN = re.compile(r'[A-Za-z]')
+_TOKEN = re.compile(r'[가-힣]+|[A-Za-z0-9][A-Za-z0-9+#.-]*')
+
+# 키워드 일치 판단에서 제외하는 쿼리 변형용 단어
+_STOPWORDS = {"최신", "news", "technology", "the", "and", "of", "for"}
+
+# 점수 가중치 (합계 100)
+_WEIGHTS = {"keyword_overlap": 40, "domain_diversity": 20, "snippet_length": 20, "script_match": 20}
+
+# 스니펫 길이 만점 기준 (글자 수)
+_FULL_SNIPPET_LENGTH = 120
+
+# 결과 수 만점 기준 (이보다 적으면 점수를 비례해서 낮춤)
+_FULL_RESULT_COUNT = 5
+
+
+def keyword_tokens(keyword: str) -> List[str]:
+    """키워드 일치 판단에 쓰는 단어 (소문자, 쿼리 변형용 단어/숫자 제외)"""
+    tokens = [t.lower() for t in _TOKEN.findall(keyword or "")]
+    return [t for t in dict.fromkeys(tokens) if t not in _STOPWORDS and not t.isdigit()]
+
+
+def _script(text: str) -> str:
+    """주로 쓰인 문자 (hangul / latin / other)"""
+    hangul = len(_HANGUL.findall(text))
+    latin = len(_LATIN.findall(text))
+    if hangul == 0 and latin == 0:
+        return "other"
+    return "hangul" if hangul * 2 >= latin else "latin"
+
+
+def _domain(link: str) -> str:
+    host = (urlsplit(link or "").hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+
+def result_relevance(tokens: List[str], result: Dict[str, str]) -> float:
+    """결과 하나의 키워드 일치 비율 (0.0 ~ 1.0, 한글은 조사가 붙어도 일치로 봄)"""
+    if not tokens:
+        return 1.0
+    text = f"{result.get('title', '')} {result.get('snippet', '')}".lower()
+    return sum(1 for token in tokens if token in text) / len(tokens)
+
+
+def score_search_results(keyword: str, results: List[Dict[str, str]]) -> Dict[str, float]:
+    """
+    검색 결과 목록의 품질 점수
+
+    Returns:
+        {"score": 0~100, "keyword_overlap", "domain_diversity", "snippet_length", "script_match": 각 0.0~1.0,
+         "relevant": 키워드가 하나라도 들어 있는 결과 수}
+    """
+    if not results:
+        return {"score": 0.0, "keyword_overlap": 0.0, "domain_diversity": 0.0,
+                "snippet_length": 0.0, "script_match": 0.0, "relevant": 0}
+
+    tokens = keyword_tokens(keyword)
+    keyword_script = _script(keyword)
+    count = len(results)
+
+    relevances = [result_relevance(tokens, r) for r in results]
+    keyword_overlap = sum(relevances) / count
+
+    domains = {_domain(r.get("link", "")) for r in results} - {""}
+    domain_diversity = len(domains) / count if domains else 0.0
+
+    snippet_length = sum(min(len((r.get("snippet") or "").strip()) / _FULL_SNIPPET_LENGTH, 1.0) for r in results) / count
+
+    script_scores = []
+    for r in results:
+        result_script = _script(f"{r.get('title', '')} {r.get('snippet', '')}")
+        if keyword_script == "other" or result_script == keyword_script:
+            script_scores.append(1.0)
+        elif keyword_script == "hangul" and result_script == "latin":
+            # 한글 키워드의 영문 기술 문서는 절반만 인정
+            script_scores.append(0.5)
+        else:
+            script_scores.append(0.0)
+    script_match = sum(script_scores) / count
+
+    metrics = {
+        "keyword_overlap": keyword_overlap,
+        "domain_diversity": domain_diversity,
+        "snippet_length": snippet_length,
+        "script_match": script_match,
+    }
+    score = sum(_WEIGHTS[name] * value for name, value in metrics.items())
+    score *= min(count, _FULL_RESULT_COUNT) / _FULL_RESULT_COUNT
+
+    return {"score": round(score, 1), **{k: round(v, 2) for k, v in metrics.items()},
+            "relevant": sum(1 for r in relevances if r > 0)}
+
@@ -0,0 +1,129 @@
+"""
+웹 페이지 본문 추출 및 키워드 관련 발췌
+- 스크립트/스타일/내비게이션/헤더/푸터 등 본문이 아닌 영역 제거
+- <article>/<main>이 있으면 그 안의 텍스트만 사용
+- 본문을 문단 단위 발췌로 나누고 키워드 일치가 높은 발췌를 토큰 예산 안에서 선택
+
+콘텐츠 생성 프롬프트에 검색 스니펫(약 150자) 대신 실제 문서의 관련 문단을 넣는 데 사용합니다.
+"""
+
+import re
+import html as html_lib
+from typing import List
+
+from src.utils.result_quality import keyword_tokens
+
+
+# 내용까지 통째로 버리는 태그
+_DROP_BLOCKS = re.compile(
+    r'<(script|style|noscript|template|svg|nav|header|footer|aside|form|iframe|button|select)\b[^>]*>.*?</\1\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+_COMMENTS = re.compile(r'<!--.*?-->', re.DOTALL)
+_MAIN_CONTAINER = re.compile(r'<(article|main)\b[^>]*>(.*?)</\1\s*>', re.IGNORECASE | re.DOTALL)
+# 문단 경계로 보는 태그
+_BLOCK_TAGS = re.compile(r'</?(p|div|section|h[1-6]|li|ul|ol|tr|table|blockquote|pre|br|dd|dt)\b[^>]*>', re.IGNORECASE)
+_TAGS = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'[ \t\r\f\v\xa0]+')
+_SENTENCE_END = re.compile(r'(?<=[.!?。])\s+')
+
+# 문단으로 인정하는 최소 글자 수 (메뉴/버튼 텍스트 제외)
+_MIN_PARAGRAPH_CHARS = 40
+
+# 발췌 하나의 최대 글자 수 (긴 문단은 문장 단위로 나눔)
+_MAX_PASSAGE_CHARS = 600
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (BaseAgent._estimate_tokens와 같은 기준: 3자당 1토큰)"""
+    return len(text) // 3 + 1
+
+
+def extract_main_text(page: str) -> str:
+    """
+    HTML에서 본문 텍스트 추출
+
+    Returns:
+        문단을 줄바꿈으로 구분한 텍스트 (짧은 메뉴/링크 문구는 제외)
+    """
+    if not page:
+        return ""
+
+    page = _COMMENTS.sub(" ", page)
+    page = _DROP_BLOCKS.sub(" ", page)
+
+    # <article>/<main>이 있으면 가장 긴 것만 사용
+    containers = [m.group(2) for m in _MAIN_CONTAINER.finditer(page)]
+    if containers:
+        page = max(containers, key=len)
+
+    page = _BLOCK_TAGS.sub("\n", page)
+    page = html_lib.unescape(_TAGS.sub(" ", page))
+
+    paragraphs = []
+    for line in page.split("\n"):
+        line = _SPACES.sub(" ", line).strip()
+        if len(line) >= _MIN_PARAGRAPH_CHARS:
+            paragraphs.append(line)
+    return "\n".join(paragraphs)
+
+
+def split_passages(text: str, max_chars: int = _MAX_PASSAGE_CHARS) -> List[str]:
+    """본문을 발췌 단위로 나누기 (문단 기준, 긴 문단은 문장 경계에서 나눔)"""
+    passages = []
+    for paragraph in text.split("\n"):
+        if len(paragraph) <= max_chars:
+            if paragraph:
+                passages.append(paragraph)
+            continue
+
+        current = ""
+        for sentence in _SENTENCE_END.split(paragraph):
+            if not sentence:
+                continue
+            if current and len(current) + len(sentence) + 1 > max_chars:
+                passages.append(current)
+                current = ""
+            current = f"{current} {sentence}".strip() if current else sentence
+            while len(current) > max_chars:
+                passages.append(current[:max_chars])
+                current = current[max_chars:]
+        if current:
+            passages.append(current)
+    return passages
+
+
+def select_passages(keyword: str, text: str, token_budget: int) -> List[str]:
+    """
+    키워드와 관련이 높은 발췌를 토큰 예산 안에서 선택
+
+    점수 = 키워드 단어 일치 비율 + 등장 횟수 밀도(짧은 발췌에서 키워드가 자주 나올수록 높음).
+    키워드가 하나도 없는 발췌는 선택하지 않으며, 선택한 발췌는 원문 순서로 돌려줍니다.
+    """
+    if not text or token_budget <= 0:
+        return []
+
+    tokens = keyword_tokens(keyword)
+    scored = []
+    for index, passage in enumerate(split_passages(text)):
+        lowered = passage.lower()
+        if tokens:
+            matched = [t for t in tokens if t in lowered]
+            if not matched:
+                continue
+            hits = sum(lowered.count(t) for t in matched)
+            score = len(matched) / len(tokens) + min(hits * 100 / len(passage), 1.0)
+        else:
+            score = 1.0
+        scored.append((score, index, passage))
+
+    selected = []
+    used = 0
+    for score, index, passage in sorted(scored, key=lambda item: (-item[0], item[1])):
+        cost = estimate_tokens(passage)
+        if used + cost > token_budget:
+            continue
+        selected.append((index, passage))
+        used += cost
+
+    return [passage for _, passage in sorted(selected)]
@@ -0,0 +1,169 @@
+"""
+검색 결과 URL 정규화 및 중복 제거
+- 리디렉션 링크 풀기 (DuckDuckGo //duckduckgo.com/l/?uddg=..., Google /url?q=...)
+- 추적용 쿼리 파라미터 제거 (utm_*, gclid, fbclid 등)
+- 호스트 정규화 (소문자, 기본 포트/끝 점 제거)
+- 같은 문서(www./m. 차이, 끝 슬래시, 파라미터 순서 차이 포함)와 같은 스니펫을 하나만 남김
+
+정규화한 URL은 중복 판단/캐시 키로만 사용합니다. 쿼리를 다시 인코딩하고 #fragment를 버리므로
+서버에 따라 다른 페이지가 될 수 있어, 실제 요청과 결과 링크에는 resolve_url(리디렉션만 푼 원래 URL)을 사용합니다.
+"""
+
+from typing import Dict, List
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+
+# 추적용 쿼리 파라미터 (접두사 포함)
+_TRACKING_PARAMS = {
+    "gclid", "gclsrc", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "_hsenc", "_hsmi", "ref_src", "ref_url", "spm", "scm", "rut", "srsltid",
+}
+_TRACKING_PREFIXES = ("utm_", "pk_", "mtm_", "hmb_")
+
+# 리디렉션 링크: (호스트 접미사, 경로, 실제 URL이 담긴 파라미터)
+_REDIRECTS = [
+    ("duckduckgo.com", "/l/", ("uddg",)),
+    ("google.com", "/url", ("q", "url")),
+    ("bing.com", "/ck/a", ("u",)),
+]
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+# 중복 판단 시 무시하는 호스트 접두사
+_HOST_ALIASES = ("www.", "m.", "mobile.")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in _TRACKING_PARAMS or name.startswith(_TRACKING_PREFIXES)
+
+
+def _unwrap_redirect(url: str) -> str:
+    """검색 엔진 리디렉션 링크면 실제 URL 반환 (여러 번 감싼 경우도 처리)"""
+    for _ in range(3):
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+        target = None
+        for host_suffix, path, params in _REDIRECTS:
+            if (host == host_suffix or host.endswith("." + host_suffix)) and parts.path.startswith(path):
+                query = dict(parse_qsl(parts.query))
+                target = next((query[p] for p in params if query.get(p)), None)
+                break
+        if not target:
+            return url
+        # Bing은 "a1" + base64 형태라 풀 수 없으면 그대로 둠
+        if not target.startswith(("http://", "https://", "//")):
+            return url
+        url = "https:" + target if target.startswith("//") else target
+    return url
+
+
+def resolve_url(url: str) -> str:
+    """
+    검색 엔진 리디렉션만 풀고 나머지는 그대로 둔 URL (요청/표시용)
+
+    쿼리 인코딩, 파라미터 순서, #fragment를 바꾸지 않습니다.
+    """
+    if not url:
+        return url
+
+    url = url.strip()
+    if url.startswith("//"):
+        url = "https:" + url
+    return _unwrap_redirect(url)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    검색 결과 링크를 실제 문서 URL로 정규화 (중복 판단/캐시 키용, 요청에는 resolve_url 사용)
+
+    - 리디렉션을 풀고 추적 파라미터와 #fragment를 제거
+    - 스킴/호스트는 소문자로, 기본 포트는 제거
+    - http(s) URL이 아니면 그대로 반환
+    """
+    url = resolve_url(url)
+    if not url:
+        return url
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return url
+
+    host = parts.hostname.lower().rstrip(".")
+    if ":" in host:
+        host = f"[{host}]"  # IPv6
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port is None or str(port) == _DEFAULT_PORTS.get(scheme) else f"{host}:{port}"
+
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking_param(k)]
+    return urlunsplit((scheme, netloc, parts.path or "/", urlencode(query), ""))
+
+
+def url_dedupe_key(url: str) -> str:
+    """
+    같은 문서 판단용 키
+
+    canonicalize_url 결과에서 스킴, www./m. 접두사, 끝 슬래시, 파라미터 순서 차이를 무시합니다.
+    """
+    canonical = canonicalize_url(url)
+    parts = urlsplit(canonical)
+    if not parts.hostname:
+        return canonical
+
+    host = parts.netloc
+    for alias in _HOST_ALIASES:
+        if host.startswith(alias):
+            host = host[len(alias):]
+            break
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def _snippet_key(snippet: str) -> str:
+    return " ".join((snippet or "").lower().split())[:200]
+
+
+def dedupe_search_results(results: List[Dict[str, str]], max_results: int = None) -> List[Dict[str, str]]:
+    """
+    리디렉션 링크를 풀고 같은 문서/같은 스니펫 결과를 제거 (먼저 나온 결과 유지)
+
+    같은 문서인지는 정규화한 URL로 판단하고, 결과의 link는 리디렉션만 푼 원래 URL로 둡니다.
+
+    여러 제공자(Google, Groq, DuckDuckGo)나 쿼리 변형에서 온 결과가 섞여도
+    검증/사실 확인 에이전트 프롬프트에 같은 내용이 두 번 들어가지 않도록 합니다.
+    """
+    deduped = []
+    seen_links = set()
+    seen_snippets = set()
+
+    for result in results:
+        link = result.get("link", "")
+        resolved = resolve_url(link) if link else link
+
+        link_key = url_dedupe_key(resolved) if resolved else None
+        if link_key and link_key in seen_links:
+            continue
+
+        # 다른 URL이라도 스니펫이 같으면 같은 글의 복사본으로 보고 제외
+        snippet_key = _snippet_key(result.get("snippet", ""))
+        if len(snippet_key) >= 40 and snippet_key in seen_snippets:
+            continue
+
+        if link_key:
+            seen_links.add(link_key)
+        if snippet_key:
+            seen_snippets.add(snippet_key)
+        deduped.append({**result, "link": resolved} if resolved != link else result)
+
+        if max_results and len(deduped) >= max_results:
+            break
+
+    return deduped
@@ -0,0 +1,54 @@
+"""
+Groq 키 스케줄러 토큰 버킷 테스트
+"""
+
+import pytest
+
+from src.services import groq_rate_limiter
+from src.services.groq_rate_limiter import GroqKeyScheduler, TokenBucket
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """acquire가 잠들면 실패 (대기 없이 끝나야 하는 경우)"""
+    def fail(seconds):
+        raise AssertionError(f"unexpected sleep({seconds})")
+    monkeypatch.setattr(groq_rate_limiter.time, "sleep", fail)
+
+
+def test_bucket_allows_request_larger_than_capacity_when_full():
+    bucket = TokenBucket(1000, 1000 / 60.0)
+
+    assert bucket.wait_time(1500) == 0.0
+    assert bucket.fraction_after(1500) == 0.0
+
+
+def test_bucket_waits_for_full_capacity_after_oversized_request():
+    bucket = TokenBucket(1000, 1000 / 60.0)
+    bucket.consume(1500)
+
+    # 실제 사용량만큼 차감되어 가득 찰 때까지 (1500토큰분) 기다림
+    assert bucket.wait_time(1500) == pytest.approx(90.0)
+
+
+def test_acquire_estimate_above_capacity_returns_key(monkeypatch, no_sleep):
+    monkeypatch.setenv("GROQ_TPM_LIMIT", "1000")
+    scheduler = GroqKeyScheduler(["key-1"])
+
+    key_index, waited = scheduler.acquire(1500)
+
+    assert key_index == 0
+    assert waited == 0.0
+
+
+def test_acquire_estimate_above_synced_capacity_returns_key(no_sleep):
+    scheduler = GroqKeyScheduler(["key-1"])
+    scheduler.update_from_headers(0, {
+        "x-ratelimit-limit-tokens": "800",
+        "x-ratelimit-remaining-tokens": "800",
+    })
+
+    key_index, waited = scheduler.acquire(5000)
+
+    assert key_index == 0
+    assert waited == 0.0
@@ -0,0 +1,41 @@
+"""
+마크다운 → 노션 블록 컴파일러 테스트 (Notion API rich_text 제한)
+"""
+
+from src.services.notion_markdown import RICH_TEXT_MAX_ITEMS, compile_markdown
+
+
+def _formatted_text(items: int) -> str:
+    """parse_inline 결과가 rich_text 항목 items*2개가 되는 문장"""
+    return " ".join(f"**굵게{i}** 보통" for i in range(items))
+
+
+def _rich_text_counts(blocks):
+    for block in blocks:
+        body = block[block["type"]]
+        yield block["type"], len(body["rich_text"])
+        yield from _rich_text_counts(body.get("children", []))
+
+
+def test_quote_rich_text_split_into_blocks_of_at_most_100():
+    blocks = compile_markdown("> " + _formatted_text(120))
+
+    assert [block["type"] for block in blocks] == ["quote"] * 3
+    assert all(count <= RICH_TEXT_MAX_ITEMS for _, count in _rich_text_counts(blocks))
+    assert sum(count for _, count in _rich_text_counts(blocks)) == 240
+
+
+def test_list_item_rich_text_split_and_children_attach_to_last_piece():
+    blocks = compile_markdown("- " + _formatted_text(120) + "\n  - 하위 항목")
+
+    assert [block["type"] for block in blocks] == ["bulleted_list_item"] * 3
+    assert all(count <= RICH_TEXT_MAX_ITEMS for _, count in _rich_text_counts(blocks))
+    assert "children" not in blocks[0]["bulleted_list_item"]
+    assert len(blocks[-1]["bulleted_list_item"]["children"]) == 1
+
+
+def test_heading_rich_text_capped_at_100():
+    blocks = compile_markdown("## " + _formatted_text(120))
+
+    assert len(blocks) == 1
+    assert len(blocks[0]["heading_2"]["rich_text"]) == RICH_TEXT_MAX_ITEMS
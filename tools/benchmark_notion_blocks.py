@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+마크다운 → 노션 블록 변환 벤치마크 (기존 줄 단위 변환 vs 컴파일러)
+
+- 마크다운 파일(--files glob)이나 DB에 저장된 포스팅(--from-db)으로 측정
+- 둘 다 없으면 콘텐츠 프롬프트가 요구하는 형식(소제목, 목록, 굵게, 코드, 링크)의 합성 포스팅과
+  서식 없는 문단 위주의 합성 포스팅 사용
+- --scale로 합성 포스팅을 반복해 큰 문서에서의 차이를 확인
+- 속도와 함께 블록 종류별 개수, 서식(annotations)이 붙은 rich_text 수를 비교
+- 속도 합계는 두 변환의 블록이 같은 문서만 포함 (기존 변환은 목록/코드/인라인 서식을 문단으로 두므로
+  서식이 있는 문서에서는 컴파일러가 더 많은 일을 함 - 따로 표시)
+
+사용 예:
+    python tools/benchmark_notion_blocks.py --repeat 200
+    python tools/benchmark_notion_blocks.py --scale 20 --repeat 20
+    python tools/benchmark_notion_blocks.py --from-db --repeat 50
+"""
+
+import sys
+import glob
+import time
+import sqlite3
+import argparse
+import statistics
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.services.notion_markdown import compile_markdown
+
+
+def legacy_markdown_to_notion_blocks(markdown_text: str) -> List[Dict]:
+    """기존 변환 (줄마다 re import/정규식 생성, 링크는 str.find로 다시 검색, 인라인 서식 없음)"""
+    blocks = []
+    lines = markdown_text.split('\n')
+    
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        
+        if not line:
+            i += 1
+            continue
+        
+        # 제목 (### 제목)
+        if line.startswith('### '):
+            blocks.append({
+                "object": "block",
+                "type": "heading_3",
+                "heading_3": {
+                    "rich_text": [{
+                        "type": "text",
+                        "text": {"content": line[4:]}
+                    }]
+                }
+            })
+        
+        # 제목 (## 제목)
+        elif line.startswith('## '):
+            heading_text = line[3:].strip()
+            # Notion API 제한: heading_2는 최대 2000자
+            if len(heading_text) > 2000:
+                heading_text = heading_text[:1997] + "..."
+            blocks.append({
+                "object": "block",
+                "type": "heading_2",
+                "heading_2": {
+                    "rich_text": [{
+                        "type": "text",
+                        "text": {"content": heading_text}
+                    }]
+                }
+            })
+        
+        # 제목 (# 제목)
+        elif line.startswith('# '):
+            heading_text = line[2:].strip()
+            
+            # Notion API 제한: heading_1은 최대 2000자
+            if len(heading_text) > 2000:
+                heading_text = heading_text[:1997] + "..."
+            
+            blocks.append({
+                "object": "block",
+                "type": "heading_1",
+                "heading_1": {
+                    "rich_text": [{
+                        "type": "text",
+                        "text": {"content": heading_text}
+                    }]
+                }
+            })
+        
+        # 구분선 (---)
+        elif line == '---' or line.startswith('---'):
+            blocks.append({
+                "object": "block",
+                "type": "divider",
+                "divider": {}
+            })
+        
+        # 링크 ([텍스트](URL))
+        elif '[' in line and '](' in line:
+            import re
+            link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
+            matches = re.findall(link_pattern, line)
+            
+            rich_text = []
+            last_end = 0
+            current_line = line
+            
+            for match_text, match_url in matches:
+                # 링크 앞의 텍스트
+                link_pattern_full = f'[{match_text}]({match_url})'
+                link_start = current_line.find(link_pattern_full, last_end)
+                
+                if link_start > last_end:
+                    before_text = current_line[last_end:link_start].strip()
+                    if before_text:
+                        rich_text.append({
+                            "type": "text",
+                            "text": {"content": before_text}
+                        })
+                
+                # 링크 (Notion API 형식)
+                rich_text.append({
+                    "type": "text",
+                    "text": {
+                        "content": match_text,
+                        "link": {"url": match_url}
+                    }
+                })
+                
+                last_end = link_start + len(link_pattern_full)
+            
+            # 링크 뒤의 텍스트
+            if last_end < len(current_line):
+                after_text = current_line[last_end:].strip()
+                if after_text:
+                    rich_text.append({
+                        "type": "text",
+                        "text": {"content": after_text}
+                    })
+            
+            if not rich_text:
+                rich_text = [{"type": "text", "text": {"content": line}}]
+            
+            blocks.append({
+                "object": "block",
+                "type": "paragraph",
+                "paragraph": {"rich_text": rich_text}
+            })
+        
+        # 일반 텍스트
+        else:
+            # HTML 태그 제거 (예: <small>)
+            import re
+            clean_line = re.sub(r'<[^>]+>', '', line)
+            
+            if clean_line:
+                blocks.append({
+                    "object": "block",
+                    "type": "paragraph",
+                    "paragraph": {
+                        "rich_text": [{
+                            "type": "text",
+                            "text": {"content": clean_line}
+                        }]
+                    }
+                })
+        
+        i += 1
+    
+    return blocks
+
+
+def synthetic_post(scale: int = 1) -> str:
+    """콘텐츠 생성 프롬프트 형식을 흉내 낸 포스팅 (scale배 반복)"""
+    section = """## 🤔 처음 마주한 **데이터 전처리**
+
+처음에는 `pandas`가 무엇인지도 몰랐습니다. 하지만 [공식 문서](https://pandas.pydata.org/docs/)를 읽으며 **핵심 개념**을 하나씩 정리했습니다.
+
+### 배운 점
+
+- **결측치 처리**: `dropna()`와 `fillna()`의 차이
+- *정규화*와 표준화는 목적이 다릅니다
+  - 최소-최대 정규화
+  - Z-점수 표준화
+- 참고: [Scikit-learn 가이드](https://scikit-learn.org/stable/modules/preprocessing.html)
+
+1. 데이터를 불러옵니다
+2. 결측치를 확인합니다
+3. **스케일링**을 적용합니다
+
+> 데이터 품질이 모델 품질을 결정합니다. — [출처](https://example.com/quote)
+
+```python
+import pandas as pd
+df = pd.read_csv("data.csv")
+df = df.fillna(0)
+```
+
+이 과정을 거치며 전처리가 단순한 정리 작업이 아니라는 것을 깨달았습니다. 다음 단계에서는 ~~막연한 추측~~ 대신 실험으로 확인해 보려고 합니다.
+
+---
+"""
+    return "# 데이터 전처리 학습 이야기\n\n" + section * scale
+
+
+def plain_post(scale: int = 1) -> str:
+    """서식 없는 문단 위주 포스팅 (기존 변환이 처리하던 형태, 줄 단위 처리 비용 비교용)"""
+    paragraph = "처음에는 데이터 전처리가 무엇인지도 몰랐습니다. 공식 문서를 읽으며 핵심 개념을 하나씩 정리했습니다.\n"
+    return "# 데이터 전처리 학습 이야기\n\n" + ("## 배운 점\n\n" + paragraph * 20 + "\n---\n") * scale
+
+
+def load_db_posts(limit: int = 20) -> List[str]:
+    """DB에 저장된 포스팅 본문"""
+    db_path = project_root / "data" / "keywords.db"
+    if not db_path.exists():
+        return []
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT content FROM posts WHERE content IS NOT NULL ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+    except sqlite3.Error:
+        return []
+    finally:
+        conn.close()
+    return [row[0] for row in rows if row[0]]
+
+
+def _summary(blocks: List[Dict]) -> str:
+    types = Counter()
+    annotated = 0
+
+    def walk(items):
+        nonlocal annotated
+        for block in items:
+            types[block["type"]] += 1
+            body = block[block["type"]]
+            annotated += sum(1 for item in body.get("rich_text", []) if item.get("annotations") or item["text"].get("link"))
+            walk(body.get("children", []))
+
+    walk(blocks)
+    kinds = ", ".join(f"{name} {count}" for name, count in types.most_common())
+    return f"블록 {sum(types.values())}개 ({kinds}), 서식/링크 {annotated}개"
+
+
+def _measure(func, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마크다운 → 노션 블록 변환 벤치마크")
+    parser.add_argument("--files", help="마크다운 파일 glob")
+    parser.add_argument("--from-db", action="store_true", help="DB에 저장된 포스팅 사용")
+    parser.add_argument("--scale", type=int, default=10, help="합성 포스팅 반복 횟수")
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    documents = []
+    if args.files:
+        documents = [(Path(p).name, Path(p).read_text(encoding="utf-8")) for p in sorted(glob.glob(args.files))]
+    if args.from_db:
+        documents += [(f"post{i + 1}", text) for i, text in enumerate(load_db_posts())]
+    if not documents:
+        documents = [(f"synthetic x{args.scale}", synthetic_post(args.scale)), (f"plain x{args.scale}", plain_post(args.scale))]
+
+    print(f"🧪 마크다운 → 노션 블록 벤치마크: 문서 {len(documents)}개, {args.repeat}회 반복\n")
+
+    total_legacy = 0.0
+    total_compiled = 0.0
+    different = []
+    for name, text in documents:
+        legacy_times = _measure(lambda: legacy_markdown_to_notion_blocks(text), args.repeat)
+        compiled_times = _measure(lambda: compile_markdown(text), args.repeat)
+        legacy_median = statistics.median(legacy_times)
+        compiled_median = statistics.median(compiled_times)
+        same_blocks = legacy_markdown_to_notion_blocks(text) == compile_markdown(text)
+        if same_blocks:
+            total_legacy += legacy_median
+            total_compiled += compiled_median
+        else:
+            different.append((name, legacy_median / compiled_median if compiled_median else float("inf")))
+
+        print(f"📄 {name} ({len(text):,}자, {text.count(chr(10)) + 1:,}줄)")
+        print(f"   기존      : {legacy_median * 1000:7.3f}ms, {_summary(legacy_markdown_to_notion_blocks(text))}")
+        print(f"   컴파일러  : {compiled_median * 1000:7.3f}ms, {_summary(compile_markdown(text))}")
+        print(f"   블록 비교 : {'같음' if same_blocks else '다름 (속도 합계에서 제외)'}")
+
+    print("\n" + "=" * 60)
+    if total_compiled:
+        speedup = total_legacy / total_compiled
+        print(f"📊 블록이 같은 문서의 중앙값 합계: 기존 {total_legacy * 1000:.3f}ms, "
+              f"컴파일러 {total_compiled * 1000:.3f}ms ({speedup:.2f}배)")
+    else:
+        print("📊 두 변환의 블록이 같은 문서가 없어 속도를 비교하지 않음")
+    for name, speedup in different:
+        print(f"⚠️  {name}: 블록이 달라 같은 일의 비교가 아님 ({speedup:.2f}배, 컴파일러는 목록/코드/서식까지 변환)")
+
+
+if __name__ == '__main__':
+    main()
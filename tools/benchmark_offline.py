@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+오프라인 벤치마크 (네트워크 없이 AgentChain / auto_poster 전체 흐름 측정)
+
+- tools/groq_stub_server.py의 스텁 서버를 백그라운드로 띄우고 Groq/Notion 요청을 그쪽으로 보냄
+- 검색은 고정 결과(--search-fixture 또는 내장 결과)로 대체
+- 두 모드 모두 임시 DB를 사용 (chain: 빈 DB, auto-poster: 실행마다 기존 DB 복사본) - git commit/push는 하지 않음
+- --replay: 스텁 대신 녹화된 HTTP 카세트(src/services/cassette.py)로 실제 실행을 재현
+  (녹화: HTTP_CASSETTE_MODE=record python scripts/auto_poster.py)
+
+사용 예:
+    python tools/benchmark_offline.py --runs 3 --latency 0.3
+    python tools/benchmark_offline.py --mode auto-poster --storm 3:6 --retry-after 1
+    python tools/benchmark_offline.py --mode auto-poster --replay data/cassettes/http_cassette.jsonl --time-scale 0
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import sqlite3
+import tempfile
+import statistics
+from pathlib import Path
+from datetime import datetime, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from groq_stub_server import GroqStubServer, build_arg_parser, state_from_args
+
+
+def _default_search_results(keyword: str):
+    """내장 검색 결과 (검증 에이전트가 통과시킬 수 있도록 키워드 포함)"""
+    return [
+        {
+            "title": f"{keyword} - 개요 {i + 1}",
+            "link": f"https://example.com/{i + 1}",
+            "snippet": f"{keyword}에 대한 설명 {i + 1}. {keyword} is explained with examples and references.",
+        }
+        for i in range(5)
+    ]
+
+
+def _install_search_fixture(fixture_path: str = None):
+    """SearchAgent가 네트워크 대신 고정 결과를 쓰도록 교체"""
+    import agents.search_agent as search_agent_module
+
+    fixture = None
+    if fixture_path:
+        with open(fixture_path, "r", encoding="utf-8") as f:
+            fixture = json.load(f)
+
+    def fixture_search(query: str, num_results: int = 10, priority: str = "normal"):
+        results = fixture if fixture is not None else _default_search_results(query)
+        return results[:num_results]
+
+    search_agent_module.search_keywords = fixture_search
+
+
+def _percentile(values, ratio: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_chain(args) -> list:
+    """AgentChain.process 반복 실행 (빈 임시 DB 사용, 실제 data/keywords.db에 캐시/통계를 남기지 않음)"""
+    # DB 싱글톤이 처음 만든 경로를 계속 쓰므로 에이전트 생성 전에 한 번만 설정
+    temp_dir = tempfile.mkdtemp(prefix="chain_bench_")
+    os.environ["KEYWORDS_DB_PATH"] = os.path.join(temp_dir, "keywords.db")
+    try:
+        return _run_chain(args)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _run_chain(args) -> list:
+    from agents.agent_chain import AgentChain
+
+    timings = []
+    for run in range(args.runs):
+        chain = AgentChain()
+        started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        result = chain.process(args.keyword, language=args.language, skip_posting=True)
+        elapsed = time.perf_counter() - started_at
+        cpu_time = time.process_time() - cpu_started_at
+        usage = result.get("llm_usage", {}).get("total", {})
+        timings.append((elapsed, cpu_time))
+        print(f"\n⏱️  실행 {run + 1}/{args.runs}: {result['status']} - {elapsed:.2f}초, CPU {cpu_time:.2f}초 "
+              f"(LLM {usage.get('calls', 0)}회, 토큰 {usage.get('total_tokens', 0):,}, 대기 {usage.get('wait_seconds', 0):.1f}초)")
+    return timings
+
+
+def run_auto_poster(args) -> list:
+    """auto_poster 전체 흐름 반복 실행 (임시 DB, git push 없음, 평일 오전으로 고정)"""
+    import scripts.auto_poster as auto_poster
+    from src.core.database import Database
+
+    class _WeekdayMorning(datetime):
+        """요일/시간 조건을 통과하도록 가장 가까운 월요일 10시로 고정"""
+
+        @classmethod
+        def now(cls, tz=None):
+            now = datetime.now(tz)
+            monday = now + timedelta(days=(7 - now.weekday()) % 7)
+            return monday.replace(hour=10, minute=0, second=0, microsecond=0)
+
+    auto_poster.commit_and_push_posting = lambda keyword, timestamp=None: print("  ⏭️  (벤치마크) git commit/push 생략")
+    auto_poster.datetime = _WeekdayMorning
+
+    timings = []
+    for run in range(args.runs):
+        temp_dir = tempfile.mkdtemp(prefix="autoposter_bench_")
+        db_path = os.path.join(temp_dir, "keywords.db")
+        source_db = project_root / "data" / "keywords.db"
+        if source_db.exists() and not args.empty_db:
+            shutil.copy(source_db, db_path)
+        os.environ["KEYWORDS_DB_PATH"] = db_path
+
+        db = Database()
+
+        # 커리큘럼 모드용 컬럼 (scripts/setup_curriculum.py와 동일)
+        conn = db._get_connection()
+        try:
+            conn.execute("ALTER TABLE keywords ADD COLUMN sequence_number INTEGER")
+            conn.commit()
+        except sqlite3.OperationalError:
+            pass
+        finally:
+            conn.close()
+
+        if not db.get_first_active_keyword():
+            db.add_keyword(args.keyword, category="IT/컴퓨터", is_active=True, sequence_number=1)
+
+        started_at = time.perf_counter()
+        cpu_started_at = time.process_time()
+        try:
+            auto_poster.process_single_keyword_dual_language()
+        finally:
+            elapsed = time.perf_counter() - started_at
+            cpu_time = time.process_time() - cpu_started_at
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        timings.append((elapsed, cpu_time))
+        print(f"\n⏱️  실행 {run + 1}/{args.runs}: {elapsed:.2f}초, CPU {cpu_time:.2f}초")
+    return timings
+
+
+def main():
+    parser = build_arg_parser()
+    parser.description = "오프라인 벤치마크 (스텁 서버 + 고정 검색 결과)"
+    parser.set_defaults(port=0)
+    parser.add_argument("--mode", choices=["chain", "auto-poster"], default="chain")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--keyword", default="파이썬 기초")
+    parser.add_argument("--language", default="korean", choices=["korean", "english"])
+    parser.add_argument("--search-fixture", default=None, help="검색 결과 JSON 파일 (결과 목록)")
+    parser.add_argument("--live-search", action="store_true", help="검색은 실제 네트워크 사용")
+    parser.add_argument("--use-llm-cache", action="store_true", help="LLM 응답 캐시 사용 (기본: 끔)")
+    parser.add_argument("--empty-db", action="store_true", help="auto-poster 모드에서 기존 DB를 복사하지 않음")
+    parser.add_argument("--replay", default=None, metavar="CASSETTE", help="스텁 대신 HTTP 카세트 재생")
+    parser.add_argument("--time-scale", type=float, default=0.0, help="카세트 재생 지연 배율 (0 = 지연 없음)")
+    args = parser.parse_args()
+
+    from src.core.config import load_env_file
+    load_env_file()
+
+    # 설정은 .env보다 우선하도록 에이전트/세션 생성 전에 적용
+    server = None
+    if args.replay:
+        os.environ["HTTP_CASSETTE_MODE"] = "replay"
+        os.environ["HTTP_CASSETTE_PATH"] = args.replay
+        os.environ["HTTP_CASSETTE_TIME_SCALE"] = str(args.time_scale)
+        target = f"카세트 {args.replay} (지연 배율 {args.time_scale:g})"
+        if args.search_fixture:
+            _install_search_fixture(args.search_fixture)
+    else:
+        server = GroqStubServer(state_from_args(args), host=args.host, port=args.port, verbose=args.verbose)
+        base_url = server.start()
+        os.environ["GROQ_API_BASE_URL"] = base_url
+        os.environ["NOTION_API_BASE_URL"] = base_url
+        target = f"스텁 서버 {base_url}"
+        if not args.live_search:
+            _install_search_fixture(args.search_fixture)
+
+    os.environ.setdefault("GROQ_API_KEY", "stub-key")
+    os.environ.setdefault("NOTION_API_KEY", "stub-notion-key")
+    os.environ.setdefault("NOTION_PARENT_PAGE_ID", "stub-parent-page")
+    if not args.use_llm_cache:
+        os.environ["LLM_CACHE_ENABLED"] = "false"
+
+    print(f"🧪 오프라인 벤치마크 ({args.mode}, {args.runs}회) - {target}")
+
+    try:
+        timings = run_chain(args) if args.mode == "chain" else run_auto_poster(args)
+    finally:
+        if server:
+            server.stop()
+
+    wall_times = [wall for wall, _ in timings]
+    cpu_times = [cpu for _, cpu in timings]
+    print("\n" + "=" * 60)
+    print(f"📊 벤치마크 결과 ({args.mode})")
+    print(f"   실행 {len(timings)}회: 평균 {statistics.mean(wall_times):.2f}초, "
+          f"p50 {_percentile(wall_times, 0.5):.2f}초, p95 {_percentile(wall_times, 0.95):.2f}초, "
+          f"CPU 평균 {statistics.mean(cpu_times):.2f}초")
+    if server:
+        stats = server.state.snapshot()
+        print(f"   스텁 요청 {stats['requests']}회 (429 {stats['rate_limited']}회), Notion 페이지 {stats['notion_pages']}개")
+    else:
+        from src.services.cassette import get_cassette
+        stats = get_cassette().stats
+        print(f"   카세트 재생 {stats['replayed']}회 (순서 매칭 {stats['fallback']}회, 없음 {stats['missed']}회), "
+              f"재현한 지연 {stats['replayed_seconds']:.1f}초")
+
+
+if __name__ == '__main__':
+    main()
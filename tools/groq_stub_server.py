@@ -0,0 +1,766 @@
+#!/usr/bin/env python3
+"""
+Groq 호환 로컬 스텁 서버 (오프라인 벤치마크 / Rate Limit 재현용)
+
+- POST /openai/v1/chat/completions: Groq Chat Completions 응답 흉내 (stream 포함)
+- 지연 시간, 429 주입(주기/확률/구간), 키별 RPM/TPM 한도, 토큰 수 설정 가능
+- 응답은 고정 규칙 파일(--replies) 또는 실제 Groq에서 녹화한 응답(--recorded) 사용
+- 최소한의 Notion API(/v1/pages, /v1/pages/{id} 보관, /v1/blocks/{id}/children)도 제공 (--notion-rps로 Integration별 초당 한도 재현)
+
+사용 예:
+    python tools/groq_stub_server.py --port 8765 --latency 0.5 --storm 5:10 --retry-after 2
+    GROQ_API_BASE_URL=http://127.0.0.1:8765 NOTION_API_BASE_URL=http://127.0.0.1:8765 python scripts/auto_poster.py
+
+녹화:
+    python tools/groq_stub_server.py --record-upstream https://api.groq.com --recorded data/groq_recorded.jsonl
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import hashlib
+import argparse
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+
+CHAT_COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+_HANGUL_PATTERN = re.compile(r'[가-힣]')
+_NOTION_CHILDREN_PATTERN = re.compile(r'^/v1/blocks/([^/]+)/children')
+_NOTION_PAGE_PATTERN = re.compile(r'^/v1/pages/([^/?]+)$')
+
+
+def _default_reply(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    """
+    규칙에 맞는 응답이 없을 때 사용하는 기본 JSON 응답
+
+    에이전트들이 읽는 필드(검증/사실 확인/콘텐츠 생성/수정)를 모두 포함해서
+    어느 에이전트가 호출해도 체인이 끝까지 진행되도록 합니다.
+    """
+    prompt = "\n".join(message.get("content", "") for message in messages)
+    # 한글 콘텐츠는 영문 → 한글 번역 단계에서 만들어지므로 번역 요청이면 한글로 응답
+    korean = "번역" in prompt or (bool(_HANGUL_PATTERN.search(prompt)) and "English" not in prompt)
+
+    if korean:
+        title = "오프라인 벤치마크용 학습 기록"
+        content = (
+            "## 서론\n\n"
+            "로컬 스텁 서버가 돌려준 본문입니다.\n\n"
+            "실제 Groq 응답과 같은 형식으로 체인의 모든 단계를 통과합니다.\n\n"
+            "## 응답 형식\n\n"
+            "응답은 **JSON 객체**로 반환됩니다.\n\n"
+            "## 지연 시간\n\n"
+            "지연 시간은 설정으로 조절합니다.\n\n"
+            "## 요청 한도\n\n"
+            "- 주기적인 429 응답\n"
+            "- 키별 분당 한도\n\n"
+            "## 결론\n\n"
+            "스텁 서버로 네트워크 없이 전체 흐름을 측정할 수 있습니다.\n\n"
+            "다음 학습에서는 더 깊은 내용을 다룹니다."
+        )
+        summary = "스텁 서버 응답 요약"
+        keywords = ["벤치마크", "스텁"]
+    else:
+        title = "Offline Benchmark Learning Notes"
+        content = (
+            "## Introduction\n\n"
+            "This body was returned by the local stub server.\n\n"
+            "It has the same shape as a real Groq reply so every step of the chain can complete.\n\n"
+            "## Reply Format\n\n"
+            "Replies are **JSON objects**.\n\n"
+            "## Latency\n\n"
+            "Latency is configurable.\n\n"
+            "## Rate Limits\n\n"
+            "- Periodic 429 responses\n"
+            "- Per-key minute limits\n\n"
+            "## Conclusion\n\n"
+            "The stub server makes it possible to measure the whole flow without network access.\n\n"
+            "The next session goes deeper into the topic."
+        )
+        summary = "Stub server reply summary"
+        keywords = ["benchmark", "stub"]
+
+    return {
+        "title": title,
+        "content": content,
+        "summary": summary,
+        "keywords": keywords,
+        "category": "IT/컴퓨터",
+        "is_valid": True,
+        "quality_score": 85,
+        "accuracy_score": 90,
+        # 콘텐츠 검증은 publish, 검색 검증/사실 확인은 proceed를 기대
+        "recommendation": "publish" if "publish/" in prompt else "proceed",
+        "reason": "stub",
+        "issues": [],
+        "revisions": [],
+        "revised_content": content,
+        "mechanical_patterns": [],
+        "readability_issues": [],
+        "improvement_suggestions": [],
+    }
+
+
+def request_fingerprint(payload: Dict[str, Any]) -> str:
+    """녹화/재생 매칭용 요청 지문 (모델 + 메시지 + 응답 형식)"""
+    key_data = json.dumps({
+        "model": payload.get("model"),
+        "messages": payload.get("messages"),
+        "response_format": payload.get("response_format"),
+    }, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 추정 (문자 4개 ≈ 토큰 1개, 한글은 문자 2개 ≈ 토큰 1개)"""
+    hangul = len(_HANGUL_PATTERN.findall(text))
+    return max(1, (len(text) - hangul) // 4 + hangul // 2)
+
+
+class _MinuteWindow:
+    """키 하나의 분당 요청/토큰 사용량 (Groq x-ratelimit-* 헤더 흉내)"""
+
+    def __init__(self):
+        self.started_at = time.monotonic()
+        self.requests = 0
+        self.tokens = 0
+
+    def roll(self, now: float):
+        if now - self.started_at >= 60.0:
+            self.started_at = now
+            self.requests = 0
+            self.tokens = 0
+
+    def reset_in(self, now: float) -> float:
+        return max(0.0, 60.0 - (now - self.started_at))
+
+
+class StubState:
+    """
+    스텁 서버 설정과 상태
+
+    Args:
+        latency: 응답 기본 지연 시간 (초)
+        latency_per_token: 생성 토큰당 추가 지연 시간 (초)
+        jitter: 지연 시간 흔들림 비율 (0.2면 ±20%)
+        fail_every: N번째 요청마다 429 반환 (0이면 사용 안 함)
+        fail_rate: 요청을 429로 실패시킬 확률
+        storms: 429를 반환할 요청 번호 구간 [(시작, 개수)] (1부터 셈)
+        retry_after: 429 응답의 retry-after 값 (초)
+        rpm / tpm: 키별 분당 요청/토큰 한도 (0이면 무제한)
+        notion_rps: Notion API 키별 초당 요청 한도 (넘으면 429 + retry-after, 0이면 무제한)
+        prompt_tokens / completion_tokens: 고정 토큰 수 (None이면 추정)
+        replies_path: 고정 응답 규칙 파일 (JSON)
+        recorded_path: 녹화된 응답 파일 (JSONL)
+        record_upstream: 지정하면 녹화에 없는 요청을 이 서버로 전달하고 결과를 녹화
+        stream_chunk_chars: 스트리밍 청크당 문자 수
+        seed: 난수 시드 (같은 시드면 같은 순서로 429/지연 발생)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        latency_per_token: float = 0.0,
+        jitter: float = 0.0,
+        fail_every: int = 0,
+        fail_rate: float = 0.0,
+        storms: Optional[List[Tuple[int, int]]] = None,
+        retry_after: float = 1.0,
+        rpm: int = 0,
+        tpm: int = 0,
+        notion_rps: float = 0.0,
+        prompt_tokens: Optional[int] = None,
+        completion_tokens: Optional[int] = None,
+        replies_path: Optional[str] = None,
+        recorded_path: Optional[str] = None,
+        record_upstream: Optional[str] = None,
+        stream_chunk_chars: int = 24,
+        seed: int = 0
+    ):
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self.jitter = jitter
+        self.fail_every = fail_every
+        self.fail_rate = fail_rate
+        self.storms = storms or []
+        self.retry_after = retry_after
+        self.rpm = rpm
+        self.tpm = tpm
+        self.notion_rps = notion_rps
+        self.prompt_tokens = prompt_tokens
+        self.completion_tokens = completion_tokens
+        self.record_upstream = record_upstream.rstrip("/") if record_upstream else None
+        self.recorded_path = recorded_path
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+
+        self.rules: List[Dict[str, Any]] = []
+        self.default_reply = None
+        if replies_path:
+            with open(replies_path, "r", encoding="utf-8") as f:
+                replies = json.load(f)
+            self.rules = replies.get("rules", [])
+            self.default_reply = replies.get("default")
+
+        self.recorded: Dict[str, Dict[str, Any]] = {}
+        if recorded_path and Path(recorded_path).exists():
+            with open(recorded_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.recorded[entry["fingerprint"]] = entry["response"]
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._windows: Dict[str, _MinuteWindow] = {}
+        self.request_count = 0
+        self.rate_limited_count = 0
+        self.stats_by_key: Dict[str, Dict[str, int]] = {}
+
+        # Notion 스텁 상태 (페이지 id → {"parent", "title", "children"})
+        self.notion_pages: Dict[str, Dict[str, Any]] = {}
+        self._notion_recent: Dict[str, List[float]] = {}
+        self.notion_request_count = 0
+        self.notion_rate_limited_count = 0
+
+    # ---------------------------------------------------------------
+    # Chat Completions
+    # ---------------------------------------------------------------
+
+    def pick_reply(self, payload: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        응답 선택: 녹화 → 규칙 → 기본 응답 순
+
+        Returns:
+            (녹화된 전체 응답 또는 None, 응답 본문 문자열)
+        """
+        recorded = self.recorded.get(request_fingerprint(payload))
+        if recorded is not None:
+            return recorded, recorded["choices"][0]["message"]["content"]
+
+        messages = payload.get("messages", [])
+        prompt = "\n".join(message.get("content", "") for message in messages)
+        for rule in self.rules:
+            if rule.get("match", "") in prompt:
+                reply = rule.get("reply", "")
+                return None, reply if isinstance(reply, str) else json.dumps(reply, ensure_ascii=False)
+
+        reply = self.default_reply if self.default_reply is not None else _default_reply(messages)
+        return None, reply if isinstance(reply, str) else json.dumps(reply, ensure_ascii=False)
+
+    def record(self, payload: Dict[str, Any], response: Dict[str, Any]):
+        """실제 서버 응답 녹화 (JSONL에 추가)"""
+        fingerprint = request_fingerprint(payload)
+        with self._lock:
+            self.recorded[fingerprint] = response
+            if self.recorded_path:
+                Path(self.recorded_path).parent.mkdir(parents=True, exist_ok=True)
+                with open(self.recorded_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"fingerprint": fingerprint, "response": response}, ensure_ascii=False) + "\n")
+
+    def admit(self, api_key: str, prompt_tokens: int) -> Tuple[int, bool, Dict[str, str]]:
+        """
+        요청 번호 부여 + 429 여부 결정 + x-ratelimit-* 헤더 생성
+
+        Returns:
+            (요청 번호, 429 여부, 응답 헤더)
+        """
+        with self._lock:
+            self.request_count += 1
+            number = self.request_count
+            now = time.monotonic()
+
+            window = self._windows.setdefault(api_key, _MinuteWindow())
+            window.roll(now)
+
+            limited = False
+            if self.fail_every and number % self.fail_every == 0:
+                limited = True
+            if any(start <= number < start + count for start, count in self.storms):
+                limited = True
+            if self.fail_rate and self._random.random() < self.fail_rate:
+                limited = True
+            if self.rpm and window.requests + 1 > self.rpm:
+                limited = True
+            if self.tpm and window.tokens + prompt_tokens > self.tpm:
+                limited = True
+
+            if not limited:
+                window.requests += 1
+                window.tokens += prompt_tokens
+
+            key_stats = self.stats_by_key.setdefault(api_key[-6:], {"requests": 0, "rate_limited": 0})
+            key_stats["requests"] += 1
+            if limited:
+                key_stats["rate_limited"] += 1
+                self.rate_limited_count += 1
+
+            reset_in = window.reset_in(now)
+            headers = {
+                "x-ratelimit-limit-requests": str(self.rpm or 14400),
+                "x-ratelimit-remaining-requests": str(max(0, (self.rpm or 14400) - window.requests)),
+                "x-ratelimit-reset-requests": f"{reset_in:.2f}s",
+                "x-ratelimit-limit-tokens": str(self.tpm or 1000000),
+                "x-ratelimit-remaining-tokens": str(max(0, (self.tpm or 1000000) - window.tokens)),
+                "x-ratelimit-reset-tokens": f"{reset_in:.2f}s",
+            }
+            if limited:
+                headers["retry-after"] = f"{self.retry_after:g}"
+
+            return number, limited, headers
+
+    def admit_notion(self, api_key: str) -> Optional[float]:
+        """
+        Notion 요청 한도 확인 (최근 1초 안의 요청 수 기준)
+
+        Returns:
+            429로 거절하면 retry-after (초), 통과하면 None
+        """
+        with self._lock:
+            self.notion_request_count += 1
+            if not self.notion_rps:
+                return None
+            now = time.monotonic()
+            recent = [t for t in self._notion_recent.get(api_key, []) if now - t < 1.0]
+            if len(recent) >= self.notion_rps:
+                self._notion_recent[api_key] = recent
+                self.notion_rate_limited_count += 1
+                return max(0.01, 1.0 - (now - recent[0]))
+            recent.append(now)
+            self._notion_recent[api_key] = recent
+            return None
+
+    def delay_for(self, completion_tokens: int) -> float:
+        """응답 지연 시간 (지터 포함)"""
+        delay = self.latency + self.latency_per_token * completion_tokens
+        if self.jitter and delay > 0:
+            with self._lock:
+                delay *= 1 + self._random.uniform(-self.jitter, self.jitter)
+        return max(0.0, delay)
+
+    def usage_for(self, payload: Dict[str, Any], content: str) -> Dict[str, int]:
+        prompt = "\n".join(message.get("content", "") for message in payload.get("messages", []))
+        prompt_tokens = self.prompt_tokens if self.prompt_tokens is not None else estimate_tokens(prompt)
+        completion_tokens = self.completion_tokens if self.completion_tokens is not None else estimate_tokens(content)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.request_count,
+                "rate_limited": self.rate_limited_count,
+                "by_key": {key: dict(stats) for key, stats in self.stats_by_key.items()},
+                "notion_pages": len(self.notion_pages),
+                "notion_requests": self.notion_request_count,
+                "notion_rate_limited": self.notion_rate_limited_count,
+            }
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """스텁 서버 요청 처리"""
+
+    server_version = "GroqStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> StubState:
+        return self.server.stub_state
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            sys.stderr.write("  [stub] " + (format % args) + "\n")
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body.decode("utf-8")) if body else {}
+
+    def _send_json(self, status: int, data: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.startswith("/stub/stats"):
+            self._send_json(200, self.state.snapshot())
+            return
+
+        match = _NOTION_CHILDREN_PATTERN.match(self.path)
+        if match:
+            if self._notion_admitted():
+                self._send_json(200, self._notion_list_children(match.group(1)))
+            return
+
+        self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_POST(self):
+        try:
+            payload = self._read_json()
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON"}})
+            return
+
+        if self.path.startswith(CHAT_COMPLETIONS_PATH):
+            self._chat_completions(payload)
+        elif self.path.startswith("/v1/pages"):
+            if self._notion_admitted():
+                self._notion_create_page(payload)
+        elif self.path.startswith("/v1/search"):
+            if self._notion_admitted():
+                self._send_json(200, {"object": "list", "results": [], "has_more": False, "next_cursor": None})
+        else:
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    def do_PATCH(self):
+        try:
+            payload = self._read_json()
+        except ValueError:
+            self._send_json(400, {"error": {"message": "invalid JSON"}})
+            return
+
+        match = _NOTION_CHILDREN_PATTERN.match(self.path)
+        page_match = _NOTION_PAGE_PATTERN.match(self.path)
+        if match:
+            if self._notion_admitted():
+                self._notion_append_children(match.group(1), payload)
+        elif page_match:
+            if self._notion_admitted():
+                self._notion_update_page(page_match.group(1), payload)
+        else:
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+
+    # ---------------------------------------------------------------
+    # Groq
+    # ---------------------------------------------------------------
+
+    def _chat_completions(self, payload: Dict[str, Any]):
+        state = self.state
+        api_key = (self.headers.get("Authorization") or "").replace("Bearer ", "")
+
+        recorded, content = state.pick_reply(payload)
+        if recorded is None and state.record_upstream:
+            recorded = self._forward_upstream(payload)
+            if recorded is None:
+                return
+            content = recorded["choices"][0]["message"]["content"]
+
+        usage = recorded.get("usage") if recorded and recorded.get("usage") else state.usage_for(payload, content)
+        number, limited, headers = state.admit(api_key, usage["prompt_tokens"])
+
+        if limited:
+            self._send_json(429, {
+                "error": {
+                    "message": f"Rate limit reached for model `{payload.get('model')}` (stub request #{number}). "
+                               f"Please try again in {state.retry_after:g}s.",
+                    "type": "tokens",
+                    "code": "rate_limit_exceeded",
+                }
+            }, headers)
+            return
+
+        delay = state.delay_for(usage["completion_tokens"])
+        completion_id = f"chatcmpl-stub-{number}"
+        created = int(time.time())
+
+        if payload.get("stream"):
+            self._stream_reply(completion_id, created, payload.get("model"), content, usage, delay, headers)
+            return
+
+        if delay:
+            time.sleep(delay)
+
+        response = recorded or {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": created,
+            "model": payload.get("model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        }
+        self._send_json(200, response, headers)
+
+    def _stream_reply(self, completion_id: str, created: int, model: str, content: str,
+                      usage: Dict[str, int], delay: float, headers: Dict[str, str]):
+        """SSE 스트리밍 응답 (마지막 청크에 x_groq.usage 포함)"""
+        state = self.state
+        pieces = [content[i:i + state.stream_chunk_chars] for i in range(0, len(content), state.stream_chunk_chars)] or [""]
+        piece_delay = delay / (len(pieces) + 1)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.close_connection = True
+
+        def send_event(data: str):
+            self.wfile.write(f"data: {data}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        base = {"id": completion_id, "object": "chat.completion.chunk", "created": created, "model": model}
+        time.sleep(piece_delay)
+        send_event(json.dumps({**base, "choices": [{"index": 0, "delta": {"role": "assistant", "content": ""}}]}))
+        for piece in pieces:
+            time.sleep(piece_delay)
+            send_event(json.dumps({**base, "choices": [{"index": 0, "delta": {"content": piece}}]}, ensure_ascii=False))
+        send_event(json.dumps({
+            **base,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "x_groq": {"id": completion_id, "usage": usage},
+        }))
+        send_event("[DONE]")
+
+    def _forward_upstream(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """녹화 모드: 실제 서버에 요청하고 응답 녹화 (스트리밍 요청도 일반 요청으로 받아 녹화)"""
+        import requests
+
+        upstream_payload = dict(payload)
+        upstream_payload.pop("stream", None)
+        response = requests.post(
+            self.state.record_upstream + CHAT_COMPLETIONS_PATH,
+            headers={"Authorization": self.headers.get("Authorization", ""), "Content-Type": "application/json"},
+            json=upstream_payload,
+            timeout=120
+        )
+        if not response.ok:
+            passthrough = {k: v for k, v in response.headers.items() if k.lower().startswith(("x-ratelimit", "retry-after"))}
+            self._send_json(response.status_code, response.json() if response.content else {}, passthrough)
+            return None
+
+        data = response.json()
+        self.state.record(payload, data)
+        return data
+
+    # ---------------------------------------------------------------
+    # Notion (페이지 생성 / 자식 블록 추가·조회만)
+    # ---------------------------------------------------------------
+
+    def _notion_admitted(self) -> bool:
+        """Notion 요청 한도 확인 (넘으면 Notion과 같은 형식의 429 응답을 보내고 False)"""
+        api_key = (self.headers.get("Authorization") or "").replace("Bearer ", "")
+        retry_after = self.state.admit_notion(api_key)
+        if retry_after is None:
+            return True
+        self._send_json(429, {"object": "error", "status": 429, "code": "rate_limited",
+                              "message": "You have been rate limited. Please try again in a few minutes."},
+                        headers={"Retry-After": f"{retry_after:.2f}"})
+        return False
+
+    def _notion_create_page(self, payload: Dict[str, Any]):
+        state = self.state
+        if len(payload.get("children", [])) > 100:
+            self._send_json(400, {"object": "error", "status": 400, "code": "validation_error",
+                                  "message": "body.children.length should be ≤ `100`"})
+            return
+        parent = payload.get("parent", {})
+        parent_id = parent.get("page_id") or parent.get("database_id")
+        title_parts = payload.get("properties", {}).get("title", {}).get("title", [])
+        title = "".join(part.get("text", {}).get("content", "") for part in title_parts)
+
+        delay = state.delay_for(0)
+        if delay:
+            time.sleep(delay)
+
+        page_id = str(uuid.uuid4())
+        created_time = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+        with state._lock:
+            state.notion_pages[page_id] = {
+                "parent": parent_id,
+                "title": title,
+                "children": list(payload.get("children", [])),
+                "created_time": created_time,
+                "archived": False,
+            }
+
+        self._send_json(200, {
+            "object": "page",
+            "id": page_id,
+            "parent": parent,
+            "url": f"https://www.notion.so/stub-{page_id.replace('-', '')}",
+            "created_time": created_time,
+            "archived": False,
+            "properties": payload.get("properties", {}),
+        })
+
+    def _notion_update_page(self, page_id: str, payload: Dict[str, Any]):
+        """페이지 보관 처리만 지원 (archived)"""
+        state = self.state
+        with state._lock:
+            page = state.notion_pages.get(page_id)
+            if page is None:
+                self._send_json(404, {"object": "error", "status": 404, "code": "object_not_found",
+                                      "message": f"Could not find page with ID: {page_id}."})
+                return
+            if "archived" in payload:
+                page["archived"] = bool(payload["archived"])
+            archived = page["archived"]
+
+        self._send_json(200, {"object": "page", "id": page_id, "archived": archived})
+
+    def _notion_append_children(self, block_id: str, payload: Dict[str, Any]):
+        state = self.state
+        children = payload.get("children", [])
+        if len(children) > 100:
+            self._send_json(400, {"object": "error", "status": 400, "code": "validation_error",
+                                  "message": "body.children.length should be ≤ `100`"})
+            return
+
+        with state._lock:
+            page = state.notion_pages.get(block_id)
+            if page is None:
+                self._send_json(404, {"object": "error", "status": 404, "code": "object_not_found",
+                                      "message": f"Could not find block with ID: {block_id}."})
+                return
+            page["children"].extend(children)
+
+        self._send_json(200, {"object": "list", "results": children, "has_more": False, "next_cursor": None})
+
+    def _notion_list_children(self, block_id: str) -> Dict[str, Any]:
+        """페이지면 본문 블록, 부모 아래 생성된 페이지는 child_page 블록으로 반환"""
+        state = self.state
+        with state._lock:
+            page = state.notion_pages.get(block_id)
+            results = list(page["children"]) if page else []
+            results += [
+                {"object": "block", "id": page_id, "type": "child_page", "child_page": {"title": page["title"]},
+                 "created_time": page["created_time"], "archived": page["archived"]}
+                for page_id, page in state.notion_pages.items()
+                if page["parent"] == block_id
+            ]
+        return {"object": "list", "results": results, "has_more": False, "next_cursor": None}
+
+
+class GroqStubServer:
+    """
+    스텁 서버 실행기 (벤치마크 코드에서 백그라운드 스레드로 실행)
+
+    사용 예:
+        server = GroqStubServer(StubState(latency=0.2, storms=[(3, 5)]))
+        base_url = server.start()
+        os.environ["GROQ_API_BASE_URL"] = base_url
+        ...
+        server.stop()
+    """
+
+    def __init__(self, state: Optional[StubState] = None, host: str = "127.0.0.1", port: int = 0, verbose: bool = False):
+        self.state = state or StubState()
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.stub_state = self.state
+        self.httpd.verbose = verbose
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+
+def _parse_storms(values: List[str]) -> List[Tuple[int, int]]:
+    """'시작:개수' 목록 파싱 (예: 5:10 → 5번째 요청부터 10개 429)"""
+    storms = []
+    for value in values or []:
+        start, _, count = value.partition(":")
+        storms.append((int(start), int(count or 1)))
+    return storms
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Groq 호환 로컬 스텁 서버")
+    parser.add_argument("--host", default=os.getenv("GROQ_STUB_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("GROQ_STUB_PORT", "8765")))
+    parser.add_argument("--latency", type=float, default=0.0, help="기본 응답 지연 (초)")
+    parser.add_argument("--latency-per-token", type=float, default=0.0, help="생성 토큰당 추가 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 흔들림 비율 (0.2 = ±20%%)")
+    parser.add_argument("--fail-every", type=int, default=0, help="N번째 요청마다 429")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="429 확률 (0~1)")
+    parser.add_argument("--storm", action="append", default=[], metavar="START:COUNT",
+                        help="START번째 요청부터 COUNT개 연속 429 (여러 번 지정 가능)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 retry-after (초)")
+    parser.add_argument("--rpm", type=int, default=0, help="키별 분당 요청 한도 (0 = 무제한)")
+    parser.add_argument("--tpm", type=int, default=0, help="키별 분당 토큰 한도 (0 = 무제한)")
+    parser.add_argument("--notion-rps", type=float, default=0.0, help="Notion 키별 초당 요청 한도 (0 = 무제한)")
+    parser.add_argument("--prompt-tokens", type=int, default=None, help="고정 프롬프트 토큰 수")
+    parser.add_argument("--completion-tokens", type=int, default=None, help="고정 생성 토큰 수")
+    parser.add_argument("--replies", default=None, help='응답 규칙 JSON ({"rules": [{"match", "reply"}], "default"})')
+    parser.add_argument("--recorded", default=None, help="녹화된 응답 JSONL (재생/녹화 파일)")
+    parser.add_argument("--record-upstream", default=None, help="녹화 모드: 녹화에 없는 요청을 보낼 실제 서버 URL")
+    parser.add_argument("--stream-chunk-chars", type=int, default=24, help="스트리밍 청크당 문자 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    return parser
+
+
+def state_from_args(args) -> StubState:
+    return StubState(
+        latency=args.latency,
+        latency_per_token=args.latency_per_token,
+        jitter=args.jitter,
+        fail_every=args.fail_every,
+        fail_rate=args.fail_rate,
+        storms=_parse_storms(args.storm),
+        retry_after=args.retry_after,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        notion_rps=args.notion_rps,
+        prompt_tokens=args.prompt_tokens,
+        completion_tokens=args.completion_tokens,
+        replies_path=args.replies,
+        recorded_path=args.recorded,
+        record_upstream=args.record_upstream,
+        stream_chunk_chars=args.stream_chunk_chars,
+        seed=args.seed
+    )
+
+
+def main():
+    args = build_arg_parser().parse_args()
+    server = GroqStubServer(state_from_args(args), host=args.host, port=args.port, verbose=args.verbose)
+
+    print(f"🧪 Groq 스텁 서버 실행 중: {server.base_url}")
+    print(f"   GROQ_API_BASE_URL={server.base_url}")
+    print(f"   NOTION_API_BASE_URL={server.base_url}")
+    print(f"   통계: {server.base_url}/stub/stats")
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 스텁 서버 종료")
+        print(json.dumps(server.state.snapshot(), ensure_ascii=False, indent=2))
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()